@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Time the verification pipeline on synthetic reports of several sizes.
+
+For each size, a seeded set of fragments is written to a temporary
+directory and every stage of ``verify_report.py`` is timed in turn:
+
+  load_fragment           parse + validate every fragment file
+  assemble_report         the whole assembly, from the fragments directory
+  compute_statistics      over the assembled findings
+  classify_priority_gaps  over the assembled findings
+  render_markdown         of the assembled report
+  to_dict+json.dumps      serialisation as verify_report.py writes it
+  load_report             parse the written report back
+
+  python tools/benchmarks/run_benchmarks.py --output bench.json
+  python tools/benchmarks/run_benchmarks.py --sizes 100 10000 --repeat 5 \\
+      --status-mix implemented=80,partial=20 --compare bench.json
+
+Each stage runs ``--repeat`` times; the best and mean wall times are
+written to ``--output`` as JSON together with the run parameters, the git
+revision and the Python version, so results can be compared over time.
+``--compare`` prints the change in best time against an earlier file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+_HERE = Path(__file__).resolve().parent
+# Allow importing verification_schema from the tools directory
+sys.path.insert(0, str(_HERE.parent))
+sys.path.insert(0, str(_HERE))
+
+from synthetic import (  # noqa: E402
+    COVERAGE_MIX,
+    MOSCOW_MIX,
+    STATUS_MIX,
+    FragmentGenerator,
+    parse_mix,
+)
+from verification_schema import (  # noqa: E402
+    assemble_report,
+    classify_priority_gaps,
+    compute_statistics,
+    load_fragment,
+    load_report,
+    render_markdown,
+)
+
+DEFAULT_SIZES = (100, 10_000, 100_000)
+
+
+def _time(func: Callable[[], object], repeat: int) -> list[float]:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_HERE,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def bench_size(gen: FragmentGenerator, count: int, repeat: int) -> list[dict]:
+    """Run every benchmark at one size and return a result record per stage."""
+    with tempfile.TemporaryDirectory() as tmp:
+        fragments_dir = Path(tmp) / "fragments"
+        paths = gen.write_fragments(fragments_dir, count)
+
+        def assemble():
+            return assemble_report(
+                fragments_dir, "bench", "/spec", "/src", date="2026-01-01"
+            )
+
+        report = assemble()
+        findings = report.findings
+        report_path = Path(tmp) / "report.json"
+        report_path.write_text(
+            json.dumps(report.to_dict(), indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+
+        stages: list[tuple[str, Callable[[], object]]] = [
+            ("load_fragment", lambda: [load_fragment(p) for p in paths]),
+            ("assemble_report", assemble),
+            ("compute_statistics", lambda: compute_statistics(findings)),
+            ("classify_priority_gaps", lambda: classify_priority_gaps(findings)),
+            ("render_markdown", lambda: render_markdown(report)),
+            (
+                "to_dict+json.dumps",
+                lambda: json.dumps(report.to_dict(), indent=2, ensure_ascii=False),
+            ),
+            ("load_report", lambda: load_report(report_path)),
+        ]
+        results = []
+        for name, func in stages:
+            runs = _time(func, repeat)
+            results.append(
+                {
+                    "benchmark": name,
+                    "findings": count,
+                    "best_s": round(min(runs), 6),
+                    "mean_s": round(statistics.fmean(runs), 6),
+                    "runs_s": [round(r, 6) for r in runs],
+                    "best_us_per_finding": round(min(runs) / count * 1e6, 3),
+                }
+            )
+            print(
+                f"{name:<24} {count:>8}  best {min(runs):9.4f}s  "
+                f"mean {statistics.fmean(runs):9.4f}s",
+                flush=True,
+            )
+        return results
+
+
+def run(
+    sizes: list[int],
+    repeat: int,
+    seed: int,
+    status_mix: dict[str, float] | None = None,
+    moscow_mix: dict[str, float] | None = None,
+    coverage_mix: dict[str, float] | None = None,
+) -> dict:
+    """Run the suite and return the JSON-serialisable results document."""
+    gen = FragmentGenerator(seed, status_mix, moscow_mix, coverage_mix)
+    results = []
+    for count in sizes:
+        results.extend(bench_size(gen, count, repeat))
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "sizes": sizes,
+            "status_mix": gen.status_mix,
+            "moscow_mix": gen.moscow_mix,
+            "coverage_mix": gen.coverage_mix,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, previous: dict) -> list[str]:
+    """Return lines comparing best times with an earlier results document."""
+    before = {
+        (r["benchmark"], r["findings"]): r["best_s"] for r in previous["results"]
+    }
+    lines = []
+    for r in current["results"]:
+        old = before.get((r["benchmark"], r["findings"]))
+        if not old:
+            continue
+        new = r["best_s"]
+        # Times are rounded to the microsecond; a faster run reads as 0.0
+        speedup = f"{old / new:.2f}x" if new else "n/a"
+        lines.append(
+            f"{r['benchmark']:<24} {r['findings']:>8}  "
+            f"{old:9.4f}s -> {new:9.4f}s  ({speedup})"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Finding counts to benchmark (default: 100 10000 100000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument(
+        "--status-mix",
+        help=(
+            "Status weights, e.g. implemented=60,partial=40 "
+            f"(keys: {', '.join(STATUS_MIX)})"
+        ),
+    )
+    parser.add_argument(
+        "--moscow-mix", help=f"MoSCoW weights (keys: {', '.join(MOSCOW_MIX)})"
+    )
+    parser.add_argument(
+        "--coverage-mix",
+        help=f"Test coverage weights (keys: {', '.join(COVERAGE_MIX)})",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmark-results.json"),
+        help="Where to write results (default: benchmark-results.json)",
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="Earlier results file to compare against"
+    )
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1 or any(size < 1 for size in args.sizes):
+        parser.error("--repeat and --sizes must be positive")
+    try:
+        mixes = [
+            parse_mix(text, allowed) if text else None
+            for text, allowed in (
+                (args.status_mix, STATUS_MIX),
+                (args.moscow_mix, MOSCOW_MIX),
+                (args.coverage_mix, COVERAGE_MIX),
+            )
+        ]
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    # Read the baseline first: it may be the file about to be overwritten
+    previous = None
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+
+    logging.basicConfig(level=logging.ERROR)
+    document = run(args.sizes, args.repeat, args.seed, *mixes)
+    args.output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+    if previous is not None:
+        for line in compare(document, previous):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Deterministic synthetic fragments and reports for the benchmarks.
+
+The generator draws status, MoSCoW and test coverage from weighted mixes
+and file references from a small pool of paths and descriptions, as real
+reports do. Output depends only on the seed, the mixes and the count, so
+two runs with the same arguments produce byte-identical fragments.
+
+  gen = FragmentGenerator(seed=1, status_mix={"implemented": 3, "partial": 1})
+  gen.write_fragments(tmp_path / "fragments", 10_000)
+  report = gen.report(10_000)
+
+Fragments are internally consistent (no gaps on implemented items, no
+files on unimplemented ones, ...) so they validate without warnings.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Iterator
+
+STATUS_MIX = {"implemented": 55, "partial": 20, "not_implemented": 15, "na": 10}
+MOSCOW_MIX = {"MUST": 50, "SHOULD": 30, "COULD": 15, "WONT": 5}
+COVERAGE_MIX = {"full": 50, "partial": 30, "none": 20}
+
+_PATHS = [f"src/app/module_{i:02d}.py" for i in range(20)]
+_DESCRIPTIONS = [f"Handles concern {i}" for i in range(10)]
+
+
+def parse_mix(text: str, allowed: dict[str, int]) -> dict[str, float]:
+    """Parse ``"implemented=60,partial=40"`` into a weight mapping.
+
+    Keys must be values of ``allowed``; weights must be non-negative and
+    at least one must be positive.
+    """
+    mix: dict[str, float] = {}
+    for part in text.split(","):
+        key, sep, weight = part.partition("=")
+        key = key.strip()
+        if not sep or key not in allowed:
+            raise ValueError(
+                f"invalid mix entry {part!r}; expected one of "
+                f"{', '.join(allowed)} as key=weight"
+            )
+        mix[key] = float(weight)
+        if mix[key] < 0:
+            raise ValueError(f"negative weight for {key!r}")
+    if not any(mix.values()):
+        raise ValueError("mix has no positive weights")
+    return mix
+
+
+def fragment_id_for(index: int) -> str:
+    """Return the ``NN-NN-NN`` fragment ID for the ``index``-th requirement."""
+    return f"{index // 10000 + 1:02d}-{index // 100 % 100:02d}-{index % 100:02d}"
+
+
+class FragmentGenerator:
+    """Seeded generator of fragment dicts and complete report dicts."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        status_mix: dict[str, float] | None = None,
+        moscow_mix: dict[str, float] | None = None,
+        coverage_mix: dict[str, float] | None = None,
+    ) -> None:
+        self.seed = seed
+        self.status_mix = dict(status_mix or STATUS_MIX)
+        self.moscow_mix = dict(moscow_mix or MOSCOW_MIX)
+        self.coverage_mix = dict(coverage_mix or COVERAGE_MIX)
+
+    def _refs(self, rng: random.Random, i: int, count: int, prefix: str) -> list:
+        return [
+            {
+                "path": prefix + _PATHS[(i + k) % len(_PATHS)],
+                "lines": f"{k * 10 + 1}-{k * 10 + 9}",
+                "description": _DESCRIPTIONS[rng.randrange(len(_DESCRIPTIONS))],
+            }
+            for k in range(count)
+        ]
+
+    def _fragment(self, rng: random.Random, i: int, draws: tuple) -> dict:
+        status, moscow, coverage = draws
+        fid = fragment_id_for(i)
+        if status == "na":
+            coverage = "none"
+
+        implemented = status in ("implemented", "partial")
+        files = self._refs(rng, i, rng.randint(1, 3), "") if implemented else []
+        missing_impl = [] if status in ("implemented", "na") else [f"Edge case {i}"]
+        tests = [] if coverage == "none" else self._refs(rng, i, 1, "tests/")
+        missing_tests = (
+            [] if coverage == "full" or status == "na" else [f"Test case {i}"]
+        )
+        return {
+            "schema_version": "1.0.0",
+            "fragment_id": fid,
+            "section_ref": "§" + ".".join(str(int(p)) for p in fid.split("-")),
+            "title": f"Requirement {i + 1}",
+            "requirement_text": f"The system {moscow} satisfy requirement {i + 1}",
+            "moscow": moscow,
+            "status": status,
+            "implementation": {"files": files, "notes": ""},
+            "test_coverage": coverage,
+            "tests": tests,
+            "missing_tests": missing_tests,
+            "missing_implementation": missing_impl,
+            "notes": "",
+        }
+
+    def fragments(self, count: int) -> Iterator[dict]:
+        """Yield ``count`` fragment dicts in fragment ID order."""
+        rng = random.Random(self.seed)
+        mixes = (self.status_mix, self.moscow_mix, self.coverage_mix)
+        choices = [(list(m), list(m.values())) for m in mixes]
+        for i in range(count):
+            draws = tuple(rng.choices(keys, weights)[0] for keys, weights in choices)
+            yield self._fragment(rng, i, draws)
+
+    def write_fragments(
+        self, directory: Path, count: int, markers: bool = True
+    ) -> list[Path]:
+        """Write ``count`` ``<id>.json`` files (and ``.done`` markers)."""
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for data in self.fragments(count):
+            path = directory / f"{data['fragment_id']}.json"
+            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            if markers:
+                path.with_suffix(".done").touch()
+            paths.append(path)
+        return paths
+
+    def report(self, count: int) -> dict:
+        """Return a serialised report dict holding ``count`` findings.
+
+        Statistics and priority gaps are left empty; they are derived data
+        and :func:`load_report` does not need them.
+        """
+        findings = []
+        for i, data in enumerate(self.fragments(count)):
+            data["v_item_id"] = f"V{i + 1}"
+            data["previous_status"] = None
+            data["resolution"] = None
+            findings.append(data)
+        return {
+            "schema_version": "1.0.0",
+            "report_type": "initial",
+            "metadata": {
+                "project_name": "bench",
+                "spec_path": "/spec",
+                "implementation_path": "/src",
+                "date": "2026-01-01",
+                "run": 1,
+                "previous_report": None,
+                "spec_version": "",
+                "mode": "",
+            },
+            "findings": findings,
+            "statistics": {},
+            "priority_gaps": [],
+            "resolution_summary": None,
+        }
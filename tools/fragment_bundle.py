@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""CLI tool to manage append-only NDJSON fragment bundles.
+
+A bundle (``fragments.ndjson``) holds one fragment record per line and can
+replace the one-``.json``-plus-one-``.done``-per-requirement layout for very
+large specs. ``verify_report.py`` reads a bundle found in the fragments
+directory automatically.
+
+  # Append fragments (agents use this instead of writing <id>.json/.done)
+  python fragment_bundle.py append --bundle <dir>/fragments.ndjson 02-01-01.json
+  echo '{...}' | python fragment_bundle.py append --bundle <dir>/fragments.ndjson -
+
+  # Convert a fragments directory into a bundle, and back
+  python fragment_bundle.py pack --fragments-dir <dir> --bundle <bundle>
+  python fragment_bundle.py unpack --bundle <bundle> --fragments-dir <dir>
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Allow importing verification_schema from the same directory
+sys.path.insert(0, str(Path(__file__).parent))
+
+from verification_schema import (  # noqa: E402
+    SchemaError,
+    append_fragment_records,
+    bundle_from_directory,
+    directory_from_bundle,
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Append to, pack, or unpack an NDJSON fragment bundle.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    append = sub.add_parser("append", help="Append fragment records to a bundle")
+    append.add_argument("--bundle", required=True, type=Path, help="Bundle path")
+    append.add_argument(
+        "fragments",
+        nargs="+",
+        help="Fragment JSON files to append ('-' reads one fragment from stdin)",
+    )
+
+    pack = sub.add_parser("pack", help="Convert a fragments directory to a bundle")
+    pack.add_argument("--fragments-dir", required=True, type=Path)
+    pack.add_argument("--bundle", required=True, type=Path)
+
+    unpack = sub.add_parser("unpack", help="Convert a bundle to a fragments directory")
+    unpack.add_argument("--bundle", required=True, type=Path)
+    unpack.add_argument("--fragments-dir", required=True, type=Path)
+    unpack.add_argument(
+        "--no-markers",
+        action="store_true",
+        help="Do not write a .done marker next to each fragment",
+    )
+    return parser
+
+
+def _read_fragment(source: str) -> dict:
+    """Read one fragment object from a file path or ``-`` (stdin)."""
+    if source == "-":
+        text = sys.stdin.read()
+        name = "<stdin>"
+    else:
+        text = Path(source).read_text(encoding="utf-8")
+        name = Path(source).name
+    try:
+        data = json.loads(text)
+    except (json.JSONDecodeError, ValueError) as exc:
+        raise SchemaError(f"{name}: invalid JSON: {exc}") from exc
+    if not isinstance(data, dict):
+        raise SchemaError(f"{name}: expected a JSON object")
+    return data
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the CLI tool.
+
+    Returns exit code: 0 on success, 1 on error.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "append":
+            records = [_read_fragment(src) for src in args.fragments]
+            args.bundle.parent.mkdir(parents=True, exist_ok=True)
+            append_fragment_records(args.bundle, records)
+            print(f"Appended {len(records)} record(s) to {args.bundle}")
+        elif args.command == "pack":
+            if not args.fragments_dir.is_dir():
+                print(
+                    f"Error: fragments directory not found: {args.fragments_dir}",
+                    file=sys.stderr,
+                )
+                return 1
+            count = bundle_from_directory(args.fragments_dir, args.bundle)
+            print(f"Packed {count} fragment(s) into {args.bundle}")
+        else:
+            if not args.bundle.is_file():
+                print(f"Error: bundle not found: {args.bundle}", file=sys.stderr)
+                return 1
+            count = directory_from_bundle(
+                args.bundle, args.fragments_dir, markers=not args.no_markers
+            )
+            print(f"Unpacked {count} fragment(s) into {args.fragments_dir}")
+    except (SchemaError, OSError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Tests for the benchmark suite and its synthetic fragment generator."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import run_benchmarks  # noqa: E402
+from synthetic import STATUS_MIX, FragmentGenerator, parse_mix  # noqa: E402
+from verification_schema import check_fragment_file, load_report  # noqa: E402
+
+
+class TestFragmentGenerator:
+    def test_same_seed_is_deterministic(self):
+        a = list(FragmentGenerator(seed=3).fragments(50))
+        b = list(FragmentGenerator(seed=3).fragments(50))
+        assert a == b
+        assert a != list(FragmentGenerator(seed=4).fragments(50))
+
+    def test_fragments_validate_without_issues(self, tmp_path):
+        paths = FragmentGenerator(seed=1).write_fragments(tmp_path, 200)
+        assert len(paths) == 200
+        assert all(p.with_suffix(".done").exists() for p in paths)
+        for path in paths:
+            assert check_fragment_file(path) == []
+
+    def test_status_mix_is_respected(self):
+        gen = FragmentGenerator(status_mix={"partial": 1})
+        assert {f["status"] for f in gen.fragments(30)} == {"partial"}
+
+    def test_report_loads(self, tmp_path):
+        path = tmp_path / "report.json"
+        path.write_text(json.dumps(FragmentGenerator().report(20)), encoding="utf-8")
+        report = load_report(path)
+        assert [f.v_item_id for f in report.findings][:2] == ["V1", "V2"]
+
+
+class TestParseMix:
+    def test_parses_weights(self):
+        assert parse_mix("implemented=3, partial=1", STATUS_MIX) == {
+            "implemented": 3.0,
+            "partial": 1.0,
+        }
+
+    @pytest.mark.parametrize(
+        "text", ["done=1", "implemented", "implemented=-1", "implemented=0"]
+    )
+    def test_rejects_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_mix(text, STATUS_MIX)
+
+
+class TestRunBenchmarks:
+    def test_writes_results_for_every_stage(self, tmp_path, capsys):
+        output = tmp_path / "bench.json"
+        code = run_benchmarks.main(
+            ["--sizes", "5", "--repeat", "1", "--output", str(output)]
+        )
+        assert code == 0
+        document = json.loads(output.read_text(encoding="utf-8"))
+        assert document["meta"]["sizes"] == [5]
+        assert {r["benchmark"] for r in document["results"]} == {
+            "load_fragment",
+            "assemble_report",
+            "compute_statistics",
+            "classify_priority_gaps",
+            "render_markdown",
+            "to_dict+json.dumps",
+            "load_report",
+        }
+
+    def test_compare_against_previous_run(self, tmp_path, capsys):
+        output = tmp_path / "bench.json"
+        args = ["--sizes", "5", "--repeat", "1", "--output", str(output)]
+        run_benchmarks.main(args)
+        run_benchmarks.main(args + ["--compare", str(output)])
+        assert "x)" in capsys.readouterr().out
+
+    def test_compare_tolerates_zero_rounded_time(self):
+        previous = {"results": [{"benchmark": "b", "findings": 5, "best_s": 0.002}]}
+        current = {"results": [{"benchmark": "b", "findings": 5, "best_s": 0.0}]}
+        [line] = run_benchmarks.compare(current, previous)
+        assert line.endswith("(n/a)")
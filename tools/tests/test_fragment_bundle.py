@@ -0,0 +1,117 @@
+"""Tests for fragment_bundle.py CLI tool."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+TOOL_PATH = Path(__file__).parent.parent / "fragment_bundle.py"
+VERIFY_TOOL_PATH = Path(__file__).parent.parent / "verify_report.py"
+WAIT_TOOL_PATH = Path(__file__).parent.parent / "wait_for_done.py"
+
+
+def _minimal_fragment(
+    fragment_id: str = "02-01-01", section_ref: str = "§2.1.1"
+) -> dict:
+    return {
+        "schema_version": "1.0.0",
+        "fragment_id": fragment_id,
+        "section_ref": section_ref,
+        "title": "Test Requirement",
+        "requirement_text": "The system MUST do something",
+        "moscow": "MUST",
+        "status": "implemented",
+        "implementation": {"files": [], "notes": ""},
+        "test_coverage": "full",
+        "tests": [],
+        "missing_tests": [],
+        "missing_implementation": [],
+    }
+
+
+def _run(
+    tool: Path, *args: str, stdin: str | None = None
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(tool), *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestCLI:
+    """Tests for the fragment_bundle.py CLI interface."""
+
+    def test_append_then_assemble_from_bundle(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        bundle = frags / "fragments.ndjson"
+        first = tmp_path / "02-01-01.json"
+        first.write_text(json.dumps(_minimal_fragment()), encoding="utf-8")
+
+        result = _run(TOOL_PATH, "append", "--bundle", str(bundle), str(first))
+        assert result.returncode == 0, result.stderr
+        result = _run(
+            TOOL_PATH,
+            "append",
+            "--bundle",
+            str(bundle),
+            "-",
+            stdin=json.dumps(_minimal_fragment("02-01-02", "§2.1.2")),
+        )
+        assert result.returncode == 0, result.stderr
+
+        result = _run(WAIT_TOOL_PATH, "--bundle", str(bundle), "--count", "2")
+        assert result.returncode == 0, result.stderr
+
+        output_json = tmp_path / "verify.json"
+        result = _run(
+            VERIFY_TOOL_PATH,
+            "--fragments-dir",
+            str(frags),
+            "--spec-path",
+            "/fake/spec.md",
+            "--impl-path",
+            "/fake/impl",
+            "--project-name",
+            "TestProject",
+            "--output",
+            str(output_json),
+        )
+        assert result.returncode == 0, result.stderr
+        report = json.loads(output_json.read_text(encoding="utf-8"))
+        ids = [f["fragment_id"] for f in report["findings"]]
+        assert ids == ["02-01-01", "02-01-02"]
+
+    def test_pack_and_unpack(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "02-01-01.json").write_text(
+            json.dumps(_minimal_fragment()), encoding="utf-8"
+        )
+        bundle = tmp_path / "fragments.ndjson"
+
+        result = _run(
+            TOOL_PATH, "pack", "--fragments-dir", str(src), "--bundle", str(bundle)
+        )
+        assert result.returncode == 0, result.stderr
+
+        dst = tmp_path / "dst"
+        result = _run(
+            TOOL_PATH, "unpack", "--bundle", str(bundle), "--fragments-dir", str(dst)
+        )
+        assert result.returncode == 0, result.stderr
+        assert json.loads((dst / "02-01-01.json").read_text(encoding="utf-8")) == (
+            _minimal_fragment()
+        )
+        assert (dst / "02-01-01.done").exists()
+
+    def test_append_rejects_invalid_json(self, tmp_path: Path) -> None:
+        result = _run(
+            TOOL_PATH, "append", "--bundle", str(tmp_path / "b.ndjson"), "-", stdin="{"
+        )
+        assert result.returncode == 1
+        assert "invalid JSON" in result.stderr
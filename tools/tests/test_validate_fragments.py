@@ -0,0 +1,207 @@
+"""Tests for validate_fragments.py CLI tool."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from validate_fragments import FragmentLinter
+
+TOOL_PATH = Path(__file__).parent.parent / "validate_fragments.py"
+
+
+def _minimal_fragment(
+    fragment_id: str = "02-01-01", section_ref: str = "§2.1.1"
+) -> dict:
+    return {
+        "schema_version": "1.0.0",
+        "fragment_id": fragment_id,
+        "section_ref": section_ref,
+        "title": "Test Requirement",
+        "requirement_text": "The system MUST do something",
+        "moscow": "MUST",
+        "status": "implemented",
+        "implementation": {"files": [], "notes": ""},
+        "test_coverage": "full",
+        "tests": [],
+        "missing_tests": [],
+        "missing_implementation": [],
+    }
+
+
+def _write(frags: Path, fid: str, data: dict | str) -> None:
+    text = data if isinstance(data, str) else json.dumps(data)
+    (frags / f"{fid}.json").write_text(text, encoding="utf-8")
+    (frags / f"{fid}.done").write_text("done", encoding="utf-8")
+
+
+class TestFragmentLinter:
+    def test_rechecks_rewritten_fragment(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        bad = _minimal_fragment()
+        bad["status"] = "done"
+        _write(frags, "02-01-01", bad)
+        linter = FragmentLinter(frags, tmp_path / "bad.json")
+
+        [(fid, errors)] = linter.scan()
+        assert fid == "02-01-01"
+        assert errors[0].code == "invalid_enum"
+        assert linter.scan() == []  # unchanged, not re-checked
+
+        time.sleep(0.01)
+        _write(frags, "02-01-01", _minimal_fragment())
+        [(fid, errors)] = linter.scan()
+        assert errors == []
+        assert linter.bad == {}
+
+    def test_rechecks_rewrite_with_unchanged_mtime(self, tmp_path: Path) -> None:
+        bad = _minimal_fragment()
+        bad["status"] = "done"
+        _write(tmp_path, "02-01-01", bad)
+        fragment = tmp_path / "02-01-01.json"
+        mtime_ns = fragment.stat().st_mtime_ns
+        linter = FragmentLinter(tmp_path, tmp_path / "bad.json")
+        [(_, errors)] = linter.scan()
+        assert errors
+
+        # Coarse filesystem timestamps: the rewrite lands in the same tick
+        _write(tmp_path, "02-01-01", _minimal_fragment())
+        os.utime(fragment, ns=(mtime_ns, mtime_ns))
+        [(_, errors)] = linter.scan()
+        assert errors == []
+
+    def test_wrong_types_and_unreadable_files_are_reported(
+        self, tmp_path: Path
+    ) -> None:
+        bad = _minimal_fragment()
+        bad["tests"] = 5
+        bad["implementation"] = {"files": "app.py", "notes": ""}
+        _write(tmp_path, "02-01-01", bad)
+        # A directory named like a fragment cannot be read
+        (tmp_path / "02-01-02.json").mkdir()
+        (tmp_path / "02-01-02.done").write_text("done", encoding="utf-8")
+        linter = FragmentLinter(tmp_path, tmp_path / "bad.json")
+
+        issues = dict(linter.scan())
+        assert [(e.code, e.field) for e in issues["02-01-01"]] == [
+            ("wrong_type", "tests"),
+            ("wrong_type", "implementation.files"),
+        ]
+        assert issues["02-01-02"][0].code == "unreadable"
+
+    def test_marker_without_fragment_is_bad(self, tmp_path: Path) -> None:
+        (tmp_path / "02-01-01.done").write_text("done", encoding="utf-8")
+        linter = FragmentLinter(tmp_path, tmp_path / "bad.json")
+        [(_, errors)] = linter.scan()
+        assert errors[0].code == "missing_fragment"
+
+
+class TestCLI:
+    """Tests for the validate_fragments.py CLI interface."""
+
+    def test_one_shot_reports_bad_fragments(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        _write(frags, "02-01-01", _minimal_fragment())
+        _write(frags, "02-01-02", "{not json")
+        # No marker yet: not checked
+        (frags / "02-01-03.json").write_text("{", encoding="utf-8")
+
+        result = subprocess.run(
+            [sys.executable, str(TOOL_PATH), "--fragments-dir", str(frags)],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 1
+        assert "INVALID 02-01-02: invalid JSON" in result.stdout
+        report = json.loads((tmp_path / "bad-fragments.json").read_text())
+        assert report["checked"] == 2
+        assert [b["fragment_id"] for b in report["bad"]] == ["02-01-02"]
+        assert report["bad"][0]["issues"][0]["code"] == "invalid_json"
+
+    def test_watch_validates_as_markers_arrive(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        report_path = tmp_path / "bad.json"
+
+        def writer() -> None:
+            time.sleep(0.3)
+            _write(frags, "02-01-01", _minimal_fragment())
+            bad = _minimal_fragment("02-01-02", "§2.1.2")
+            del bad["title"]
+            _write(frags, "02-01-02", bad)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(TOOL_PATH),
+                "--fragments-dir",
+                str(frags),
+                "--watch",
+                "--count",
+                "2",
+                "--interval",
+                "0.1",
+                "--timeout",
+                "20",
+                "--report",
+                str(report_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        thread.join()
+
+        assert result.returncode == 1
+        assert "INVALID 02-01-02: Missing required field: title" in result.stdout
+        report = json.loads(report_path.read_text())
+        assert report["bad"][0]["issues"][0]["field"] == "title"
+
+    def test_count_requires_watch(self, tmp_path: Path) -> None:
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(TOOL_PATH),
+                "--fragments-dir",
+                str(tmp_path),
+                "--count",
+                "3",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 2
+        assert "--count requires --watch" in result.stderr
+        assert not (tmp_path.parent / "bad-fragments.json").exists()
+
+    def test_watch_times_out_before_count(self, tmp_path: Path) -> None:
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(TOOL_PATH),
+                "--fragments-dir",
+                str(tmp_path),
+                "--watch",
+                "--count",
+                "1",
+                "--interval",
+                "0.05",
+                "--timeout",
+                "0.2",
+                "--backend",
+                "poll",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 1
+        assert "Timeout" in result.stderr
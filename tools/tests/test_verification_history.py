@@ -0,0 +1,158 @@
+"""Tests for verification_history.py."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from verification_history import HISTORY_FILENAME, HistoryStore, main
+from verification_schema import SchemaError, VerificationReport, assemble_report
+
+TOOL_PATH = Path(__file__).parent.parent / "verify_report.py"
+
+
+def _fragment(fragment_id: str, status: str, test_coverage: str = "full") -> dict:
+    return {
+        "schema_version": "1.0.0",
+        "fragment_id": fragment_id,
+        "section_ref": f"§{fragment_id.replace('-', '.')}",
+        "title": f"Requirement {fragment_id}",
+        "requirement_text": "The system MUST do something",
+        "moscow": "MUST",
+        "status": status,
+        "implementation": {"files": [], "notes": ""},
+        "test_coverage": test_coverage,
+        "tests": [],
+        "missing_tests": [],
+        "missing_implementation": [],
+    }
+
+
+def _write_run(
+    spec_dir: Path, date: str, statuses: dict[str, str], previous: Path | None = None
+) -> tuple[Path, VerificationReport]:
+    """Assemble and write one verify-<date>.json report; return (path, report)."""
+    frags = spec_dir / f"fragments-{date}"
+    frags.mkdir(parents=True)
+    for fid, status in statuses.items():
+        (frags / f"{fid}.json").write_text(
+            json.dumps(_fragment(fid, status)), encoding="utf-8"
+        )
+    report = assemble_report(
+        frags, "proj", "/spec", "/src", previous_report_path=previous, date=date
+    )
+    path = spec_dir / f"verify-{date}.json"
+    path.write_text(json.dumps(report.to_dict()), encoding="utf-8")
+    return path, report
+
+
+class TestHistoryStore:
+    def test_latest_and_item_history(self, tmp_path: Path):
+        first, r1 = _write_run(tmp_path, "2026-01-01", {"01-01": "partial"})
+        second, r2 = _write_run(
+            tmp_path,
+            "2026-02-01",
+            {"01-01": "implemented", "01-02": "not_implemented"},
+            previous=first,
+        )
+        with HistoryStore.for_directory(tmp_path) as store:
+            store.record(r1, first)
+            store.record(r2, second)
+
+            latest = store.latest()
+            assert latest.path == str(second)
+            assert latest.run == 2
+            assert [r.date for r in store.runs()] == ["2026-02-01", "2026-01-01"]
+
+            history = store.item_history("V1")
+            assert [(h.date, h.status, h.resolution) for h in history] == [
+                ("2026-02-01", "implemented", "fixed"),
+                ("2026-01-01", "partial", None),
+            ]
+            assert len(store.item_history("V1", limit=1)) == 1
+            assert store.item_history("V99") == []
+
+    def test_re_recording_replaces_rows(self, tmp_path: Path):
+        path, report = _write_run(tmp_path, "2026-01-01", {"01-01": "partial"})
+        with HistoryStore.for_directory(tmp_path) as store:
+            store.record(report, path)
+            store.record(report, path)
+            assert len(store.runs()) == 1
+            assert len(store.item_history("V1")) == 1
+
+    def test_latest_skips_deleted_reports(self, tmp_path: Path):
+        first, r1 = _write_run(tmp_path, "2026-01-01", {"01-01": "partial"})
+        second, r2 = _write_run(tmp_path, "2026-02-01", {"01-01": "partial"})
+        with HistoryStore.for_directory(tmp_path) as store:
+            store.record(r1, first)
+            store.record(r2, second)
+            second.unlink()
+            assert store.latest().path == str(first)
+
+    def test_backfill_records_existing_reports_once(self, tmp_path: Path):
+        _write_run(tmp_path, "2026-01-01", {"01-01": "partial"})
+        _write_run(tmp_path, "2026-02-01", {"01-01": "implemented"})
+        with HistoryStore.for_directory(tmp_path) as store:
+            assert store.backfill(tmp_path) == 2
+            assert store.backfill(tmp_path) == 0
+            assert store.latest().date == "2026-02-01"
+
+    def test_rejects_newer_schema(self, tmp_path: Path):
+        db = tmp_path / HISTORY_FILENAME
+        conn = sqlite3.connect(db)
+        conn.execute("PRAGMA user_version = 99")
+        conn.close()
+        with pytest.raises(SchemaError, match="unsupported history version"):
+            HistoryStore(db)
+
+
+class TestCLI:
+    def test_verify_report_records_history(self, tmp_path: Path):
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        (frags / "01-01.json").write_text(
+            json.dumps(_fragment("01-01", "partial", "partial")), encoding="utf-8"
+        )
+        output = tmp_path / "spec" / "verify-2026-01-01.json"
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(TOOL_PATH),
+                "--fragments-dir",
+                str(frags),
+                "--spec-path",
+                "/spec",
+                "--impl-path",
+                "/src",
+                "--project-name",
+                "proj",
+                "--output",
+                str(output),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert (output.parent / HISTORY_FILENAME).exists()
+        with HistoryStore.for_directory(output.parent) as store:
+            assert store.latest().path == str(output)
+
+    def test_query_commands(self, tmp_path: Path, capsys):
+        _write_run(tmp_path, "2026-01-01", {"01-01": "partial"})
+        assert main(["--dir", str(tmp_path), "latest"]) == 1
+        assert main(["--dir", str(tmp_path), "backfill"]) == 0
+        capsys.readouterr()
+
+        assert main(["--dir", str(tmp_path), "latest"]) == 0
+        assert capsys.readouterr().out.strip().endswith("verify-2026-01-01.json")
+
+        assert main(["--dir", str(tmp_path), "--json", "item", "V1"]) == 0
+        items = json.loads(capsys.readouterr().out)
+        assert items[0]["status"] == "partial"
+
+        assert main(["--dir", str(tmp_path), "item", "V9"]) == 1
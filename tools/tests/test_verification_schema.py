@@ -3,30 +3,58 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
+import verification_schema
 from verification_schema import (
     FileRef,
     Finding,
+    FragmentCache,
+    FragmentValidator,
     Implementation,
+    ItemDelta,
     MoSCoW,
+    ReportIndex,
+    ReportView,
     Resolution,
     SchemaError,
+    StatisticsAccumulator,
     Status,
     TestCoverage,
     _build_file_ref,
+    _decode_fragment,
     assemble_report,
+    assemble_report_streaming,
+    append_fragment_record,
     assign_v_items,
+    build_report,
+    build_report_index,
+    bundle_from_directory,
     classify_priority_gaps,
     compute_statistics,
+    directory_from_bundle,
+    infer_resolution,
+    iter_bundle,
+    load_bundle,
     load_fragment,
+    load_fragments,
     load_report,
+    load_report_lazy,
     map_v_items_from_previous,
+    reconcile_resolution,
     render_markdown,
     validate_fragment,
+    validate_many,
+    write_markdown,
+    write_markdown_pages,
+    write_report_formats,
+    write_report_json,
 )
+from verification_schema import stats
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -168,6 +196,20 @@ class TestBuildFileRef:
         assert ref.path == "src/foo.py"
         assert ref.lines == "10-20"
 
+    def test_repeated_paths_and_descriptions_are_shared(self):
+        first = _build_file_ref(json.loads('{"path": "src/a.py", "description": "d"}'))
+        second = _build_file_ref(json.loads('{"path": "src/a.py", "description": "d"}'))
+        assert first.path is second.path
+        assert first.description is second.description
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses")
+    def test_schema_dataclasses_have_no_instance_dict(self):
+        ref = FileRef(path="a.py")
+        impl = Implementation(files=[ref])
+        finding = _make_finding()
+        for obj in (ref, impl, finding):
+            assert not hasattr(obj, "__dict__")
+
 
 class TestValidateFragmentFileCoercionWarnings:
     """Test that string file refs produce warnings, not errors."""
@@ -324,6 +366,17 @@ class TestValidateFragment:
         errors, warnings = validate_fragment(data, "02-01-01.json")
         assert any("title" in e for e in errors)
 
+    def test_wrong_container_types_are_errors(self):
+        data = _valid_fragment(
+            {"tests": 5, "missing_tests": "none", "implementation": ["app.py"]}
+        )
+        errors, _ = validate_fragment(data, "02-01-01.json")
+        assert errors == [
+            "tests must be a list, got int",
+            "missing_tests must be a list, got str",
+            "implementation must be an object, got list",
+        ]
+
     def test_missing_schema_version(self):
         data = _valid_fragment()
         del data["schema_version"]
@@ -455,6 +508,106 @@ class TestLoadFragment:
             load_fragment(p)
 
 
+class TestValidateMany:
+    def test_returns_structured_records(self):
+        frag = _valid_fragment({"status": "done", "tests": ["t.py"]})
+        del frag["title"]
+        issues = validate_many([("02-01-01.json", frag)])
+
+        errors = [(i.code, i.field) for i in issues if i.severity == "error"]
+        warnings = [(i.code, i.field) for i in issues if i.severity == "warning"]
+        assert errors == [("missing_field", "title"), ("invalid_enum", "status")]
+        assert warnings == [("string_file_ref", "tests[0]")]
+        assert {i.fragment for i in issues} == {"02-01-01"}
+
+    def test_messages_match_validate_fragment(self):
+        frag = _valid_fragment(
+            {"moscow": "MAYBE", "resolution": "nope", "fragment_id": "x"}
+        )
+        errors, warnings = validate_fragment(frag, "02-01-01.json")
+        issues = validate_many([("02-01-01.json", frag)])
+        assert [i.message for i in issues if i.severity == "error"] == errors
+        assert [i.message for i in issues if i.severity == "warning"] == warnings
+
+    def test_many_fragments_grouped_by_code(self):
+        items = [
+            (f"{i:02d}-01.json", _valid_fragment({"fragment_id": f"{i:02d}-01"}))
+            for i in range(50)
+        ]
+        items[7][1]["moscow"] = "MAYBE"
+        items[21][1]["status"] = ["not", "hashable"]
+        issues = validate_many(items)
+        invalid = [i.fragment for i in issues if i.code == "invalid_enum"]
+        assert invalid == ["07-01", "21-01"]
+
+    def test_rejects_tables_naming_unknown_fields(self):
+        with pytest.raises(ValueError, match="unknown fields"):
+            FragmentValidator(required_fields=["schema_version", "nonexistent"])
+
+
+class TestDecodeFragment:
+    """The decoder must report exactly what validate_fragment does."""
+
+    @pytest.mark.parametrize(
+        "overrides, removed",
+        [
+            ({}, []),
+            ({}, ["schema_version", "tests", "status"]),
+            ({"status": "done", "moscow": "MAYBE", "test_coverage": ["x"]}, []),
+            ({"previous_status": "bogus", "resolution": "sorted"}, []),
+            ({"fragment_id": "99-99"}, []),
+            ({"implementation": {"notes": ""}}, []),
+            ({"tests": ["t.py:1", {"path": "u.py"}], "test_coverage": "none"}, []),
+            (
+                {
+                    "status": "not_implemented",
+                    "implementation": {"files": ["a.py"], "notes": ""},
+                    "missing_implementation": [],
+                },
+                [],
+            ),
+            ({"test_coverage": "full", "missing_tests": ["x"]}, []),
+            ({"tests": 5, "implementation": {"files": "a.py", "notes": ""}}, []),
+        ],
+    )
+    def test_matches_validate_fragment(self, overrides: dict, removed: list[str]):
+        frag = _valid_fragment(overrides)
+        for key in removed:
+            del frag[key]
+        errors, warnings = validate_fragment(frag, "02-01-01.json")
+
+        if errors:
+            with pytest.raises(SchemaError) as exc_info:
+                _decode_fragment(frag, "02-01-01.json", "02-01-01.json")
+            assert str(exc_info.value) == (
+                "02-01-01.json: validation errors:\n"
+                + "\n".join(f"  - {e}" for e in errors)
+            )
+        else:
+            finding, decoded_warnings = _decode_fragment(
+                frag, "02-01-01.json", "02-01-01.json"
+            )
+            assert decoded_warnings == warnings
+            assert finding.fragment_id == "02-01-01"
+
+    def test_load_falls_back_to_stdlib_json(self, tmp_path: Path, monkeypatch):
+        class FakeOrjson:
+            class JSONDecodeError(ValueError):
+                pass
+
+            @staticmethod
+            def loads(text):
+                raise FakeOrjson.JSONDecodeError("unsupported")
+
+        monkeypatch.setattr(verification_schema._json, "orjson", FakeOrjson)
+        p = _write_fragment(tmp_path, _valid_fragment())
+        assert load_fragment(p).fragment_id == "02-01-01"
+
+        p.write_text("{not valid json", encoding="utf-8")
+        with pytest.raises(SchemaError, match="invalid JSON: Expecting property name"):
+            load_fragment(p)
+
+
 # ---------------------------------------------------------------------------
 # Helper for statistics / priority gap tests
 # ---------------------------------------------------------------------------
@@ -630,6 +783,107 @@ class TestComputeStatistics:
         # 2/3 = 0.6666... -> 0.667
         assert stats.implementation_rate == 0.667
 
+    def test_breakdown_keys_in_first_seen_order(self):
+        findings = [
+            _make_finding(
+                moscow=MoSCoW.SHOULD,
+                status=Status.PARTIAL,
+                test_coverage=TestCoverage.NONE,
+                fragment_id="01",
+            ),
+            _make_finding(
+                moscow=MoSCoW.MUST,
+                status=Status.IMPLEMENTED,
+                test_coverage=TestCoverage.PARTIAL,
+                fragment_id="02",
+            ),
+            _make_finding(
+                moscow=MoSCoW.SHOULD,
+                status=Status.IMPLEMENTED,
+                test_coverage=TestCoverage.FULL,
+                fragment_id="03",
+            ),
+        ]
+        stats = compute_statistics(findings)
+        assert list(stats.by_status) == ["partial", "implemented"]
+        assert list(stats.by_moscow) == ["SHOULD", "MUST"]
+        assert list(stats.test_coverage) == ["none", "partial", "full"]
+
+    def test_matches_per_finding_reference(self):
+        import random
+
+        rng = random.Random(9)
+        findings = [
+            _make_finding(
+                moscow=rng.choice(list(MoSCoW)),
+                status=rng.choice(list(Status)),
+                test_coverage=rng.choice(list(TestCoverage)),
+                fragment_id=f"{i:04d}",
+            )
+            for i in range(500)
+        ]
+        stats = compute_statistics(findings)
+
+        by_status: dict[str, int] = {}
+        coverage: dict[str, int] = {}
+        by_moscow: dict[str, list[int]] = {}
+        for f in findings:
+            by_status[f.status.value] = by_status.get(f.status.value, 0) + 1
+            cov = f.test_coverage.value
+            coverage[cov] = coverage.get(cov, 0) + 1
+            counts = by_moscow.setdefault(f.moscow.value, [0, 0, 0, 0, 0])
+            counts[0] += 1
+            counts[list(Status).index(f.status) + 1] += 1
+        non_na = [f for f in findings if f.status != Status.NA]
+        impl = {"implemented": 1.0, "partial": 0.5}
+        test = {"full": 1.0, "partial": 0.5}
+
+        assert stats.by_status == by_status
+        assert list(stats.by_status) == list(by_status)
+        assert stats.test_coverage == coverage
+        assert list(stats.test_coverage) == list(coverage)
+        assert list(stats.by_moscow) == list(by_moscow)
+        for key, counts in by_moscow.items():
+            b = stats.by_moscow[key]
+            assert [
+                b.total, b.implemented, b.partial, b.not_implemented, b.na
+            ] == counts
+        assert stats.implementation_rate == round(
+            sum(impl.get(f.status.value, 0.0) for f in non_na) / len(non_na), 3
+        )
+        assert stats.test_rate == round(
+            sum(test.get(f.test_coverage.value, 0.0) for f in non_na) / len(non_na),
+            3,
+        )
+
+    def test_accumulator_add_matches_compute_statistics(self):
+        findings = [
+            _make_finding(status=Status.IMPLEMENTED, fragment_id="01"),
+            _make_finding(
+                moscow=MoSCoW.COULD, status=Status.PARTIAL, fragment_id="02"
+            ),
+            _make_finding(status=Status.NA, fragment_id="03"),
+        ]
+        acc = StatisticsAccumulator()
+        for finding in findings:
+            acc.add(finding)
+        assert len(acc) == 3
+        assert acc.result() == compute_statistics(findings)
+
+    def test_codes_round_trip_for_every_combination(self):
+        codes = set()
+        for moscow in MoSCoW:
+            for status in Status:
+                for coverage in TestCoverage:
+                    code = (
+                        stats._MOSCOW_PART[moscow.value]
+                        + stats._STATUS_PART[status.value]
+                        + stats._COVERAGE_PART[coverage.value]
+                    )
+                    assert stats._split_code(code) == (moscow, status, coverage)
+                    codes.add(code)
+        assert codes == set(range(stats._CODE_COUNT))
+
 
 # ---------------------------------------------------------------------------
 # classify_priority_gaps tests
@@ -873,6 +1127,125 @@ class TestMapVItemsFromPrevious:
         assert by_fid["02-01"] == "V6"
         assert by_fid["03-01"] == "V7"
 
+    def test_accepts_prebuilt_index(self):
+        previous = [
+            _make_finding(fragment_id="01-01", section_ref="§1.1", v_item_id="V4"),
+        ]
+        new = [
+            _make_finding(fragment_id="01-01", section_ref="§1.1"),
+            _make_finding(fragment_id="01-02", section_ref="§1.2"),
+        ]
+        map_v_items_from_previous(new, ReportIndex(previous))
+        assert [f.v_item_id for f in new] == ["V4", "V5"]
+
+
+class TestReportIndex:
+    def test_lookups_by_each_key(self):
+        items = [
+            _make_finding(fragment_id="01-01", section_ref="§1.1", v_item_id="V1"),
+            _make_finding(
+                fragment_id="01-02",
+                section_ref="§1.2",
+                v_item_id="V7",
+                status=Status.PARTIAL,
+            ),
+        ]
+        index = ReportIndex(items)
+        assert len(index) == 2
+        assert index.by_section_ref["§1.2"] is items[1]
+        assert index.by_v_item["V1"] is items[0]
+        assert index.by_fragment_id["01-02"] is items[1]
+        assert index.max_v_number == 7
+        assert index.previous_state("V7") == (Status.PARTIAL, TestCoverage.FULL)
+        assert index.previous_state("V9") == (None, None)
+        assert index.carried_v_item("§9.9") == ""
+
+    def test_last_item_with_v_item_id_wins(self):
+        items = [
+            _make_finding(fragment_id="a", section_ref="§1", v_item_id="V1"),
+            _make_finding(fragment_id="b", section_ref="§1", v_item_id="V2"),
+            _make_finding(fragment_id="c", section_ref="§1", v_item_id=""),
+        ]
+        assert ReportIndex(items).carried_v_item("§1") == "V2"
+
+    def test_accepts_lazy_index_entries(self, tmp_path: Path):
+        findings = [
+            _make_finding(fragment_id="01-01", section_ref="§1.1", v_item_id="V3")
+        ]
+        report = verification_schema.VerificationReport(
+            schema_version="1.0.0",
+            report_type="initial",
+            metadata=verification_schema.ReportMetadata(
+                project_name="p",
+                spec_path="/s",
+                implementation_path="/i",
+                date="2026-01-01",
+                run=1,
+            ),
+            findings=findings,
+            statistics=compute_statistics(findings),
+            priority_gaps=[],
+        )
+        path = tmp_path / "report.json"
+        path.write_text(json.dumps(report.to_dict()), encoding="utf-8")
+        with load_report_lazy(path) as lazy:
+            index = ReportIndex(lazy.findings.entries)
+        assert index.carried_v_item("§1.1") == "V3"
+        assert index.previous_state("V3") == (Status.IMPLEMENTED, TestCoverage.FULL)
+
+
+class TestInferResolution:
+    IMPL, PART, NONE_, NA = (
+        Status.IMPLEMENTED,
+        Status.PARTIAL,
+        Status.NOT_IMPLEMENTED,
+        Status.NA,
+    )
+    FULL, PCOV, NOCOV = TestCoverage.FULL, TestCoverage.PARTIAL, TestCoverage.NONE
+
+    @pytest.mark.parametrize(
+        "previous, current, expected",
+        [
+            ((None, None), (IMPL, FULL), None),
+            ((NA, NOCOV), (IMPL, FULL), None),
+            ((PART, PCOV), (NA, NOCOV), None),
+            ((IMPL, FULL), (IMPL, FULL), None),
+            ((PART, PCOV), (IMPL, FULL), Resolution.FIXED),
+            ((IMPL, PCOV), (IMPL, FULL), Resolution.FIXED),
+            ((IMPL, FULL), (IMPL, PCOV), Resolution.REGRESSED),
+            ((NONE_, NOCOV), (PART, NOCOV), Resolution.PARTIALLY_FIXED),
+            ((PART, NOCOV), (PART, PCOV), Resolution.PARTIALLY_FIXED),
+            ((PART, PCOV), (PART, PCOV), Resolution.NOT_FIXED),
+            ((IMPL, NOCOV), (PART, PCOV), Resolution.NOT_FIXED),
+            ((PART, PCOV), (NONE_, PCOV), Resolution.REGRESSED),
+        ],
+    )
+    def test_transition_table(self, previous, current, expected):
+        assert infer_resolution(*previous, *current) is expected
+
+    def test_reconcile_fills_missing_fields(self):
+        prev = ReportIndex([_make_finding(v_item_id="V1", status=Status.PARTIAL)])
+        finding = _make_finding(v_item_id="V1")
+        assert reconcile_resolution(finding, prev) == []
+        assert finding.previous_status == Status.PARTIAL
+        assert finding.resolution == Resolution.FIXED
+
+    def test_reconcile_keeps_disagreeing_agent_value_with_warning(self):
+        prev = ReportIndex([_make_finding(v_item_id="V1", status=Status.PARTIAL)])
+        finding = _make_finding(v_item_id="V1")
+        finding.resolution = Resolution.PARTIALLY_FIXED
+        warnings = reconcile_resolution(finding, prev)
+        assert finding.resolution == Resolution.PARTIALLY_FIXED
+        assert len(warnings) == 1
+        assert "resolution 'partially_fixed'" in warnings[0]
+        assert "'fixed'" in warnings[0]
+
+    def test_new_item_is_left_alone(self):
+        finding = _make_finding(section_ref="§2", v_item_id="V2")
+        assert reconcile_resolution(finding, ReportIndex([])) == []
+        assert finding.previous_status is None
+        assert finding.resolution is None
+
 
 # ---------------------------------------------------------------------------
 # Helper for assembly tests
@@ -1010,6 +1383,351 @@ class TestAssembleReport:
         assert report.resolution_summary is not None
         assert report.resolution_summary.fixed >= 1
 
+    def test_reverification_records_item_deltas(self, tmp_path: Path):
+        prev_dir = tmp_path / "prev"
+        prev_dir.mkdir()
+        for fid, status in (("01-01", "partial"), ("01-02", "implemented")):
+            frag = _minimal_fragment(fid, status=status, test_coverage="partial")
+            _write_fragment(prev_dir, frag, f"{fid}.json")
+        prev = assemble_report(prev_dir, "p", "/s", "/i", date="2026-02-01")
+        prev_path = tmp_path / "prev.json"
+        prev_path.write_text(json.dumps(prev.to_dict()), encoding="utf-8")
+
+        new_dir = tmp_path / "new"
+        new_dir.mkdir()
+        fixed = _minimal_fragment(
+            "01-01", previous_status="partial", resolution="fixed"
+        )
+        _write_fragment(new_dir, fixed, "01-01.json")
+        _write_fragment(new_dir, _minimal_fragment("01-03"), "01-03.json")
+
+        report = assemble_report(
+            new_dir, "p", "/s", "/i", previous_report_path=prev_path
+        )
+        assert report.deltas == [
+            ItemDelta(
+                "V1", "§01.01", Status.PARTIAL, Status.IMPLEMENTED, Resolution.FIXED
+            ),
+            ItemDelta("V3", "§01.03", None, Status.IMPLEMENTED, None),
+        ]
+        assert report.resolution_summary.previous_total == 2
+        assert report.resolution_summary.new_items == 1
+
+        # Deltas round-trip through the JSON report
+        path = tmp_path / "report.json"
+        path.write_text(json.dumps(report.to_dict()), encoding="utf-8")
+        assert report.to_dict()["deltas"][0]["previous_status"] == "partial"
+        assert load_report(path).deltas == report.deltas
+        with load_report_lazy(path) as lazy:
+            assert lazy.deltas == report.deltas
+
+    def test_reverification_infers_resolution(self, tmp_path: Path, caplog):
+        prev_dir = tmp_path / "prev"
+        prev_dir.mkdir()
+        for fid in ("01-01", "01-02", "01-03"):
+            frag = _minimal_fragment(fid, status="partial", test_coverage="partial")
+            _write_fragment(prev_dir, frag, f"{fid}.json")
+        prev = assemble_report(prev_dir, "p", "/s", "/i", date="2026-02-01")
+        prev_path = tmp_path / "prev.json"
+        prev_path.write_text(json.dumps(prev.to_dict()), encoding="utf-8")
+
+        # Agents only report current state; the last one disagrees
+        new_dir = tmp_path / "new"
+        new_dir.mkdir()
+        for frag in (
+            _minimal_fragment("01-01"),
+            _minimal_fragment("01-02", status="partial", test_coverage="partial"),
+            _minimal_fragment(
+                "01-03",
+                status="partial",
+                test_coverage="partial",
+                resolution="partially_fixed",
+            ),
+        ):
+            _write_fragment(new_dir, frag, f"{frag['fragment_id']}.json")
+
+        with caplog.at_level("WARNING", logger="verification_schema"):
+            report = assemble_report(
+                new_dir, "p", "/s", "/i", previous_report_path=prev_path
+            )
+
+        by_fid = {f.fragment_id: f for f in report.findings}
+        assert by_fid["01-01"].previous_status == Status.PARTIAL
+        assert by_fid["01-01"].resolution == Resolution.FIXED
+        assert by_fid["01-02"].resolution == Resolution.NOT_FIXED
+        assert by_fid["01-03"].resolution == Resolution.PARTIALLY_FIXED
+        assert report.resolution_summary.fixed == 1
+        assert report.resolution_summary.not_fixed == 1
+        assert report.resolution_summary.partially_fixed == 1
+        assert "V3 (01-03): keeping agent-supplied resolution" in caplog.text
+
+    def test_build_report_can_skip_reconciliation_warnings(
+        self, tmp_path: Path, caplog
+    ):
+        _write_fragment(
+            tmp_path, _minimal_fragment("01-01", status="partial"), "01-01.json"
+        )
+        prev = assemble_report(tmp_path, "p", "/s", "/i", date="2026-02-01")
+        prev_path = tmp_path / "prev.json"
+        prev_path.write_text(json.dumps(prev.to_dict()), encoding="utf-8")
+        frag = _minimal_fragment("01-01", status="partial", resolution="fixed")
+        _write_fragment(tmp_path, frag, "01-01.json")
+
+        with caplog.at_level("WARNING", logger="verification_schema"):
+            report = build_report(
+                load_fragments([tmp_path / "01-01.json"]),
+                "p",
+                "/s",
+                "/i",
+                previous_report_path=prev_path,
+                log_warnings=False,
+            )
+        assert report.findings[0].resolution == Resolution.FIXED
+        assert caplog.text == ""
+
+    def test_initial_report_has_no_deltas(self, tmp_path: Path):
+        _write_fragment(tmp_path, _minimal_fragment("01-01"), "01-01.json")
+        report = assemble_report(tmp_path, "p", "/s", "/i")
+        assert report.deltas == []
+        assert report.to_dict()["deltas"] == []
+
+
+# ---------------------------------------------------------------------------
+# TestLoadFragments
+# ---------------------------------------------------------------------------
+
+
+class TestLoadFragments:
+    def _write_many(self, tmp_path: Path, count: int) -> list[Path]:
+        paths = []
+        for i in range(count):
+            frag = _minimal_fragment(f"{i:02d}-01")
+            paths.append(_write_fragment(tmp_path, frag, f"{i:02d}-01.json"))
+        return sorted(paths)
+
+    def test_parallel_matches_serial_order(self, tmp_path: Path):
+        paths = self._write_many(tmp_path, 12)
+        serial = load_fragments(paths, jobs=1)
+        parallel = load_fragments(paths, jobs=3)
+        assert [f.fragment_id for f in parallel] == [f.fragment_id for f in serial]
+        assert parallel == serial
+
+    def test_parallel_aggregates_all_errors(self, tmp_path: Path):
+        paths = self._write_many(tmp_path, 6)
+        paths[1].write_text("{not json", encoding="utf-8")
+        paths[4].write_text('{"invalid": true}', encoding="utf-8")
+
+        with pytest.raises(SchemaError) as serial_exc:
+            load_fragments(paths, jobs=1)
+        with pytest.raises(SchemaError) as parallel_exc:
+            load_fragments(paths, jobs=4)
+
+        message = str(parallel_exc.value)
+        assert message == str(serial_exc.value)
+        assert message.startswith("Fragment validation errors:")
+        assert message.index("01-01.json") < message.index("04-01.json")
+
+    def test_assemble_report_with_jobs(self, tmp_path: Path):
+        self._write_many(tmp_path, 5)
+        report = assemble_report(
+            fragments_dir=tmp_path,
+            project_name="p",
+            spec_path="/s",
+            impl_path="/i",
+            date="2026-02-16",
+            jobs=0,
+        )
+        assert [f.v_item_id for f in report.findings] == ["V1", "V2", "V3", "V4", "V5"]
+
+
+# ---------------------------------------------------------------------------
+# TestFragmentCache
+# ---------------------------------------------------------------------------
+
+
+class TestFragmentCache:
+    def _setup(self, tmp_path: Path, count: int = 3) -> tuple[Path, list[Path]]:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        paths = [
+            _write_fragment(frags, _minimal_fragment(f"0{i}-01"), f"0{i}-01.json")
+            for i in range(1, count + 1)
+        ]
+        return tmp_path / "cache.pickle", paths
+
+    def _count_parses(self, monkeypatch) -> list[Path]:
+        parsed: list[Path] = []
+        original = verification_schema.load._ingest_fragment
+
+        def counting(path):
+            parsed.append(path)
+            return original(path)
+
+        monkeypatch.setattr(verification_schema.load, "_ingest_fragment", counting)
+        return parsed
+
+    def test_second_run_only_parses_changed_fragments(self, tmp_path, monkeypatch):
+        cache_path, paths = self._setup(tmp_path)
+        cache = FragmentCache.load(cache_path)
+        first = load_fragments(paths, cache=cache)
+        cache.save()
+
+        changed = _minimal_fragment("02-01", status="partial", test_coverage="partial")
+        paths[1].write_text(json.dumps(changed), encoding="utf-8")
+
+        parsed = self._count_parses(monkeypatch)
+        cache = FragmentCache.load(cache_path)
+        second = load_fragments(paths, cache=cache)
+
+        assert parsed == [paths[1]]
+        assert second[0] == first[0]
+        assert second[1].status == Status.PARTIAL
+
+    def test_touched_but_identical_file_is_a_hit(self, tmp_path, monkeypatch):
+        cache_path, paths = self._setup(tmp_path, count=1)
+        cache = FragmentCache.load(cache_path)
+        load_fragments(paths, cache=cache)
+        cache.save()
+
+        paths[0].write_bytes(paths[0].read_bytes())
+        parsed = self._count_parses(monkeypatch)
+        load_fragments(paths, cache=FragmentCache.load(cache_path))
+        assert parsed == []
+
+    def test_cached_findings_are_independent_copies(self, tmp_path):
+        cache_path, paths = self._setup(tmp_path, count=1)
+        cache = FragmentCache.load(cache_path)
+        load_fragments(paths, cache=cache)
+        mutated = load_fragments(paths, cache=cache)
+        mutated[0].v_item_id = "V99"
+        assert load_fragments(paths, cache=cache)[0].v_item_id == ""
+
+    def test_warnings_replayed_from_cache(self, tmp_path, caplog):
+        cache_path, paths = self._setup(tmp_path, count=1)
+        frag = _minimal_fragment("01-01", missing_implementation=["gap"])
+        paths[0].write_text(json.dumps(frag), encoding="utf-8")
+        cache = FragmentCache.load(cache_path)
+        load_fragments(paths, cache=cache)
+        caplog.clear()
+        load_fragments(paths, cache=cache)
+        assert "missing_implementation is non-empty" in caplog.text
+
+    def test_evicts_entries_idle_for_too_many_runs(self, tmp_path):
+        cache_path, paths = self._setup(tmp_path, count=2)
+        cache = FragmentCache.load(cache_path, max_idle_runs=2)
+        load_fragments(paths, cache=cache)
+        for _ in range(2):
+            load_fragments(paths[:1], cache=cache)
+        cache.save()
+        assert len(FragmentCache.load(cache_path)) == 1
+
+    def test_evicts_down_to_max_entries(self, tmp_path):
+        cache_path, paths = self._setup(tmp_path, count=3)
+        cache = FragmentCache.load(cache_path, max_entries=2)
+        load_fragments(paths, cache=cache)
+        cache.save()
+        assert len(FragmentCache.load(cache_path)) == 2
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        cache_path, paths = self._setup(tmp_path, count=1)
+        cache_path.write_bytes(b"not a pickle")
+        cache = FragmentCache.load(cache_path)
+        assert len(cache) == 0
+        assert len(load_fragments(paths, cache=cache)) == 1
+
+
+# ---------------------------------------------------------------------------
+# TestFragmentBundle
+# ---------------------------------------------------------------------------
+
+
+class TestFragmentBundle:
+    def test_append_and_stream(self, tmp_path: Path):
+        bundle = tmp_path / "fragments.ndjson"
+        append_fragment_record(bundle, _minimal_fragment("02-01"))
+        append_fragment_record(bundle, _minimal_fragment("01-01"))
+        findings = list(iter_bundle(bundle))
+        assert [f.fragment_id for f in findings] == ["02-01", "01-01"]
+        assert len(bundle.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_load_bundle_keeps_latest_record_sorted(self, tmp_path: Path):
+        bundle = tmp_path / "fragments.ndjson"
+        append_fragment_record(bundle, _minimal_fragment("02-01"))
+        append_fragment_record(bundle, _minimal_fragment("01-01"))
+        updated = _minimal_fragment("02-01", status="partial", test_coverage="partial")
+        append_fragment_record(bundle, updated)
+        findings = load_bundle(bundle)
+        assert [f.fragment_id for f in findings] == ["01-01", "02-01"]
+        assert findings[1].status == Status.PARTIAL
+
+    def test_ignores_incomplete_trailing_line(self, tmp_path: Path):
+        bundle = tmp_path / "fragments.ndjson"
+        append_fragment_record(bundle, _minimal_fragment("01-01"))
+        with bundle.open("a", encoding="utf-8") as fh:
+            fh.write('{"fragment_id": "02-')
+        assert [f.fragment_id for f in load_bundle(bundle)] == ["01-01"]
+
+    def test_errors_reported_with_line_numbers(self, tmp_path: Path):
+        bundle = tmp_path / "fragments.ndjson"
+        append_fragment_record(bundle, _minimal_fragment("01-01"))
+        append_fragment_record(bundle, {"fragment_id": "02-01"})
+        with pytest.raises(SchemaError, match=r"fragments.ndjson:2: validation errors"):
+            load_bundle(bundle)
+
+    def test_round_trip_directory_and_bundle(self, tmp_path: Path):
+        src = tmp_path / "src"
+        src.mkdir()
+        for fid in ("01-01", "02-01"):
+            _write_fragment(src, _minimal_fragment(fid), f"{fid}.json")
+        bundle = tmp_path / "fragments.ndjson"
+        assert bundle_from_directory(src, bundle) == 2
+
+        dst = tmp_path / "dst"
+        assert directory_from_bundle(bundle, dst) == 2
+        assert (dst / "01-01.done").exists()
+        assert load_fragments(sorted(dst.glob("*.json"))) == load_bundle(bundle)
+
+    def test_bundle_from_directory_checks_every_file_first(self, tmp_path: Path):
+        src = tmp_path / "src"
+        src.mkdir()
+        _write_fragment(src, _minimal_fragment("01-01"), "01-01.json")
+        (src / "02-01.json").write_text("{not json", encoding="utf-8")
+        (src / "03-01.json").write_text("[]", encoding="utf-8")
+        bundle = tmp_path / "fragments.ndjson"
+        with pytest.raises(SchemaError) as exc_info:
+            bundle_from_directory(src, bundle)
+        message = str(exc_info.value)
+        assert "02-01.json: invalid JSON" in message
+        assert "03-01.json: expected a JSON object" in message
+        assert not bundle.exists()
+
+        # A retry after fixing the files does not duplicate records
+        _write_fragment(src, _minimal_fragment("02-01"), "02-01.json")
+        (src / "03-01.json").unlink()
+        assert bundle_from_directory(src, bundle) == 2
+        assert len(bundle.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_assemble_report_merges_bundle_and_files(self, tmp_path: Path):
+        bundle = tmp_path / "fragments.ndjson"
+        append_fragment_record(
+            bundle,
+            _minimal_fragment("02-01", status="not_implemented", test_coverage="none"),
+        )
+        append_fragment_record(bundle, _minimal_fragment("03-01"))
+        _write_fragment(tmp_path, _minimal_fragment("01-01"), "01-01.json")
+        _write_fragment(tmp_path, _minimal_fragment("02-01"), "02-01.json")
+
+        report = assemble_report(
+            fragments_dir=tmp_path,
+            project_name="p",
+            spec_path="/s",
+            impl_path="/i",
+            date="2026-02-16",
+        )
+        assert [f.fragment_id for f in report.findings] == ["01-01", "02-01", "03-01"]
+        # The per-file fragment supersedes the bundle record
+        assert report.findings[1].status == Status.IMPLEMENTED
+
 
 # ---------------------------------------------------------------------------
 # TestReportSerialisation
@@ -1064,6 +1782,209 @@ class TestReportSerialisation:
         assert loaded.schema_version == original.schema_version
 
 
+# ---------------------------------------------------------------------------
+# TestLazyReport
+# ---------------------------------------------------------------------------
+
+
+class TestLazyReport:
+    def _write_report(self, tmp_path: Path, indent: int | None = 2) -> Path:
+        frag_dir = tmp_path / "frags"
+        frag_dir.mkdir()
+        frags = [
+            _minimal_fragment("01-01", title="Caf\u00e9 \u2014 \u00fcber"),
+            _minimal_fragment("02-01", status="partial", test_coverage="partial"),
+            _minimal_fragment("03-01", status="not_implemented", test_coverage="none"),
+        ]
+        for frag in frags:
+            _write_fragment(frag_dir, frag, f"{frag['fragment_id']}.json")
+        report = assemble_report(
+            fragments_dir=frag_dir,
+            project_name="lazy",
+            spec_path="/s",
+            impl_path="/i",
+            date="2026-02-16",
+        )
+        path = tmp_path / "verify-2026-02-16.json"
+        path.write_text(
+            json.dumps(report.to_dict(), indent=indent, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        return path
+
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_matches_load_report(self, tmp_path: Path, indent):
+        path = self._write_report(tmp_path, indent)
+        eager = load_report(path)
+        with load_report_lazy(path) as lazy:
+            assert lazy.metadata == eager.metadata
+            assert lazy.statistics == eager.statistics
+            assert lazy.priority_gaps == eager.priority_gaps
+            assert len(lazy.findings) == 3
+            assert lazy.findings[2] == eager.findings[2]
+            assert list(lazy.findings) == eager.findings
+            assert lazy.to_dict() == eager.to_dict()
+
+    def test_findings_decoded_on_demand(self, tmp_path: Path):
+        path = self._write_report(tmp_path)
+        lazy = load_report_lazy(path)
+        assert [e.fragment_id for e in lazy.findings.entries] == [
+            "01-01",
+            "02-01",
+            "03-01",
+        ]
+        assert lazy.findings._built == [None, None, None]
+        assert lazy.findings[0].title == "Caf\u00e9 \u2014 \u00fcber"
+        assert lazy.findings._built[1] is None
+        lazy.close()
+
+    def test_sidecar_index_reused_and_refreshed(self, tmp_path: Path, monkeypatch):
+        path = self._write_report(tmp_path)
+        load_report_lazy(path).close()
+        assert path.with_suffix(".idx").exists()
+
+        scans = []
+        original = verification_schema.lazy._scan_report
+        monkeypatch.setattr(
+            verification_schema.lazy,
+            "_scan_report",
+            lambda text: scans.append(1) or original(text),
+        )
+        load_report_lazy(path).close()
+        assert scans == []
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["metadata"]["run"] = 7
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        lazy = load_report_lazy(path)
+        assert scans == [1]
+        assert lazy.metadata.run == 7
+        assert lazy.findings[1].fragment_id == "02-01"
+        lazy.close()
+
+
+# ---------------------------------------------------------------------------
+# TestStreamingAssembly
+# ---------------------------------------------------------------------------
+
+
+def _report_bytes(report) -> bytes:
+    return (json.dumps(report.to_dict(), indent=2, ensure_ascii=False) + "\n").encode()
+
+
+class TestStreamingAssembly:
+    def _assemble_both(self, frag_dir: Path, output: Path, **kwargs):
+        eager = assemble_report(
+            frag_dir, "proj", "/spec", "/src", date="2026-02-16", **kwargs
+        )
+        lazy = assemble_report_streaming(
+            frag_dir, output, "proj", "/spec", "/src", date="2026-02-16", **kwargs
+        )
+        return eager, lazy
+
+    def test_matches_assemble_report_byte_for_byte(self, tmp_path: Path):
+        frag_dir = tmp_path / "frags"
+        frag_dir.mkdir()
+        # "01-01-01.json" sorts before "01-01.json"; V-items follow fragment_id
+        for fid, status, coverage in [
+            ("01-01", "implemented", "partial"),
+            ("01-01-01", "not_implemented", "none"),
+            ("02-01", "na", "none"),
+        ]:
+            frag = _minimal_fragment(
+                fid, status=status, test_coverage=coverage, title=f"Caf\u00e9 {fid}"
+            )
+            _write_fragment(frag_dir, frag, f"{fid}.json")
+        append_fragment_record(
+            frag_dir / "fragments.ndjson",
+            _minimal_fragment("01-02", status="partial", test_coverage="none"),
+        )
+        output = tmp_path / "out" / "verify.json"
+
+        eager, lazy = self._assemble_both(frag_dir, output)
+        with lazy:
+            assert output.read_bytes() == _report_bytes(eager)
+            assert list(lazy.findings) == eager.findings
+            assert lazy.statistics == eager.statistics
+        sidecar = json.loads(output.with_suffix(".idx").read_text(encoding="utf-8"))
+        assert sidecar == json.loads(json.dumps(build_report_index(output)))
+
+    def test_reverification_matches_assemble_report(self, tmp_path: Path):
+        first = tmp_path / "first"
+        first.mkdir()
+        for fid in ("01-01", "02-01"):
+            frag = _minimal_fragment(fid, status="partial", test_coverage="none")
+            _write_fragment(first, frag, f"{fid}.json")
+        previous_path = tmp_path / "previous.json"
+        assemble_report_streaming(first, previous_path, "proj", "/spec", "/src").close()
+
+        second = tmp_path / "second"
+        second.mkdir()
+        for fid in ("01-01", "02-01", "03-01", "03-01-01", "01-01-01"):
+            _write_fragment(second, _minimal_fragment(fid), f"{fid}.json")
+        eager, lazy = self._assemble_both(
+            second, tmp_path / "verify.json", previous_report_path=previous_path
+        )
+        with lazy:
+            assert lazy.path.read_bytes() == _report_bytes(eager)
+            # Entries are in file name order; new items are numbered by fragment_id
+            assert [e.v_item_id for e in lazy.findings.entries] == [
+                "V3",  # 01-01-01
+                "V1",  # 01-01
+                "V2",  # 02-01
+                "V5",  # 03-01-01
+                "V4",  # 03-01
+            ]
+
+    def test_errors_leave_output_untouched(self, tmp_path: Path):
+        frag_dir = tmp_path / "frags"
+        frag_dir.mkdir()
+        _write_fragment(frag_dir, _minimal_fragment("01-01"), "01-01.json")
+        _write_fragment(frag_dir, {"fragment_id": "02-01"}, "02-01.json")
+        _write_fragment(frag_dir, {"fragment_id": "03-01"}, "03-01.json")
+        output = tmp_path / "verify.json"
+        output.write_text("previous run", encoding="utf-8")
+
+        with pytest.raises(SchemaError) as exc_info:
+            assemble_report_streaming(frag_dir, output, "proj", "/spec", "/src")
+        assert "02-01.json" in str(exc_info.value)
+        assert "03-01.json" in str(exc_info.value)
+        assert output.read_text(encoding="utf-8") == "previous run"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["frags", "verify.json"]
+
+    def test_write_report_json_matches_json_dumps(self, tmp_path: Path):
+        frag_dir = tmp_path / "frags"
+        frag_dir.mkdir()
+        for fid in ("01-01", "02-01"):
+            frag = _minimal_fragment(fid, status="partial", test_coverage="none")
+            _write_fragment(frag_dir, frag, f"{fid}.json")
+        report = assemble_report(frag_dir, "proj", "/spec", "/src")
+        path = tmp_path / "verify.json"
+        with path.open("wb") as fh:
+            write_report_json(report, fh)
+        assert path.read_bytes() == _report_bytes(report)
+
+        report.findings = []
+        report.priority_gaps = []
+        with path.open("wb") as fh:
+            write_report_json(report, fh)
+        assert path.read_bytes() == _report_bytes(report)
+
+    def test_view_of_lazy_report_decodes_on_demand(self, tmp_path: Path):
+        frag_dir = tmp_path / "frags"
+        frag_dir.mkdir()
+        for fid, status in [("01-01", "partial"), ("01-02", "not_implemented")]:
+            frag = _minimal_fragment(fid, status=status, test_coverage="none")
+            _write_fragment(frag_dir, frag, f"{fid}.json")
+        eager, lazy = self._assemble_both(frag_dir, tmp_path / "verify.json")
+        with lazy:
+            view = ReportView(lazy)
+            assert [f.v_item_id for f in view.partial] == ["V1"]
+            assert [f.v_item_id for f in view.findings[1:]] == ["V2"]
+            assert render_markdown(view) == render_markdown(eager)
+            assert lazy.findings._built == [None, None]
+
+
 # ---------------------------------------------------------------------------
 # TestRenderMarkdown
 # ---------------------------------------------------------------------------
@@ -1201,3 +2122,308 @@ class TestRenderMarkdown:
         md = render_markdown(report)
 
         assert "[HIGH]" in md
+
+
+class TestReportView:
+    def test_partitions_in_v_item_order(self, tmp_path: Path):
+        for fid, status, coverage in [
+            ("01-01", "implemented", "partial"),
+            ("01-02", "not_implemented", "none"),
+            ("01-03", "na", "none"),
+            ("01-04", "partial", "full"),
+            ("01-05", "implemented", "full"),
+            ("01-06", "implemented", "none"),
+        ]:
+            frag = _minimal_fragment(fid, status=status, test_coverage=coverage)
+            _write_fragment(tmp_path, frag, f"{fid}.json")
+        report = assemble_report(tmp_path, "proj", "/spec", "/src")
+        report.findings.reverse()
+
+        view = ReportView(report)
+
+        def ids(findings):
+            return [f.v_item_id for f in findings]
+
+        assert ids(view.findings) == ["V1", "V2", "V3", "V4", "V5", "V6"]
+        assert ids(view.untested_implemented) == ["V1", "V6"]
+        assert ids(view.not_implemented) == ["V2"]
+        assert ids(view.partial) == ["V4"]
+        assert (view.non_na, view.implemented, view.tested) == (5, 3, 3)
+        assert not view.is_reverify
+        assert view.reverified == [] and view.unresolved == []
+        assert render_markdown(view) == render_markdown(report)
+
+    def test_reverification_partitions(self, tmp_path: Path):
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        for fid in ("01-01", "01-02", "01-03"):
+            frag = _minimal_fragment(fid, status="partial", test_coverage="none")
+            _write_fragment(first, frag, f"{fid}.json")
+        previous = assemble_report(first, "proj", "/spec", "/src")
+        previous_path = tmp_path / "previous.json"
+        previous_path.write_text(json.dumps(previous.to_dict()), encoding="utf-8")
+
+        for fid, status, coverage in [
+            ("01-01", "implemented", "full"),
+            ("01-02", "partial", "none"),
+            ("01-03", "not_implemented", "none"),
+            ("01-04", "implemented", "full"),
+        ]:
+            frag = _minimal_fragment(fid, status=status, test_coverage=coverage)
+            _write_fragment(second, frag, f"{fid}.json")
+        report = assemble_report(
+            second, "proj", "/spec", "/src", previous_report_path=previous_path
+        )
+
+        view = ReportView(report)
+        assert view.is_reverify
+        assert [f.v_item_id for f in view.reverified] == ["V1", "V2", "V3"]
+        assert [
+            (f.v_item_id, f.resolution) for f in view.unresolved
+        ] == [("V2", Resolution.NOT_FIXED), ("V3", Resolution.REGRESSED)]
+
+class TestMarkdownPages:
+    def _report(self, tmp_path: Path):
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        for fid, status, coverage in [
+            ("01-01", "implemented", "full"),
+            ("01-02", "partial", "partial"),
+            ("02-01", "not_implemented", "none"),
+            ("03-01", "implemented", "none"),
+            ("03-02", "implemented", "full"),
+        ]:
+            frag = _minimal_fragment(fid, status=status, test_coverage=coverage)
+            _write_fragment(frags, frag, f"{fid}.json")
+        return assemble_report(frags, "proj", "/spec", "/src", date="2026-02-16")
+
+    def test_write_markdown_matches_render_markdown(self, tmp_path: Path):
+        import io
+
+        report = self._report(tmp_path)
+        out = io.StringIO()
+        write_markdown(report, out)
+        assert out.getvalue() == render_markdown(report)
+
+    def test_one_page_per_top_level_section(self, tmp_path: Path):
+        report = self._report(tmp_path)
+        pages = write_markdown_pages(report, tmp_path / "pages")
+
+        assert [p.name for p in pages] == [
+            "index.md",
+            "section-01.md",
+            "section-02.md",
+            "section-03.md",
+        ]
+        index = pages[0].read_text(encoding="utf-8")
+        assert "## Scorecard" in index
+        assert "## Items Requiring Tests" in index
+        assert "| [\u00a701](section-01.md) | V1\u2013V2 | 2 | 0 | 1 |" in index
+        assert "### V1" not in index
+
+        section_1 = pages[1].read_text(encoding="utf-8")
+        assert "### V1 \u2014 \u00a701.01" in section_1
+        assert "### V2" in section_1
+        assert "### V3" not in section_1
+        assert "| V2 | \u00a701.02 |" in section_1
+
+    def test_page_size_chunks_v_items(self, tmp_path: Path):
+        report = self._report(tmp_path)
+        pages = write_markdown_pages(report, tmp_path / "pages", page_size=2)
+
+        assert [p.name for p in pages[1:]] == ["page-1.md", "page-2.md", "page-3.md"]
+        assert "| [Page 3](page-3.md) | V5 | 1 | 0 | 0 |" in pages[0].read_text(
+            encoding="utf-8"
+        )
+        headings = [
+            line
+            for page in pages[1:]
+            for line in page.read_text(encoding="utf-8").splitlines()
+            if line.startswith("### ")
+        ]
+        assert [h.split()[1] for h in headings] == ["V1", "V2", "V3", "V4", "V5"]
+
+    def test_index_lists_non_contiguous_v_items(self, tmp_path: Path):
+        report = self._report(tmp_path)
+        # As after re-verification, where new items get fresh ids
+        for f, v_item_id in zip(report.findings, ["V1", "V2", "V4", "V7", "V8"]):
+            f.v_item_id = v_item_id
+        pages = write_markdown_pages(report, tmp_path / "pages", page_size=3)
+        index = pages[0].read_text(encoding="utf-8")
+        assert "| [Page 1](page-1.md) | V1\u2013V2, V4 | 3 |" in index
+        assert "| [Page 2](page-2.md) | V7\u2013V8 | 2 |" in index
+
+    def test_lazy_report_pages_match_eager_report(self, tmp_path: Path):
+        report = self._report(tmp_path)
+        path = tmp_path / "report.json"
+        with path.open("wb") as fh:
+            write_report_json(report, fh)
+        pages_dir = tmp_path / "pages"
+        with load_report_lazy(path) as lazy:
+            written = write_markdown_pages(lazy, pages_dir)
+            assert lazy.findings._built == [None] * len(report.findings)
+        expected = write_markdown_pages(report, tmp_path / "eager")
+        assert [p.read_text(encoding="utf-8") for p in written] == [
+            p.read_text(encoding="utf-8") for p in expected
+        ]
+
+    def test_stale_pages_are_removed(self, tmp_path: Path):
+        report = self._report(tmp_path)
+        directory = tmp_path / "pages"
+        write_markdown_pages(report, directory, page_size=1)
+        write_markdown_pages(report, directory)
+        assert sorted(p.name for p in directory.glob("*.md")) == [
+            "index.md",
+            "section-01.md",
+            "section-02.md",
+            "section-03.md",
+        ]
+
+
+class TestReportFormats:
+    def _report(self, tmp_path: Path):
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        for fid, status, coverage in [
+            ("01-01", "implemented", "full"),
+            ("01-02", "partial", "partial"),
+            ("02-01", "na", "none"),
+        ]:
+            frag = _minimal_fragment(
+                fid,
+                status=status,
+                test_coverage=coverage,
+                title=f"Requirement <{fid}> & co",
+                missing_tests=["edge, \"quoted\" case"] if status == "partial" else [],
+            )
+            _write_fragment(frags, frag, f"{fid}.json")
+        return assemble_report(frags, "proj", "/spec", "/src", date="2026-02-16")
+
+    def test_writes_every_format_next_to_output(self, tmp_path: Path):
+        import csv
+        import xml.etree.ElementTree as ET
+
+        report = self._report(tmp_path)
+        paths = write_report_formats(
+            report, tmp_path / "verify.json", ["csv", "junit", "html"]
+        )
+        assert [p.name for p in paths] == [
+            "verify.csv",
+            "verify.junit.xml",
+            "verify.html",
+        ]
+
+        with paths[0].open(encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [r["v_item_id"] for r in rows] == ["V1", "V2", "V3"]
+        assert rows[1]["status"] == "partial"
+        assert rows[1]["missing_tests"] == 'edge, "quoted" case'
+
+        suite = ET.parse(paths[1]).getroot().find("testsuite")
+        assert suite.get("timestamp") == "2026-02-16T00:00:00"
+        assert suite.get("tests") == "3"
+        assert suite.get("failures") == "1"
+        assert suite.get("skipped") == "1"
+        cases = {c.get("name"): c for c in suite.iter("testcase")}
+        assert list(cases) == [
+            "V1 Requirement <01-01> & co",
+            "V2 Requirement <01-02> & co",
+            "V3 Requirement <02-01> & co",
+        ]
+        failure = cases["V2 Requirement <01-02> & co"].find("failure")
+        assert failure.get("message") == "Partial; test coverage: Partial"
+        assert 'Missing test: edge, "quoted" case' in failure.text
+
+        page = paths[2].read_text(encoding="utf-8")
+        assert page.count('<tr class="') == 3
+        assert "Requirement &lt;01-01&gt; &amp; co" in page
+        assert "<th>Resolution</th>" not in page
+
+    def test_junit_parses_despite_control_characters(self, tmp_path: Path):
+        import xml.etree.ElementTree as ET
+
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        frag = _minimal_fragment(
+            "01-01",
+            status="partial",
+            title="Bell\x07 and\ttab",
+            requirement_text="Form feed\x0c here",
+        )
+        _write_fragment(frags, frag, "01-01.json")
+        report = assemble_report(frags, "proj", "/spec", "/src", date="2026-02-16")
+        [path] = write_report_formats(report, tmp_path / "verify.json", ["junit"])
+
+        case = ET.parse(path).getroot().find("testsuite").find("testcase")
+        assert case.get("name") == "V1 Bell\ufffd and\ttab"
+        assert "Spec says: Form feed\ufffd here" in case.find("failure").text
+
+    def test_rejects_unknown_format(self, tmp_path: Path):
+        report = self._report(tmp_path)
+        with pytest.raises(ValueError, match="pdf"):
+            write_report_formats(report, tmp_path / "verify.json", ["csv", "pdf"])
+        assert not (tmp_path / "verify.csv").exists()
+
+
+# ---------------------------------------------------------------------------
+# Import cost tests
+# ---------------------------------------------------------------------------
+
+TOOLS_DIR = Path(__file__).parent.parent
+
+# Cumulative microseconds reported by ``-X importtime`` for the package and
+# everything it pulls in. The single-module version took ~140ms; the split
+# package takes ~30-40ms, so this catches a heavy import creeping back in.
+IMPORT_BUDGET_US = 90_000
+
+
+def _import_report(statement: str) -> tuple[int, set[str]]:
+    """Run ``statement`` in a fresh interpreter.
+
+    Returns the cumulative import time of the top-level ``verification_schema``
+    imports and the names of all modules loaded afterwards.
+    """
+    code = (
+        f"import sys; sys.path.insert(0, {str(TOOLS_DIR)!r}); {statement}; "
+        "print('\\n'.join(sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        # Top-level entries have a single space before the name
+        if name.startswith(" verification_schema") and not name.startswith("  "):
+            total += int(cumulative)
+    return total, set(result.stdout.split())
+
+
+class TestImportCost:
+    def test_import_within_budget(self):
+        best = min(
+            _import_report("import verification_schema")[0] for _ in range(3)
+        )
+        assert best < IMPORT_BUDGET_US
+
+    def test_validation_does_not_load_assembly_or_rendering(self):
+        _, modules = _import_report(
+            "from verification_schema import validate_fragment, check_fragment_file"
+        )
+        assert "verification_schema.validate" in modules
+        for heavy in ("report", "lazy", "render", "stats", "cache"):
+            assert f"verification_schema.{heavy}" not in modules
+        assert "concurrent.futures" not in modules
+        assert "orjson" not in modules
+
+    def test_facade_exposes_submodule_names(self):
+        assert verification_schema.render_markdown is render_markdown
+        assert verification_schema.load_report_lazy is load_report_lazy
+        assert "assemble_report" in dir(verification_schema)
+        with pytest.raises(AttributeError):
+            verification_schema.no_such_name
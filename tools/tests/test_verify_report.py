@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+import verification_schema
+import verify_report
+from verification_history import HISTORY_FILENAME
+from verification_schema import FRAGMENT_CACHE_FILENAME
+
 TOOL_PATH = Path(__file__).parent.parent / "verify_report.py"
 
 
@@ -190,3 +197,477 @@ class TestCLI:
 
         assert result.returncode == 0, f"stderr: {result.stderr}"
         assert "WARNING" in result.stderr
+
+    def test_jobs_option(self, tmp_path: Path) -> None:
+        """--jobs loads fragments in parallel and produces the same report."""
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        for i in range(1, 5):
+            frag = _minimal_fragment(f"02-01-0{i}", f"§2.1.{i}")
+            (frags / f"02-01-0{i}.json").write_text(json.dumps(frag), encoding="utf-8")
+
+        outputs = []
+        for jobs in ("1", "3"):
+            output_json = tmp_path / f"out-{jobs}" / "verify.json"
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(TOOL_PATH),
+                    "--fragments-dir",
+                    str(frags),
+                    "--spec-path",
+                    "/fake/spec.md",
+                    "--impl-path",
+                    "/fake/impl",
+                    "--project-name",
+                    "TestProject",
+                    "--output",
+                    str(output_json),
+                    "--jobs",
+                    jobs,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            assert result.returncode == 0, f"stderr: {result.stderr}"
+            outputs.append(output_json.read_text(encoding="utf-8"))
+
+        assert outputs[0] == outputs[1]
+
+    def test_cache_option_writes_cache_file(self, tmp_path: Path) -> None:
+        """--cache stores validated fragments next to the fragments directory."""
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        frag = _minimal_fragment()
+        (frags / "02-01-01.json").write_text(json.dumps(frag), encoding="utf-8")
+
+        outputs = []
+        for run in range(2):
+            output_json = tmp_path / f"verify-{run}.json"
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(TOOL_PATH),
+                    "--fragments-dir",
+                    str(frags),
+                    "--spec-path",
+                    "/fake/spec.md",
+                    "--impl-path",
+                    "/fake/impl",
+                    "--project-name",
+                    "TestProject",
+                    "--output",
+                    str(output_json),
+                    "--cache",
+                ],
+                capture_output=True,
+                text=True,
+            )
+            assert result.returncode == 0, f"stderr: {result.stderr}"
+            outputs.append(output_json.read_text(encoding="utf-8"))
+
+        assert (tmp_path / "fragment-cache.pickle").exists()
+        assert outputs[0] == outputs[1]
+
+    def test_cache_save_failure_only_warns(self, tmp_path: Path) -> None:
+        """An unwritable cache neither fails the run nor hides its errors."""
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        frag = _minimal_fragment()
+        (frags / "02-01-01.json").write_text(json.dumps(frag), encoding="utf-8")
+        # The cache is written via this temporary path
+        (tmp_path / "fragment-cache.pickle.tmp").mkdir()
+        args = [
+            sys.executable,
+            str(TOOL_PATH),
+            "--fragments-dir",
+            str(frags),
+            "--spec-path",
+            "/fake/spec.md",
+            "--impl-path",
+            "/fake/impl",
+            "--project-name",
+            "TestProject",
+            "--output",
+            str(tmp_path / "verify.json"),
+            "--cache",
+        ]
+        result = subprocess.run(args, capture_output=True, text=True)
+        assert result.returncode == 0, f"stderr: {result.stderr}"
+        assert "Warning: could not save fragment-cache.pickle" in result.stderr
+
+        (frags / "02-01-02.json").write_text("{not json", encoding="utf-8")
+        result = subprocess.run(args, capture_output=True, text=True)
+        assert result.returncode == 1
+        assert "02-01-02.json" in result.stderr
+        assert "Warning: could not save fragment-cache.pickle" in result.stderr
+
+
+    def test_paginate_writes_pages(self, tmp_path: Path) -> None:
+        """--paginate writes an index and per-section pages next to the report."""
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        for fid, ref in [("01-01", "§1.1"), ("02-01", "§2.1")]:
+            (frags / f"{fid}.json").write_text(
+                json.dumps(_minimal_fragment(fid, ref)), encoding="utf-8"
+            )
+        output_json = tmp_path / "verify.json"
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(TOOL_PATH),
+                "--fragments-dir",
+                str(frags),
+                "--spec-path",
+                "/fake/spec.md",
+                "--impl-path",
+                "/fake/impl",
+                "--project-name",
+                "TestProject",
+                "--output",
+                str(output_json),
+                "--paginate",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, f"stderr: {result.stderr}"
+        assert output_json.with_suffix(".md").exists()
+        pages = tmp_path / "verify-pages"
+        assert sorted(p.name for p in pages.iterdir()) == [
+            "index.md",
+            "section-1.md",
+            "section-2.md",
+        ]
+
+    def test_format_option_writes_extra_formats(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        (frags / "02-01-01.json").write_text(
+            json.dumps(_minimal_fragment()), encoding="utf-8"
+        )
+        output_json = tmp_path / "verify.json"
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(TOOL_PATH),
+                "--fragments-dir",
+                str(frags),
+                "--spec-path",
+                "/fake/spec.md",
+                "--impl-path",
+                "/fake/impl",
+                "--project-name",
+                "TestProject",
+                "--output",
+                str(output_json),
+                "--format",
+                "csv",
+                "junit",
+                "--format",
+                "html",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, f"stderr: {result.stderr}"
+        for name in ("verify.md", "verify.csv", "verify.junit.xml", "verify.html"):
+            assert (tmp_path / name).exists(), name
+
+    def test_stream_output_matches_default(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        for fid in ("01-01", "01-01-01", "02-01"):
+            frag = _minimal_fragment(fid, "§" + fid.replace("-", "."))
+            (frags / f"{fid}.json").write_text(json.dumps(frag), encoding="utf-8")
+
+        outputs = {}
+        for mode, extra in (("default", []), ("stream", ["--stream"])):
+            output_json = tmp_path / mode / "verify.json"
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(TOOL_PATH),
+                    "--fragments-dir",
+                    str(frags),
+                    "--spec-path",
+                    "/fake/spec.md",
+                    "--impl-path",
+                    "/fake/impl",
+                    "--project-name",
+                    "TestProject",
+                    "--output",
+                    str(output_json),
+                    *extra,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            assert result.returncode == 0, f"stderr: {result.stderr}"
+            outputs[mode] = output_json
+
+        for suffix in (".json", ".md"):
+            default = outputs["default"].with_suffix(suffix).read_bytes()
+            assert outputs["stream"].with_suffix(suffix).read_bytes() == default
+        assert outputs["stream"].with_suffix(".idx").exists()
+
+    def test_stream_report_closed_when_writing_fails(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        frag = _minimal_fragment()
+        (frags / "02-01-01.json").write_text(json.dumps(frag), encoding="utf-8")
+        opened = []
+        assemble = verification_schema.assemble_report_streaming
+
+        def tracking_assemble(**kwargs):
+            opened.append(assemble(**kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(
+            verification_schema, "assemble_report_streaming", tracking_assemble
+        )
+        output = tmp_path / "verify.json"
+        output.with_suffix(".md").mkdir()  # the markdown cannot be written
+        spec = verify_report.SpecJob(frags, "/s", "/i", "p", output)
+
+        result = verify_report.verify_spec(spec, history=False, stream=True)
+        assert result.error.startswith("cannot write report")
+        assert opened[0].findings._map is None
+
+    def test_page_size_requires_paginate(self, tmp_path: Path) -> None:
+        result = subprocess.run(
+            [sys.executable, str(TOOL_PATH), "--page-size", "10"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 2
+        assert "--page-size requires --paginate" in result.stderr
+
+
+class TestWait:
+    """Tests for --wait, which validates fragments as their markers land."""
+
+    def _args(self, frags: Path, output: Path, *extra: str) -> list[str]:
+        return [
+            sys.executable,
+            str(TOOL_PATH),
+            "--fragments-dir",
+            str(frags),
+            "--spec-path",
+            "/fake/spec.md",
+            "--impl-path",
+            "/fake/impl",
+            "--project-name",
+            "TestProject",
+            "--output",
+            str(output),
+            *extra,
+        ]
+
+    def _write(self, frags: Path, fid: str) -> None:
+        frag = _minimal_fragment(fid, "§" + fid.replace("-", "."))
+        (frags / f"{fid}.json").write_text(json.dumps(frag), encoding="utf-8")
+        (frags / f"{fid}.done").touch()
+
+    def test_report_matches_default_run(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        output = tmp_path / "wait" / "verify.json"
+        partial = output.with_suffix(".partial.md")
+        proc = subprocess.Popen(
+            self._args(frags, output, "--wait", "3", "--live-markdown"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            self._write(frags, "01-01")
+            deadline = time.monotonic() + 10
+            while not partial.exists() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert "Partial report" in partial.read_text(encoding="utf-8")
+            for fid in ("01-01-01", "02-01"):
+                self._write(frags, fid)
+            stdout, stderr = proc.communicate(timeout=30)
+        finally:
+            proc.kill()
+        assert proc.returncode == 0, f"stderr: {stderr}"
+        assert "Fragments: 3" in stdout
+        assert not partial.exists()
+
+        default = tmp_path / "default" / "verify.json"
+        result = subprocess.run(
+            self._args(frags, default), capture_output=True, text=True
+        )
+        assert result.returncode == 0, f"stderr: {result.stderr}"
+        for suffix in (".json", ".md"):
+            expected = default.with_suffix(suffix).read_bytes()
+            assert output.with_suffix(suffix).read_bytes() == expected
+
+    def test_reports_invalid_fragment_and_fails(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        self._write(frags, "01-01")
+        (frags / "01-02.json").write_text("{not json", encoding="utf-8")
+        (frags / "01-02.done").touch()
+        result = subprocess.run(
+            self._args(frags, tmp_path / "verify.json", "--wait", "2"),
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 1
+        assert "INVALID 01-02" in result.stdout
+
+    def test_timeout(self, tmp_path: Path) -> None:
+        frags = tmp_path / "fragments"
+        frags.mkdir()
+        self._write(frags, "01-01")
+        output = tmp_path / "verify.json"
+        result = subprocess.run(
+            self._args(frags, output, "--wait", "2", "--wait-timeout", "0.5"),
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 1
+        assert "found 1/2 .done markers" in result.stderr
+        assert not output.exists()
+
+    def test_live_markdown_requires_wait(self, tmp_path: Path) -> None:
+        result = subprocess.run(
+            self._args(tmp_path, tmp_path / "verify.json", "--live-markdown"),
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 2
+        assert "--live-markdown requires --wait" in result.stderr
+
+
+class TestBatch:
+    """Tests for --batch manifest mode."""
+
+    def _write_spec(self, root: Path, name: str, valid: bool = True) -> dict:
+        frags = root / name / "fragments"
+        frags.mkdir(parents=True)
+        frag = _minimal_fragment() if valid else {"invalid": True}
+        (frags / "02-01-01.json").write_text(json.dumps(frag), encoding="utf-8")
+        return {
+            "fragments_dir": f"{name}/fragments",
+            "spec_path": f"/specs/{name}.md",
+            "impl_path": "/fake/impl",
+            "project_name": name,
+            "output": f"{name}/verify.json",
+        }
+
+    def _run(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(TOOL_PATH), *args],
+            capture_output=True,
+            text=True,
+        )
+
+    def test_failure_does_not_stop_other_specs(self, tmp_path: Path) -> None:
+        manifest = tmp_path / "manifest.json"
+        specs = [
+            self._write_spec(tmp_path, "alpha"),
+            self._write_spec(tmp_path, "broken", valid=False),
+            self._write_spec(tmp_path, "gamma"),
+        ]
+        manifest.write_text(json.dumps({"specs": specs}), encoding="utf-8")
+
+        for parallel in ("1", "2"):
+            result = self._run("--batch", str(manifest), "--parallel", parallel)
+            assert result.returncode == 1
+            lines = [
+                line for line in result.stdout.splitlines() if not line.startswith(" ")
+            ]
+            assert lines[0].startswith("[alpha] OK")
+            assert lines[1].startswith("[broken] FAILED")
+            assert lines[2].startswith("[gamma] OK")
+            assert "3 specs, 2 succeeded, 1 failed; 2 findings" in lines[3]
+            assert (tmp_path / "alpha" / "verify.json").exists()
+            assert (tmp_path / "gamma" / "verify.md").exists()
+
+    def test_all_specs_succeed(self, tmp_path: Path) -> None:
+        manifest = tmp_path / "manifest.json"
+        specs = [self._write_spec(tmp_path, name) for name in ("alpha", "beta")]
+        manifest.write_text(json.dumps(specs), encoding="utf-8")
+        result = self._run("--batch", str(manifest))
+        assert result.returncode == 0, result.stdout + result.stderr
+
+    def test_invalid_manifest_lists_every_problem(self, tmp_path: Path) -> None:
+        manifest = tmp_path / "manifest.json"
+        entries = [
+            {"project_name": "x"},
+            {"bogus": 1, **self._write_spec(tmp_path, "ok")},
+        ]
+        manifest.write_text(json.dumps(entries), encoding="utf-8")
+        result = self._run("--batch", str(manifest))
+        assert result.returncode == 1
+        assert "entry 1: missing fragments_dir" in result.stderr
+        assert "entry 2: unknown keys bogus" in result.stderr
+
+    def test_batch_rejects_single_spec_options(self, tmp_path: Path) -> None:
+        result = self._run("--batch", "m.json", "--output", "x.json")
+        assert result.returncode == 2
+        assert "--batch cannot be combined" in result.stderr
+
+    def test_single_mode_requires_spec_options(self) -> None:
+        result = self._run("--fragments-dir", "frags")
+        assert result.returncode == 2
+        assert "required: --spec-path" in result.stderr
+
+
+# Cumulative -X importtime budget for ``import verify_report``, in microseconds
+IMPORT_BUDGET_US = 150_000
+
+
+def _import_verify_report() -> tuple[int, set[str]]:
+    """Import verify_report in a fresh interpreter.
+
+    Returns its cumulative import time and the names of all loaded modules.
+    """
+    code = (
+        f"import sys; sys.path.insert(0, {str(TOOL_PATH.parent)!r}); "
+        "import verify_report; print('\\n'.join(sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name == " verify_report":
+            return int(cumulative), set(result.stdout.split())
+    raise AssertionError("verify_report missing from -X importtime output")
+
+
+class TestImportCost:
+    """``import verify_report`` loads only what start-up needs."""
+
+    def test_import_within_budget(self) -> None:
+        best = min(_import_verify_report()[0] for _ in range(3))
+        assert best < IMPORT_BUDGET_US
+
+    def test_import_does_not_load_mode_specific_modules(self) -> None:
+        _, modules = _import_verify_report()
+        for heavy in ("report", "render", "stream", "lazy", "cache", "formats"):
+            assert f"verification_schema.{heavy}" not in modules
+        for heavy in ("verification_history", "sqlite3", "wait_for_done"):
+            assert heavy not in modules
+
+    def test_help_names_match_module_constants(self) -> None:
+        """--help spells out file names the deferred modules define."""
+        result = subprocess.run(
+            [sys.executable, str(TOOL_PATH), "--help"],
+            capture_output=True,
+            text=True,
+            check=True,
+            # Wide enough that argparse does not wrap inside the file names
+            env={**os.environ, "COLUMNS": "500"},
+        )
+        assert HISTORY_FILENAME in result.stdout
+        assert FRAGMENT_CACHE_FILENAME in result.stdout
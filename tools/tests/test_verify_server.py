@@ -0,0 +1,307 @@
+"""Tests for verify_server.py, verify_client.py and verify_report.ResidentState."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+import verify_client
+import verify_report
+import verify_server
+
+
+def _minimal_fragment(fragment_id: str = "02-01-01") -> dict:
+    return {
+        "schema_version": "1.0.0",
+        "fragment_id": fragment_id,
+        "section_ref": f"§{fragment_id.replace('-', '.')}",
+        "title": "Test Requirement",
+        "requirement_text": "The system MUST do something",
+        "moscow": "MUST",
+        "status": "partial",
+        "implementation": {"files": [], "notes": ""},
+        "test_coverage": "partial",
+        "tests": [],
+        "missing_tests": [],
+        "missing_implementation": ["edge case"],
+    }
+
+
+def _args(tmp_path: Path, output: str, *extra: str) -> list[str]:
+    frags = tmp_path / "fragments"
+    if not frags.is_dir():
+        frags.mkdir()
+        (frags / "02-01-01.json").write_text(
+            json.dumps(_minimal_fragment()), encoding="utf-8"
+        )
+    return [
+        "--fragments-dir",
+        str(frags),
+        "--spec-path",
+        "/spec",
+        "--impl-path",
+        "/src",
+        "--project-name",
+        "proj",
+        "--output",
+        str(tmp_path / output),
+        *extra,
+    ]
+
+
+@pytest.fixture
+def server(tmp_path: Path, monkeypatch):
+    socket_path = tmp_path / "s.sock"
+    monkeypatch.setenv("VERIFY_SERVER_SOCKET", str(socket_path))
+    srv = verify_server.VerifyServer(socket_path, idle_timeout=30)
+    thread = threading.Thread(target=srv.serve_until_idle, daemon=True)
+    thread.start()
+    yield srv
+    verify_server.stop_server(socket_path)
+    thread.join(timeout=10)
+
+
+class TestResidentState:
+    def test_previous_report_reused_until_changed(self, tmp_path: Path):
+        assert verify_report.main(_args(tmp_path, "v1.json")) == 0
+        state = verify_report.ResidentState()
+        first = state.previous_report(tmp_path / "v1.json")
+        assert state.previous_report(tmp_path / "v1.json") is first
+
+        assert verify_report.main(_args(tmp_path, "v1.json", "--no-history")) == 0
+        os.utime(tmp_path / "v1.json", ns=(1, 1))
+        assert state.previous_report(tmp_path / "v1.json") is not first
+        state.close()
+
+    def test_least_recently_used_reports_closed(self, tmp_path: Path):
+        names = [f"v{n}.json" for n in range(verify_report.RESIDENT_REPORTS + 1)]
+        for name in names:
+            assert verify_report.main(_args(tmp_path, name, "--no-history")) == 0
+        state = verify_report.ResidentState()
+        first = state.previous_report(tmp_path / names[0])
+        reports = [state.previous_report(tmp_path / name) for name in names[1:]]
+        assert first.findings._map is None
+        assert len(state._reports) == verify_report.RESIDENT_REPORTS
+        # Using a report keeps it open
+        assert state.previous_report(tmp_path / names[1]) is reports[0]
+        state.close()
+
+    def test_fragment_cache_kept_in_memory(self, tmp_path: Path):
+        state = verify_report.ResidentState()
+        args = _args(tmp_path, "v.json", "--cache")
+        assert verify_report.main(args, state=state) == 0
+        cache = state.fragment_cache(tmp_path / "fragment-cache.pickle")
+        assert verify_report.main(args, state=state) == 0
+        assert state.fragment_cache(tmp_path / "fragment-cache.pickle") is cache
+        assert cache.run == 2
+
+    def test_verbose_handler_removed_after_run(self, tmp_path: Path):
+        schema_logger = logging.getLogger("verification_schema")
+        before = list(schema_logger.handlers)
+        for _ in range(2):
+            assert verify_report.main(_args(tmp_path, "v.json", "-v")) == 0
+        assert schema_logger.handlers == before
+
+
+class TestServer:
+    def test_client_output_matches_local_run(self, tmp_path, server, capsys):
+        assert verify_report.main(_args(tmp_path, "local.json")) == 0
+        local = capsys.readouterr()
+
+        assert verify_client.main(_args(tmp_path, "v1.json")) == 0
+        remote = capsys.readouterr()
+        assert remote.out == local.out
+        assert (tmp_path / "v1.md").exists()
+
+        args = _args(tmp_path, "v2.json", "--previous", str(tmp_path / "v1.json"))
+        assert verify_client.main(args) == 0
+        report = json.loads((tmp_path / "v2.json").read_text(encoding="utf-8"))
+        assert report["report_type"] == "reverify_delta"
+        assert len(server.state._reports) == 1
+
+    def test_errors_and_usage_are_forwarded(self, tmp_path, server, capsys):
+        assert verify_client.main(["--bogus"]) == 2
+        assert "unrecognized arguments" in capsys.readouterr().err
+
+        args = _args(tmp_path, "v.json")
+        args[1] = str(tmp_path / "missing")
+        assert verify_client.main(args) == 1
+        assert "fragments directory not found" in capsys.readouterr().err
+
+    def test_output_is_streamed_during_the_run(self, server, monkeypatch):
+        release = threading.Event()
+
+        def slow_main(argv, state=None, cwd=None):
+            print("Waiting... 1/2")
+            release.wait(10)
+            print("done")
+            return 0
+
+        monkeypatch.setattr(verify_report, "main", slow_main)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(server.socket_path))
+            sock.sendall(b'{"argv": []}\n')
+            replies = sock.makefile("rb")
+            # Arrives while the run is still blocked
+            assert json.loads(replies.readline()) == {"stdout": "Waiting... 1/2\n"}
+            release.set()
+            assert [json.loads(line) for line in replies] == [
+                {"stdout": "done\n"},
+                {"exit_code": 0},
+            ]
+
+    def test_relative_paths_resolved_against_client_cwd(
+        self, tmp_path, server, monkeypatch
+    ):
+        _args(tmp_path, "unused.json")
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.chdir(elsewhere)
+        argv = [
+            "--fragments-dir",
+            "fragments",
+            "--spec-path",
+            "/spec",
+            "--impl-path",
+            "/src",
+            "--project-name",
+            "proj",
+            "--output",
+            "v.json",
+        ]
+        messages: list[dict] = []
+        reply = server.dispatch({"argv": argv, "cwd": str(tmp_path)}, messages.append)
+        assert reply == {"exit_code": 0}
+        assert {"stdout": "Fragments: 1\n"} in messages
+        assert (tmp_path / "v.json").exists()
+        assert os.getcwd() == str(elsewhere)
+
+    def test_busy_server_runs_client_locally(
+        self, tmp_path, server, monkeypatch, capsys
+    ):
+        def no_second_server(path):
+            raise AssertionError("started a second server")
+
+        monkeypatch.setattr(verify_client, "_start_server", no_second_server)
+        with server._run_lock:
+            assert server.dispatch({"argv": []}, [].append) == {"busy": True}
+            assert verify_client.main(_args(tmp_path, "v.json")) == 0
+        assert "Fragments: 1" in capsys.readouterr().out
+        assert (tmp_path / "v.json").exists()
+
+    def test_stale_server_stops(self, tmp_path, server):
+        server.stamp = {}
+        reply = server.dispatch({"argv": []}, [].append)
+        assert reply == {"stale": True}
+        assert server.stopping
+
+
+    @pytest.mark.parametrize(
+        ("payload", "error"),
+        [
+            (b"[1, 2]", "request must be a JSON object"),
+            (b'"stop"', "request must be a JSON object"),
+            (b'{"argv": "--help"}', "argv must be a list of strings"),
+            (b'{"argv": [], "cwd": 1}', "cwd must be a string"),
+        ],
+    )
+    def test_malformed_requests_get_an_error(self, server, payload, error):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(server.socket_path))
+            sock.sendall(payload + b"\n")
+            reply = json.loads(sock.makefile("rb").readline())
+        assert reply == {"error": error}
+        assert not server.stopping
+
+
+    def test_stale_server_replaced_once_its_socket_is_gone(
+        self, tmp_path, server, monkeypatch, capsys
+    ):
+        server.stamp = {}
+        socket_seen: list[bool] = []
+        monkeypatch.setattr(
+            verify_client,
+            "_start_server",
+            lambda path: socket_seen.append(path.exists()),
+        )
+        monkeypatch.setattr(verify_client, "_START_TIMEOUT", 0.5)
+        assert verify_client.main(_args(tmp_path, "v.json")) == 0
+        assert socket_seen == [False]
+        assert "Fragments: 1" in capsys.readouterr().out
+
+
+class TestClientConnectionLoss:
+    def test_lost_connection_is_an_error_not_a_rerun(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        socket_path = tmp_path / "s.sock"
+        monkeypatch.setenv("VERIFY_SERVER_SOCKET", str(socket_path))
+
+        def no_rerun(*args):
+            raise AssertionError("ran the job again")
+
+        monkeypatch.setattr(verify_client, "_start_server", no_rerun)
+        monkeypatch.setattr(verify_report, "main", no_rerun)
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(socket_path))
+        listener.listen()
+
+        def dying_server() -> None:
+            conn, _ = listener.accept()
+            with conn:
+                conn.makefile("rb").readline()
+                conn.sendall(b'{"stdout": "Waiting... 1/2\\n"}\n')
+
+        thread = threading.Thread(target=dying_server)
+        thread.start()
+        try:
+            assert verify_client.main(_args(tmp_path, "v.json")) == 1
+        finally:
+            thread.join(timeout=10)
+            listener.close()
+        captured = capsys.readouterr()
+        assert captured.out == "Waiting... 1/2\n"
+        assert "closed the connection during the run" in captured.err
+
+
+class TestSocketDirectory:
+    def test_private_directory_accepted(self, tmp_path: Path):
+        directory = tmp_path / "run"
+        directory.mkdir(mode=0o700)
+        directory.chmod(0o700)
+        assert verify_server.check_socket_dir(directory) is None
+
+    def test_unsafe_directories_rejected(self, tmp_path: Path):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(0o777)
+        assert "has mode 0777" in verify_server.check_socket_dir(shared)
+        link = tmp_path / "link"
+        link.symlink_to(shared)
+        assert "not a directory" in verify_server.check_socket_dir(link)
+
+    def test_server_refuses_shared_directory(self, tmp_path: Path, capsys):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(0o755)
+        socket_path = shared / "server.sock"
+        assert verify_server.main(["--socket", str(socket_path)]) == 1
+        assert "refusing to listen" in capsys.readouterr().err
+        assert not socket_path.exists()
+
+
+class TestClientFallback:
+    def test_runs_locally_when_server_unavailable(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("VERIFY_SERVER_SOCKET", str(tmp_path / "none.sock"))
+        monkeypatch.setattr(verify_client, "_start_server", lambda path: None)
+        monkeypatch.setattr(verify_client, "_START_TIMEOUT", 0.1)
+        assert verify_client.main(_args(tmp_path, "v.json")) == 0
+        assert "Fragments: 1" in capsys.readouterr().out
+        assert (tmp_path / "v.json").exists()
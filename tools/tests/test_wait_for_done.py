@@ -0,0 +1,356 @@
+"""Tests for wait_for_done.py."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import wait_for_done
+from wait_for_done import (
+    MARKER_EVENTS,
+    ArrivalTracker,
+    InotifyWatcher,
+    PollWatcher,
+    load_expected,
+    load_targets,
+    open_watcher,
+    wait_for_bundle,
+    wait_for_count,
+    wait_for_files,
+    wait_for_manifest,
+    wait_for_targets,
+)
+
+
+def _inotify_available(tmp_path: Path) -> bool:
+    try:
+        InotifyWatcher([tmp_path], MARKER_EVENTS).close()
+    except OSError:
+        return False
+    return True
+
+
+def _later(delay: float, action) -> threading.Thread:
+    def run() -> None:
+        time.sleep(delay)
+        action()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+class TestWatchers:
+    def test_auto_falls_back_to_polling(self, tmp_path: Path):
+        watcher = open_watcher("auto", [tmp_path / "missing"], MARKER_EVENTS, 2)
+        assert isinstance(watcher, PollWatcher)
+        watcher.close()
+
+    def test_inotify_backend_does_not_fall_back(self, tmp_path: Path):
+        with pytest.raises(OSError):
+            open_watcher("inotify", [tmp_path / "missing"], MARKER_EVENTS, 2)
+
+    def test_poll_backend(self, tmp_path: Path):
+        watcher = open_watcher("poll", [tmp_path], MARKER_EVENTS, 0.05)
+        assert isinstance(watcher, PollWatcher)
+        started = time.monotonic()
+        watcher.wait(10)
+        assert time.monotonic() - started < 1
+
+
+class TestWaiting:
+    def test_inotify_detects_marker_without_polling(self, tmp_path: Path):
+        if not _inotify_available(tmp_path):
+            pytest.skip("inotify not available")
+        thread = _later(0.1, lambda: (tmp_path / "a.done").write_text("done"))
+        started = time.monotonic()
+        # A 60s poll interval would time out; only an event can end the wait
+        assert wait_for_count(tmp_path, 1, 5, 60, backend="inotify")
+        assert time.monotonic() - started < 2
+        thread.join()
+
+    @pytest.mark.parametrize("backend", ["auto", "poll"])
+    def test_files_and_count(self, tmp_path: Path, backend: str):
+        markers = [tmp_path / "a.done", tmp_path / "b.done"]
+        thread = _later(0.1, lambda: [m.write_text("done") for m in markers])
+        assert wait_for_files([str(m) for m in markers], 5, 0.05, backend)
+        assert wait_for_count(tmp_path, 2, 5, 0.05, backend)
+        thread.join()
+
+    def test_bundle_appends_wake_the_waiter(self, tmp_path: Path):
+        bundle = tmp_path / "fragments.ndjson"
+
+        def append() -> None:
+            with bundle.open("a", encoding="utf-8") as fh:
+                fh.write('{"fragment_id": "01-01"}\n{"fragment_id": "01-02"}\n')
+
+        interval = 60 if _inotify_available(tmp_path) else 0.05
+        thread = _later(0.1, append)
+        assert wait_for_bundle(bundle, 2, 5, interval)
+        thread.join()
+
+    def test_timeout(self, tmp_path: Path, capsys):
+        assert not wait_for_count(tmp_path, 1, 0.2, 0.05)
+        assert "Timeout" in capsys.readouterr().err
+
+    def test_cli_backend_option(self, tmp_path: Path):
+        (tmp_path / "a.done").write_text("done")
+        with pytest.raises(SystemExit) as exc_info:
+            wait_for_done.main(
+                ["--dir", str(tmp_path), "--count", "1", "--backend", "poll"]
+            )
+        assert exc_info.value.code == 0
+
+
+class TestArrivalTracker:
+    def test_rate_eta_and_stragglers(self):
+        tracker = ArrivalTracker(8, start=0.0)
+        tracker.update(["old"], 0.0)  # present before the wait: no arrival
+        tracker.update(["old", "a", "b"], 10.0)
+        tracker.update(["old", "a", "b", "c"], 20.0)
+        stats = tracker.stats(20.0)
+        assert stats["found"] == 4
+        assert stats["rate_per_min"] == 9.0
+        assert stats["eta_seconds"] == 27
+        assert stats["median_seconds"] == 10.0
+        assert tracker.stragglers(20.0) == 0
+        assert tracker.stragglers(20.1) == 4
+        assert "9.0/min, ETA 27s" in tracker.describe(20.0)
+
+    def test_no_median_before_half_arrived(self):
+        tracker = ArrivalTracker(10, start=0.0)
+        tracker.update([], 0.0)
+        tracker.update(["a", "b", "c"], 5.0)
+        assert tracker.median() is None
+        assert tracker.stragglers(500.0) == 0
+        assert tracker.stats(5.0)["eta_seconds"] == 12
+
+    def test_json_events(self, tmp_path: Path, capsys):
+        present, absent = tmp_path / "a.done", tmp_path / "b.done"
+        present.write_text("done")
+        assert not wait_for_files(
+            [str(present), str(absent)], 0.1, 0.05, "poll", events=True
+        )
+        [event] = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert event["event"] == "timeout"
+        assert event["found"] == 1
+        assert event["missing"] == [str(absent)]
+        assert event["rate_per_min"] is None
+
+
+class TestManifest:
+    def _result(self, capsys) -> dict:
+        return json.loads(capsys.readouterr().out.splitlines()[-1])
+
+    def test_waits_by_identity(self, tmp_path: Path, capsys):
+        (tmp_path / "99-99.done").write_text("done")  # extra, not expected
+        (tmp_path / "01-01.done").write_text("done")
+        thread = _later(0.2, lambda: (tmp_path / "01-02.done").write_text("done"))
+        assert wait_for_manifest(
+            {"01-01": None, "01-02": None}, 5, 0.05, directory=tmp_path
+        )
+        thread.join()
+        result = self._result(capsys)
+        assert result["missing"] == []
+        assert result["unexpected"] == ["99-99"]
+
+    def test_ends_once_every_missing_id_is_overdue(self, tmp_path: Path, capsys):
+        (tmp_path / "01-01.done").write_text("done")
+        started = time.monotonic()
+        assert not wait_for_manifest(
+            {"01-01": None, "01-02": 0.2, "01-03": 0.3}, 60, 0.05, directory=tmp_path
+        )
+        assert time.monotonic() - started < 5
+        result = self._result(capsys)
+        assert result["missing"] == ["01-02", "01-03"]
+        assert result["overdue"] == ["01-02", "01-03"]
+
+    def test_stale_markers_do_not_count(self, tmp_path: Path, capsys):
+        (tmp_path / "01-01.done").write_text("done")
+        since = time.time() + 60  # every marker on disk predates the run
+        assert not wait_for_manifest(
+            {"01-01": None}, 0.2, 0.05, directory=tmp_path, since=since
+        )
+        result = self._result(capsys)
+        assert result["missing"] == result["stale"] == ["01-01"]
+        assert result["unexpected"] == []
+
+    def test_bundle_json_events(self, tmp_path: Path, capsys):
+        bundle = tmp_path / "fragments.ndjson"
+        bundle.write_text('{"fragment_id": "01-01"}\n{"fragment_id": "09-09"}\n')
+        assert not wait_for_manifest(
+            {"01-01": None, "01-02": None}, 0.2, 0.05, events=True, bundle=bundle
+        )
+        event = self._result(capsys)
+        assert event["event"] == "timeout"
+        assert event["missing"] == ["01-02"]
+        assert event["unexpected"] == ["09-09"]
+
+    def test_invalid_manifest_lists_every_problem(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        entries = [1, {"fragment_id": "a", "deadline": 0, "x": 1}, "b", "b"]
+        path.write_text(json.dumps(entries), encoding="utf-8")
+        with pytest.raises(ValueError) as exc_info:
+            load_expected(path)
+        message = str(exc_info.value)
+        assert "entry 1: expected a fragment_id" in message
+        assert "entry 2: unknown keys x" in message
+        assert "entry 2: deadline must be a positive number" in message
+        assert "entry 4: duplicate fragment_id b" in message
+
+    def test_cli_manifest(self, tmp_path: Path, capsys):
+        fragments = tmp_path / "fragments"
+        fragments.mkdir()
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps(["01-01", {"fragment_id": "01-02"}]))
+        for fid in ("01-01", "01-02"):
+            (fragments / f"{fid}.done").write_text("done")
+        with pytest.raises(SystemExit) as exc_info:
+            wait_for_done.main(["--dir", str(fragments), "--manifest", str(manifest)])
+        assert exc_info.value.code == 0
+        assert self._result(capsys)["missing"] == []
+
+    def test_cli_counts_marker_written_before_manifest(self, tmp_path: Path, capsys):
+        # A fast agent can finish before the manifest is (re)written
+        (tmp_path / "01-01.done").write_text("done")
+        time.sleep(0.01)
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps(["01-01"]))
+        with pytest.raises(SystemExit) as exc_info:
+            wait_for_done.main(
+                ["--dir", str(tmp_path), "--manifest", str(manifest), "--timeout", "1"]
+            )
+        assert exc_info.value.code == 0
+        assert self._result(capsys)["stale"] == []
+
+    def test_cli_since_marks_older_markers_stale(self, tmp_path: Path, capsys):
+        marker = tmp_path / "01-01.done"
+        marker.write_text("done")
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps(["01-01"]))
+        since = marker.stat().st_mtime + 60
+        argv = ["--dir", str(tmp_path), "--manifest", str(manifest)]
+        with pytest.raises(SystemExit) as exc_info:
+            wait_for_done.main([*argv, "--timeout", "0.2", "--since", str(since)])
+        assert exc_info.value.code == 1
+        assert self._result(capsys)["stale"] == ["01-01"]
+
+
+class TestTargets:
+    def _events(self, capsys) -> list[dict]:
+        return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    @pytest.mark.parametrize("backend", ["auto", "poll"])
+    def test_each_target_reported_as_it_finishes(
+        self, tmp_path: Path, capsys, backend: str
+    ):
+        fragments = tmp_path / "fragments"
+        fragments.mkdir()
+        summary = tmp_path / "impl" / "summary.done"
+        summary.parent.mkdir()
+        spec = [
+            {"name": "verify", "dir": str(fragments), "count": 2},
+            {"name": "impl", "files": [str(summary)], "timeout": 0.3},
+        ]
+        (tmp_path / "targets.json").write_text(json.dumps(spec), encoding="utf-8")
+        targets = load_targets(tmp_path / "targets.json", 5)
+
+        def finish() -> None:
+            for name in ("a.done", "b.done"):
+                (fragments / name).write_text("done")
+
+        thread = _later(0.6, finish)
+        assert not wait_for_targets(targets, 0.05, backend)
+        thread.join()
+
+        events = self._events(capsys)
+        # The short timeout is reported first, without waiting for "verify"
+        assert [(e["event"], e.get("target")) for e in events] == [
+            ("timeout", "impl"),
+            ("complete", "verify"),
+            ("finished", None),
+        ]
+        assert events[0]["missing"] == [str(summary)]
+        assert events[2] == {
+            "event": "finished",
+            "complete": ["verify"],
+            "timed_out": ["impl"],
+        }
+
+    def test_unwatchable_directory_polls_only_its_targets(
+        self, tmp_path: Path, capsys
+    ):
+        if not _inotify_available(tmp_path):
+            pytest.skip("inotify not available")
+        fragments = tmp_path / "fragments"
+        fragments.mkdir()
+        # Not created yet, so it cannot be watched
+        summary = tmp_path / "impl" / "summary.done"
+        spec = [
+            {"name": "verify", "dir": str(fragments), "count": 1},
+            {"name": "impl", "files": [str(summary)], "timeout": 0.3},
+        ]
+        (tmp_path / "targets.json").write_text(json.dumps(spec), encoding="utf-8")
+        targets = load_targets(tmp_path / "targets.json", 5)
+
+        thread = _later(0.1, lambda: (fragments / "a.done").write_text("done"))
+        started = time.monotonic()
+        # A 60s poll interval would time out "verify"; only an event ends it
+        assert not wait_for_targets(targets, 60, "auto")
+        assert time.monotonic() - started < 2
+        thread.join()
+
+        events = self._events(capsys)
+        assert [(e["event"], e.get("target")) for e in events] == [
+            ("polling", None),
+            ("complete", "verify"),
+            ("timeout", "impl"),
+            ("finished", None),
+        ]
+        assert events[0]["targets"] == ["impl"]
+        assert events[0]["directories"] == [str(summary.parent)]
+
+    def test_import_does_not_load_asyncio(self):
+        code = "import sys, wait_for_done; print('asyncio' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(wait_for_done.__file__).parent,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_invalid_targets_list_every_problem(self, tmp_path: Path):
+        spec = [
+            {"dir": str(tmp_path / "missing"), "count": 1, "bogus": 1},
+            {"files": ["a.done"], "count": 2, "timeout": 0},
+            {"name": "x", "bundle": "f.ndjson"},
+            {"name": "x", "bundle": "f.ndjson", "count": 1},
+        ]
+        path = tmp_path / "targets.json"
+        path.write_text(json.dumps(spec), encoding="utf-8")
+        with pytest.raises(ValueError) as exc_info:
+            load_targets(path, 600)
+        message = str(exc_info.value)
+        assert "target 1: unknown keys bogus" in message
+        assert "target 1: not a directory" in message
+        assert "target 2: count cannot be used with files" in message
+        assert "target 2: timeout must be a positive number" in message
+        assert "target 3: bundle needs a non-negative integer count" in message
+        assert "target 4: duplicate name x" in message
+
+    def test_cli_targets(self, tmp_path: Path, capsys):
+        (tmp_path / "a.done").write_text("done")
+        path = tmp_path / "targets.json"
+        path.write_text(json.dumps([{"dir": str(tmp_path), "count": 1}]))
+        with pytest.raises(SystemExit) as exc_info:
+            wait_for_done.main(["--targets", str(path)])
+        assert exc_info.value.code == 0
+        assert self._events(capsys)[0]["event"] == "complete"
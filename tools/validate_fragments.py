@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Validate verification fragments, optionally as agents write them.
+
+A malformed fragment normally only surfaces when verify_report.py runs
+after every agent has finished. In --watch mode this tool validates each
+<id>.json as soon as its <id>.done marker lands, so the orchestrator can
+redispatch the failing agent while the others are still running.
+
+  # One-shot: validate every fragment that has a .done marker
+  python validate_fragments.py --fragments-dir .impl-verification/foo/fragments/
+
+  # Watch until 40 markers have been checked (run in the background)
+  python validate_fragments.py --fragments-dir .impl-verification/foo/fragments/ \
+                               --watch --count 40
+
+Each invalid fragment is printed immediately as
+``INVALID <fragment_id>: <message>``. The current list of bad fragments is
+rewritten to --report (default: bad-fragments.json next to the fragments
+directory) after every change:
+
+  {"checked": 40, "bad": [{"fragment_id": "02-01-01",
+                           "issues": [{"code": ..., "field": ..., "message": ...}]}]}
+
+A fragment that is rewritten (e.g. by a redispatched agent) is re-checked
+and dropped from the list once it validates. Watch mode wakes on inotify
+events where available and otherwise polls every --interval seconds
+(see --backend).
+
+Exit codes:
+  0  Every checked fragment is valid (and --count reached, if given)
+  1  Invalid fragments found, or timeout before --count markers appeared
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Allow importing verification_schema from the same directory
+sys.path.insert(0, str(Path(__file__).parent))
+
+from verification_schema import ValidationIssue, check_fragment_file  # noqa: E402
+from wait_for_done import (  # noqa: E402
+    APPEND_EVENTS,
+    BACKENDS,
+    PROGRESS_INTERVAL,
+    next_wake,
+    open_watcher,
+)
+
+BAD_FRAGMENTS_FILENAME = "bad-fragments.json"
+
+
+class FragmentLinter:
+    """Validate fragments with .done markers, re-checking any that change."""
+
+    def __init__(self, fragments_dir: Path, report_path: Path) -> None:
+        self.fragments_dir = fragments_dir
+        self.report_path = report_path
+        # fragment_id -> (size, mtime_ns) of the .json last validated, or
+        # None if it was missing; size catches rewrites within one mtime tick
+        self._validated: dict[str, tuple[int, int] | None] = {}
+        self.bad: dict[str, list[ValidationIssue]] = {}
+
+    @property
+    def checked(self) -> int:
+        return len(self._validated)
+
+    def scan(self) -> list[tuple[str, list[ValidationIssue]]]:
+        """Validate fragments whose marker is new or whose .json changed.
+
+        Returns ``(fragment_id, errors)`` for every fragment checked in
+        this scan; an empty error list means it is valid.
+        """
+        results = []
+        for marker in sorted(self.fragments_dir.glob("*.done")):
+            fid = marker.stem
+            fragment = self.fragments_dir / f"{fid}.json"
+            stamp = self._stamp(fragment)
+            if fid in self._validated and self._validated[fid] == stamp:
+                continue
+            self._validated[fid] = stamp
+
+            if stamp is None:
+                errors = [
+                    ValidationIssue(
+                        "error",
+                        "missing_fragment",
+                        "",
+                        fid,
+                        f".done marker present but {fragment.name} is missing",
+                    )
+                ]
+            else:
+                issues = check_fragment_file(fragment)
+                errors = [i for i in issues if i.severity == "error"]
+
+            if errors:
+                self.bad[fid] = errors
+            else:
+                self.bad.pop(fid, None)
+            results.append((fid, errors))
+        return results
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[int, int] | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def write_report(self) -> None:
+        """Atomically rewrite the machine-readable list of bad fragments."""
+        report = {
+            "checked": self.checked,
+            "bad": [
+                {
+                    "fragment_id": fid,
+                    "issues": [
+                        {"code": i.code, "field": i.field, "message": i.message}
+                        for i in issues
+                    ],
+                }
+                for fid, issues in sorted(self.bad.items())
+            ],
+        }
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.report_path.with_name(self.report_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.report_path)
+
+
+def _print_results(
+    results: list[tuple[str, list[ValidationIssue]]], was_bad: set[str]
+) -> None:
+    for fid, errors in results:
+        if errors:
+            for issue in errors:
+                print(f"INVALID {fid}: {issue.message}", flush=True)
+        elif fid in was_bad:
+            print(f"FIXED {fid}", flush=True)
+
+
+def lint(
+    linter: FragmentLinter,
+    watch: bool,
+    count: int | None,
+    timeout: float,
+    interval: float,
+    backend: str = "auto",
+) -> bool:
+    """Run one scan, or keep scanning in watch mode; return True if all valid.
+
+    Raises OSError if ``backend`` is ``inotify`` and inotify is unavailable.
+    """
+    watcher = None
+    if watch:
+        watcher = open_watcher(backend, [linter.fragments_dir], APPEND_EVENTS, interval)
+    try:
+        return _lint(linter, watcher, count, timeout)
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+
+def _lint(linter: FragmentLinter, watcher, count: int | None, timeout: float) -> bool:
+    start = time.monotonic()
+    last_report = start
+    linter.write_report()
+
+    while True:
+        was_bad = set(linter.bad)
+        results = linter.scan()
+        _print_results(results, was_bad)
+        if results:
+            linter.write_report()
+
+        if watcher is None:
+            break
+        if count is not None and linter.checked >= count:
+            break
+
+        elapsed = time.monotonic() - start
+        if elapsed >= timeout:
+            if count is not None:
+                print(
+                    f"Timeout after {int(elapsed)}s — checked "
+                    f"{linter.checked}/{count} fragments",
+                    file=sys.stderr,
+                )
+                return False
+            break
+
+        if time.monotonic() - last_report >= PROGRESS_INTERVAL:
+            target = f"/{count}" if count is not None else ""
+            print(
+                f"Watching... {linter.checked}{target} checked, "
+                f"{len(linter.bad)} invalid ({int(elapsed)}s elapsed)",
+                flush=True,
+            )
+            last_report = time.monotonic()
+
+        watcher.wait(next_wake(start, last_report, timeout))
+
+    print(f"Checked {linter.checked} fragments, {len(linter.bad)} invalid")
+    if linter.bad:
+        print(f"Invalid: {', '.join(sorted(linter.bad))}")
+    return not linter.bad
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the CLI tool.
+
+    Returns exit code: 0 if all fragments are valid, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        description="Validate verification fragments, optionally as they are written"
+    )
+    parser.add_argument(
+        "--fragments-dir",
+        required=True,
+        type=Path,
+        help="Directory containing fragment JSON files and .done markers",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep validating fragments as their .done markers appear",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        help="In watch mode, stop once this many markers have been checked",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help=(
+            "Where to write the bad-fragment list "
+            f"(default: {BAD_FRAGMENTS_FILENAME} next to the fragments directory)"
+        ),
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600,
+        help="Maximum watch time in seconds (default: 600)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=2,
+        help="Poll interval in seconds (default: 2)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help=(
+            "How to detect changes in watch mode: inotify (Linux), poll every "
+            "--interval seconds, or auto (inotify where available, else poll; "
+            "default)"
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.count is not None and not args.watch:
+        parser.error("--count requires --watch")
+
+    if not args.fragments_dir.is_dir():
+        print(f"Error: not a directory: {args.fragments_dir}", file=sys.stderr)
+        return 1
+
+    report_path = args.report or args.fragments_dir.parent / BAD_FRAGMENTS_FILENAME
+    linter = FragmentLinter(args.fragments_dir, report_path)
+    try:
+        ok = lint(
+            linter, args.watch, args.count, args.timeout, args.interval, args.backend
+        )
+    except OSError as exc:  # only with --backend inotify
+        print(f"Error: cannot watch with inotify: {exc}", file=sys.stderr)
+        return 1
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+SQLite index of verification runs for one spec.
+
+``verify_report.py`` records every report it writes in ``history.sqlite``
+next to the report, so the latest report and per-V-item trends are indexed
+lookups instead of a glob-and-parse of every ``verify-*.json``.
+
+  # Path of the most recent report (e.g. for --previous)
+  python verification_history.py --dir .impl-verification/foo/ latest
+
+  # One line per recorded run, newest first
+  python verification_history.py --dir .impl-verification/foo/ runs
+
+  # Status of V37 over the last 10 runs
+  python verification_history.py --dir .impl-verification/foo/ item V37 --limit 10
+
+  # Record reports written before the history existed
+  python verification_history.py --dir .impl-verification/foo/ backfill
+
+Add ``--json`` before the subcommand for machine-readable output.
+
+Exit codes:
+  0  Success
+  1  Nothing recorded yet / unknown V-item, or an error
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Allow importing verification_schema from the same directory
+sys.path.insert(0, str(Path(__file__).parent))
+
+from verification_schema import (  # noqa: E402
+    SchemaError,
+    VerificationReport,
+    load_report,
+)
+
+HISTORY_FILENAME = "history.sqlite"
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    date TEXT NOT NULL,
+    run INTEGER NOT NULL,
+    report_type TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    spec_path TEXT NOT NULL,
+    spec_version TEXT NOT NULL,
+    previous_report TEXT,
+    total_requirements INTEGER NOT NULL,
+    implementation_rate REAL NOT NULL,
+    test_rate REAL NOT NULL,
+    must_implementation_rate REAL NOT NULL,
+    statistics TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_by_recency ON reports (date, run, id);
+
+CREATE TABLE IF NOT EXISTS findings (
+    report_id INTEGER NOT NULL REFERENCES reports (id) ON DELETE CASCADE,
+    v_item_id TEXT NOT NULL,
+    fragment_id TEXT NOT NULL,
+    section_ref TEXT NOT NULL,
+    title TEXT NOT NULL,
+    moscow TEXT NOT NULL,
+    status TEXT NOT NULL,
+    test_coverage TEXT NOT NULL,
+    resolution TEXT
+);
+CREATE INDEX IF NOT EXISTS findings_by_v_item ON findings (v_item_id, report_id);
+CREATE INDEX IF NOT EXISTS findings_by_report ON findings (report_id);
+"""
+
+_RECENCY = "date DESC, run DESC, id DESC"
+
+_RUN_COLUMNS = (
+    "path, date, run, report_type, total_requirements, "
+    "implementation_rate, test_rate, must_implementation_rate"
+)
+
+
+@dataclass
+class RunSummary:
+    """One recorded report. ``path`` is resolved against the history dir."""
+
+    path: str
+    date: str
+    run: int
+    report_type: str
+    total_requirements: int
+    implementation_rate: float
+    test_rate: float
+    must_implementation_rate: float
+
+
+@dataclass
+class ItemStatus:
+    """A V-item's state in one recorded report."""
+
+    date: str
+    run: int
+    path: str
+    status: str
+    test_coverage: str
+    resolution: str | None
+
+
+class HistoryStore:
+    """Verification history for one spec, stored in a SQLite file."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self.base_dir = db_path.parent
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _SCHEMA_VERSION):
+            self._conn.close()
+            raise SchemaError(
+                f"{db_path}: unsupported history version {version} "
+                f"(expected {_SCHEMA_VERSION})"
+            )
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @classmethod
+    def for_directory(cls, directory: Path) -> HistoryStore:
+        """Open the history stored in a spec's verification directory."""
+        return cls(directory / HISTORY_FILENAME)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> HistoryStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _key(self, report_path: Path) -> str:
+        """Store paths relative to the history directory when inside it."""
+        resolved = report_path.resolve()
+        try:
+            return resolved.relative_to(self.base_dir.resolve()).as_posix()
+        except ValueError:
+            return str(resolved)
+
+    def _resolve(self, key: str) -> str:
+        return str(self.base_dir / key)
+
+    def record(self, report: VerificationReport, report_path: Path) -> int:
+        """Record (or re-record) the report written to ``report_path``.
+
+        Returns the report's row id. Recording the same path again replaces
+        the earlier rows, so re-running verify_report.py is idempotent.
+        """
+        meta = report.metadata
+        stats = report.statistics
+        key = self._key(report_path)
+        with self._conn:
+            self._conn.execute("DELETE FROM reports WHERE path = ?", (key,))
+            cursor = self._conn.execute(
+                "INSERT INTO reports (path, date, run, report_type, project_name, "
+                "spec_path, spec_version, previous_report, total_requirements, "
+                "implementation_rate, test_rate, must_implementation_rate, "
+                "statistics) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    meta.date,
+                    meta.run,
+                    report.report_type,
+                    meta.project_name,
+                    meta.spec_path,
+                    meta.spec_version,
+                    meta.previous_report,
+                    stats.total_requirements,
+                    stats.implementation_rate,
+                    stats.test_rate,
+                    stats.must_implementation_rate,
+                    json.dumps(asdict(stats)),
+                ),
+            )
+            report_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO findings (report_id, v_item_id, fragment_id, "
+                "section_ref, title, moscow, status, test_coverage, resolution) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        report_id,
+                        f.v_item_id,
+                        f.fragment_id,
+                        f.section_ref,
+                        f.title,
+                        f.moscow.value,
+                        f.status.value,
+                        f.test_coverage.value,
+                        f.resolution.value if f.resolution is not None else None,
+                    )
+                    for f in report.findings
+                ),
+            )
+        return report_id
+
+    def is_recorded(self, report_path: Path) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM reports WHERE path = ?", (self._key(report_path),)
+        ).fetchone()
+        return row is not None
+
+    def runs(self, limit: int | None = None) -> list[RunSummary]:
+        """Return recorded runs, most recent first."""
+        rows = self._conn.execute(
+            f"SELECT {_RUN_COLUMNS} FROM reports ORDER BY {_RECENCY} LIMIT ?",
+            (-1 if limit is None else limit,),
+        ).fetchall()
+        return [RunSummary(self._resolve(row[0]), *row[1:]) for row in rows]
+
+    def latest(self) -> RunSummary | None:
+        """Return the most recent recorded report whose file still exists."""
+        for run in self.runs():
+            if Path(run.path).is_file():
+                return run
+        return None
+
+    def item_history(self, v_item_id: str, limit: int | None = 10) -> list[ItemStatus]:
+        """Return a V-item's status in recorded runs, most recent first."""
+        rows = self._conn.execute(
+            "SELECT r.date, r.run, r.path, f.status, f.test_coverage, f.resolution "
+            "FROM findings f JOIN reports r ON r.id = f.report_id "
+            "WHERE f.v_item_id = ? "
+            "ORDER BY r.date DESC, r.run DESC, r.id DESC LIMIT ?",
+            (v_item_id, -1 if limit is None else limit),
+        ).fetchall()
+        return [
+            ItemStatus(date, run, self._resolve(path), status, coverage, resolution)
+            for date, run, path, status, coverage, resolution in rows
+        ]
+
+    def backfill(self, directory: Path, pattern: str = "verify-*.json") -> int:
+        """Record every report in ``directory`` not yet in the history.
+
+        Returns the number of reports recorded.
+        """
+        count = 0
+        for path in sorted(directory.glob(pattern)):
+            if self.is_recorded(path):
+                continue
+            self.record(load_report(path), path)
+            count += 1
+        return count
+
+
+def _print_runs(runs: list[RunSummary]) -> None:
+    for r in runs:
+        print(
+            f"{r.date}  run {r.run:<3} {r.report_type:<15} "
+            f"{r.total_requirements:>5} reqs  impl {r.implementation_rate:.1%}  "
+            f"test {r.test_rate:.1%}  {r.path}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the CLI tool.
+
+    Returns exit code: 0 on success, 1 if nothing matched or on error.
+    """
+    parser = argparse.ArgumentParser(
+        description="Query the verification history of a spec",
+    )
+    parser.add_argument(
+        "--dir",
+        required=True,
+        type=Path,
+        help=f"Spec verification directory holding {HISTORY_FILENAME}",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON output")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("latest", help="Print the most recent report")
+    runs = sub.add_parser("runs", help="List recorded runs, newest first")
+    runs.add_argument("--limit", type=int, default=None)
+    item = sub.add_parser("item", help="Show one V-item's status across runs")
+    item.add_argument("v_item_id", help="V-item ID, e.g. V37")
+    item.add_argument("--limit", type=int, default=10)
+    backfill = sub.add_parser("backfill", help="Record existing reports")
+    backfill.add_argument(
+        "--pattern",
+        default="verify-*.json",
+        help="Glob for report files (default: verify-*.json)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        with HistoryStore.for_directory(args.dir) as store:
+            if args.command == "latest":
+                latest = store.latest()
+                if latest is None:
+                    print("No recorded reports", file=sys.stderr)
+                    return 1
+                if args.json:
+                    print(json.dumps(asdict(latest), indent=2))
+                else:
+                    print(latest.path)
+            elif args.command == "runs":
+                result = store.runs(args.limit)
+                if args.json:
+                    print(json.dumps([asdict(r) for r in result], indent=2))
+                else:
+                    _print_runs(result)
+            elif args.command == "item":
+                history = store.item_history(args.v_item_id, args.limit)
+                if not history:
+                    print(f"No recorded status for {args.v_item_id}", file=sys.stderr)
+                    return 1
+                if args.json:
+                    print(json.dumps([asdict(h) for h in history], indent=2))
+                else:
+                    for h in history:
+                        resolution = f"  ({h.resolution})" if h.resolution else ""
+                        print(
+                            f"{h.date}  run {h.run:<3} {h.status:<16} "
+                            f"tests {h.test_coverage:<8}{resolution}"
+                        )
+            else:
+                count = store.backfill(args.dir, args.pattern)
+                print(f"Recorded {count} report(s)")
+    except (SchemaError, sqlite3.Error, OSError, KeyError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
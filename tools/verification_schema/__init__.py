@@ -0,0 +1,140 @@
+"""Verification fragment schema: dataclasses, enums, and validation.
+
+The schema types are imported eagerly; everything else lives in
+submodules that are imported on first attribute access, so a tool that
+only validates fragments never loads report assembly or rendering:
+
+- ``model``: enums, dataclasses and ``SchemaError``
+- ``validate``: fragment validation
+- ``load``: reading fragment files into ``Finding`` objects
+- ``cache``: the on-disk fragment cache
+- ``bundle``: append-only NDJSON fragment bundles
+- ``stats``: statistics and priority gap classification
+- ``report``: V-item mapping, resolution inference and report assembly
+- ``lazy``: index-backed lazy report loading
+- ``stream``: constant-memory report writing and assembly
+- ``view``: findings sorted and partitioned once for renderers
+- ``render``: markdown rendering
+- ``formats``: CSV, JUnit XML and HTML output
+
+``from verification_schema import name`` keeps working for every name
+that the single-module version exported.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+from .model import (
+    FileRef,
+    Finding,
+    Implementation,
+    ItemDelta,
+    MoSCoW,
+    MoSCoWBreakdown,
+    PriorityGap,
+    ReportMetadata,
+    Resolution,
+    ResolutionSummary,
+    SchemaError,
+    Statistics,
+    Status,
+    TestCoverage,
+    VerificationReport,
+)
+
+# Public name -> submodule that defines it, imported on first access
+_LAZY_NAMES: dict[str, str] = {
+    "FragmentValidator": "validate",
+    "ValidationIssue": "validate",
+    "check_fragment_file": "validate",
+    "validate_fragment": "validate",
+    "validate_many": "validate",
+    "load_fragment": "load",
+    "load_fragment_results": "load",
+    "load_fragments": "load",
+    "FRAGMENT_CACHE_FILENAME": "cache",
+    "FragmentCache": "cache",
+    "FRAGMENT_BUNDLE_FILENAME": "bundle",
+    "append_fragment_record": "bundle",
+    "append_fragment_records": "bundle",
+    "bundle_from_directory": "bundle",
+    "directory_from_bundle": "bundle",
+    "iter_bundle": "bundle",
+    "iter_bundle_records": "bundle",
+    "load_bundle": "bundle",
+    "StatisticsAccumulator": "stats",
+    "classify_priority_gaps": "stats",
+    "compute_statistics": "stats",
+    "ReportIndex": "report",
+    "assemble_report": "report",
+    "assign_v_items": "report",
+    "build_report": "report",
+    "infer_resolution": "report",
+    "load_report": "report",
+    "map_v_items_from_previous": "report",
+    "reconcile_resolution": "report",
+    "REPORT_INDEX_SUFFIX": "lazy",
+    "FindingIndexEntry": "lazy",
+    "LazyFindings": "lazy",
+    "LazyVerificationReport": "lazy",
+    "build_report_index": "lazy",
+    "load_report_lazy": "lazy",
+    "assemble_report_streaming": "stream",
+    "write_report_json": "stream",
+    "REPORT_FORMATS": "formats",
+    "write_report_formats": "formats",
+    "MARKDOWN_INDEX_FILENAME": "render",
+    "ReportView": "view",
+    "render_markdown": "render",
+    "write_markdown": "render",
+    "write_markdown_pages": "render",
+}
+
+# Private helpers that callers and tests imported from the single module
+_LAZY_PRIVATE_NAMES: dict[str, str] = {
+    "_json_loads": "_json",
+    "_build_file_ref": "load",
+    "_decode_fragment": "load",
+    "_finding_from_dict": "load",
+    "_ingest_fragment": "load",
+    "_extract_v_number": "report",
+    "_scan_report": "lazy",
+}
+
+_SUBMODULES = frozenset(_LAZY_NAMES.values()) | {"model", "_json"}
+
+__all__ = [
+    "FileRef",
+    "Finding",
+    "Implementation",
+    "ItemDelta",
+    "MoSCoW",
+    "MoSCoWBreakdown",
+    "PriorityGap",
+    "ReportMetadata",
+    "Resolution",
+    "ResolutionSummary",
+    "SchemaError",
+    "Statistics",
+    "Status",
+    "TestCoverage",
+    "VerificationReport",
+    *_LAZY_NAMES,
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_NAMES.get(name) or _LAZY_PRIVATE_NAMES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
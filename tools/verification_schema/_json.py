@@ -0,0 +1,36 @@
+"""JSON decoding with optional orjson acceleration."""
+
+from __future__ import annotations
+
+import json
+
+# orjson (and the datetime/uuid/zoneinfo modules it pulls in) is imported on
+# the first parse rather than at startup; None once known to be missing.
+_NOT_LOADED = object()
+orjson = _NOT_LOADED
+
+
+def _load_orjson():
+    global orjson
+    try:
+        import orjson as module
+    except ImportError:
+        module = None
+    orjson = module
+    return module
+
+
+def _json_loads(text: str | bytes):
+    """Parse JSON with orjson when installed, falling back to stdlib ``json``.
+
+    Anything orjson rejects is re-parsed by ``json.loads``, so inputs the
+    stdlib accepts (e.g. ``NaN``) still load and error messages for
+    invalid JSON are always the stdlib's.
+    """
+    fast = orjson if orjson is not _NOT_LOADED else _load_orjson()
+    if fast is not None:
+        try:
+            return fast.loads(text)
+        except fast.JSONDecodeError:
+            pass
+    return json.loads(text)
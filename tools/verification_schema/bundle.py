@@ -0,0 +1,248 @@
+"""Append-only NDJSON fragment bundles."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from ._json import _json_loads
+from .load import _collect_results, _decode_fragment
+from .model import Finding, SchemaError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Fragment bundles (append-only NDJSON)
+# ---------------------------------------------------------------------------
+
+FRAGMENT_BUNDLE_FILENAME = "fragments.ndjson"
+
+
+def append_fragment_record(bundle_path: Path, data: dict) -> None:
+    """Append one fragment record to an NDJSON bundle.
+
+    The record is written as a single line with one ``write`` call on an
+    ``O_APPEND`` descriptor, under an exclusive ``flock`` where available,
+    so concurrent writers never interleave partial lines. Re-appending a
+    fragment_id supersedes the earlier record.
+    """
+    append_fragment_records(bundle_path, [data])
+
+
+def append_fragment_records(bundle_path: Path, records: list[dict]) -> None:
+    """Append several fragment records to an NDJSON bundle in one locked write.
+
+    As ``append_fragment_record``, but all lines go in together, so other
+    writers and readers never see only some of them.
+    """
+    payload = b"".join(
+        json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        + b"\n"
+        for data in records
+    )
+    fd = os.open(bundle_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        written = 0
+        while written < len(payload):
+            written += os.write(fd, payload[written:])
+    finally:
+        os.close(fd)  # also releases the lock
+
+
+def iter_bundle_records(bundle_path: Path) -> Iterator[tuple[int, dict]]:
+    """Stream ``(line_number, record)`` pairs from an NDJSON bundle.
+
+    Blank lines are skipped. A final line without a trailing newline is
+    a write still in progress and is ignored.
+
+    Raises:
+        SchemaError: If a complete line is not a JSON object.
+    """
+    for lineno, _, data in _iter_bundle_lines(bundle_path):
+        yield lineno, data
+
+
+def _iter_bundle_lines(bundle_path: Path) -> Iterator[tuple[int, int, dict]]:
+    """Like ``iter_bundle_records``, also yielding each line's byte offset."""
+    with bundle_path.open("rb") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_SH)
+        offset = 0
+        for lineno, raw in enumerate(fh, start=1):
+            start = offset
+            offset += len(raw)
+            if not raw.endswith(b"\n"):
+                logger.warning(
+                    "%s:%d: ignoring incomplete trailing record",
+                    bundle_path.name,
+                    lineno,
+                )
+                break
+            if not raw.strip():
+                continue
+            yield lineno, start, _parse_bundle_line(raw, f"{bundle_path.name}:{lineno}")
+
+
+def _parse_bundle_line(raw: bytes, label: str) -> dict:
+    try:
+        data = _json_loads(raw)
+    except (json.JSONDecodeError, ValueError) as exc:
+        raise SchemaError(f"{label}: invalid JSON: {exc}") from exc
+    if not isinstance(data, dict):
+        raise SchemaError(f"{label}: expected a JSON object per line")
+    return data
+
+
+def _latest_bundle_records(bundle_path: Path) -> dict[str, tuple[int, dict]]:
+    """Return the last record per fragment_id as ``{id: (line, record)}``."""
+    latest: dict[str, tuple[int, dict]] = {}
+    for lineno, _, data in _iter_bundle_lines(bundle_path):
+        latest[_record_id(bundle_path, lineno, data)] = (lineno, data)
+    return latest
+
+
+def _latest_bundle_offsets(bundle_path: Path) -> dict[str, tuple[int, int]]:
+    """Return the last record per fragment_id as ``{id: (line, byte offset)}``.
+
+    Unlike ``_latest_bundle_records`` no record is kept in memory; read
+    them back one at a time with ``_read_bundle_record``.
+    """
+    latest: dict[str, tuple[int, int]] = {}
+    for lineno, offset, data in _iter_bundle_lines(bundle_path):
+        latest[_record_id(bundle_path, lineno, data)] = (lineno, offset)
+    return latest
+
+
+def _record_id(bundle_path: Path, lineno: int, data: dict) -> str:
+    fid = data.get("fragment_id")
+    if not isinstance(fid, str) or not fid:
+        raise SchemaError(
+            f"{bundle_path.name}:{lineno}: validation errors:\n"
+            "  - Missing required field: fragment_id"
+        )
+    return fid
+
+
+def _read_bundle_record(fh: BinaryIO, offset: int, label: str) -> dict:
+    """Read back the record starting at ``offset`` of an open bundle."""
+    fh.seek(offset)
+    return _parse_bundle_line(fh.readline(), label)
+
+
+def iter_bundle(bundle_path: Path) -> Iterator[Finding]:
+    """Stream validated Findings from a bundle, in file order.
+
+    Every record is yielded, including ones later superseded by a newer
+    record for the same fragment_id; use ``load_bundle`` for the
+    de-duplicated view. Warnings are logged as each record is decoded.
+
+    Raises:
+        SchemaError: On the first invalid record.
+    """
+    for lineno, data in iter_bundle_records(bundle_path):
+        label = f"{bundle_path.name}:{lineno}"
+        finding, warnings = _decode_fragment(
+            data, f"{data.get('fragment_id')}.json", label
+        )
+        for w in warnings:
+            logger.warning("%s: %s", label, w)
+        yield finding
+
+
+def _ingest_bundle(
+    bundle_path: Path,
+) -> list[tuple[str, str, Finding | None, list[str], str | None]]:
+    """Decode the latest record per fragment_id for ``load_fragments``.
+
+    Returns ``(name, label, finding, warnings, error)`` tuples, where
+    ``name`` is the equivalent per-file name ``<fragment_id>.json``, so
+    bundle records can be merged with per-file results.
+    """
+    results = []
+    for fid, (lineno, data) in _latest_bundle_records(bundle_path).items():
+        name = f"{fid}.json"
+        label = f"{bundle_path.name}:{lineno}"
+        try:
+            finding, warnings = _decode_fragment(data, name, label)
+        except SchemaError as exc:
+            results.append((name, label, None, [], str(exc)))
+            continue
+        results.append((name, label, finding, warnings, None))
+    return results
+
+
+def load_bundle(bundle_path: Path) -> list[Finding]:
+    """Load the latest record per fragment_id from a bundle.
+
+    Findings are ordered as the per-file layout would order them. All
+    invalid records are reported together, as ``load_fragments`` does.
+
+    Raises:
+        SchemaError: If any record fails validation.
+    """
+    results = sorted(_ingest_bundle(bundle_path), key=lambda r: r[0])
+    return _collect_results([r[1:] for r in results])
+
+
+def bundle_from_directory(fragments_dir: Path, bundle_path: Path) -> int:
+    """Append every ``*.json`` fragment in a directory to a bundle.
+
+    Records are copied as-is (validation happens when the bundle is
+    read), but every file is parsed first and the records are appended in
+    one write, so a bad file leaves the bundle untouched and the pack can
+    simply be retried. Returns the number of records appended.
+
+    Raises:
+        SchemaError: Listing every file that is not a JSON object.
+    """
+    records: list[dict] = []
+    errors: list[str] = []
+    for fp in sorted(fragments_dir.glob("*.json")):
+        try:
+            data = json.loads(fp.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, ValueError) as exc:
+            errors.append(f"{fp.name}: invalid JSON: {exc}")
+            continue
+        if not isinstance(data, dict):
+            errors.append(f"{fp.name}: expected a JSON object")
+            continue
+        records.append(data)
+    if errors:
+        raise SchemaError(
+            "Fragment errors, nothing bundled:\n"
+            + "\n".join(f"  - {e}" for e in errors)
+        )
+    if records:
+        append_fragment_records(bundle_path, records)
+    return len(records)
+
+
+def directory_from_bundle(
+    bundle_path: Path, fragments_dir: Path, markers: bool = True
+) -> int:
+    """Write the latest record per fragment_id out as ``<id>.json`` files.
+
+    With ``markers`` a ``<id>.done`` file is written after each fragment,
+    matching what verification agents produce. Returns the number of
+    fragments written.
+    """
+    fragments_dir.mkdir(parents=True, exist_ok=True)
+    latest = _latest_bundle_records(bundle_path)
+    for fid, (_, data) in sorted(latest.items()):
+        (fragments_dir / f"{fid}.json").write_text(
+            json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        if markers:
+            (fragments_dir / f"{fid}.done").write_text("done", encoding="utf-8")
+    return len(latest)
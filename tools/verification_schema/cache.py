@@ -0,0 +1,139 @@
+"""On-disk cache of parsed fragments."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from .model import Finding
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Fragment cache
+# ---------------------------------------------------------------------------
+
+FRAGMENT_CACHE_FILENAME = "fragment-cache.pickle"
+
+_CACHE_FORMAT_VERSION = 3
+
+
+class FragmentCache:
+    """Persistent cache of validated fragments, keyed by content hash.
+
+    Each entry maps a SHA-256 of the fragment's filename and bytes to the
+    pickled Finding and its validation warnings. The filename is part of
+    the key because validation depends on it (``fragment_id`` must match
+    the stem). A per-path ``(mtime_ns, size)`` record lets unchanged files
+    skip reading and hashing altogether; any stat change falls back to
+    hashing the content, so a touched-but-identical file is still a hit.
+
+    Eviction happens on ``save``: entries not used in the last
+    ``max_idle_runs`` runs are dropped, then the least recently used are
+    dropped until at most ``max_entries`` remain.
+
+    The cache file is written by this tool for this tool; it is a pickle
+    and must not be shared with untrusted parties.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = 50_000,
+        max_idle_runs: int = 3,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.max_idle_runs = max_idle_runs
+        self.run = 0
+        # digest -> [pickled Finding, warnings, last run used]
+        self._entries: dict[str, list] = {}
+        # resolved path -> (mtime_ns, size, digest)
+        self._stats: dict[str, tuple[int, int, str]] = {}
+
+    @classmethod
+    def load(cls, path: Path, **kwargs) -> FragmentCache:
+        """Open the cache stored at ``path``, or start empty.
+
+        A missing, unreadable or incompatible cache file is treated as
+        empty rather than as an error.
+        """
+        cache = cls(path, **kwargs)
+        try:
+            with path.open("rb") as fh:
+                state = pickle.load(fh)
+            if state.get("version") == _CACHE_FORMAT_VERSION:
+                cache.run = state["run"]
+                cache._entries = state["entries"]
+                cache._stats = state["stats"]
+        except FileNotFoundError:
+            pass
+        except Exception as exc:  # corrupt or written by another version
+            logger.debug("Ignoring unreadable fragment cache %s: %s", path, exc)
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def begin_run(self) -> None:
+        """Start a new run; entries touched from now on count as fresh."""
+        self.run += 1
+
+    def key_for(self, path: Path) -> str:
+        """Return the cache key for a fragment file.
+
+        Uses the recorded stat fingerprint when it still matches, and
+        hashes the file content otherwise.
+        """
+        st = path.stat()
+        name = str(path.resolve())
+        known = self._stats.get(name)
+        if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+            return known[2]
+        hasher = hashlib.sha256(path.name.encode("utf-8") + b"\0")
+        hasher.update(path.read_bytes())
+        digest = hasher.hexdigest()
+        self._stats[name] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+    def get(self, key: str) -> tuple[Finding, list[str]] | None:
+        """Return a fresh copy of the cached (finding, warnings), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry[2] = self.run
+        return pickle.loads(entry[0]), list(entry[1])
+
+    def put(self, key: str, finding: Finding, warnings: list[str]) -> None:
+        """Store a validated finding under ``key``."""
+        payload = pickle.dumps(finding, protocol=pickle.HIGHEST_PROTOCOL)
+        self._entries[key] = [payload, list(warnings), self.run]
+
+    def evict(self) -> None:
+        """Apply the eviction policy to the in-memory entries."""
+        cutoff = self.run - self.max_idle_runs
+        entries = {k: e for k, e in self._entries.items() if e[2] > cutoff}
+        if len(entries) > self.max_entries:
+            newest = sorted(entries.items(), key=lambda kv: kv[1][2], reverse=True)
+            entries = dict(newest[: self.max_entries])
+        self._entries = entries
+        self._stats = {p: st for p, st in self._stats.items() if st[2] in entries}
+
+    def save(self) -> None:
+        """Evict stale entries and atomically write the cache file."""
+        self.evict()
+        state = {
+            "version": _CACHE_FORMAT_VERSION,
+            "run": self.run,
+            "entries": self._entries,
+            "stats": self._stats,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("wb") as fh:
+            pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,309 @@
+"""CSV, JUnit XML and HTML report emitters sharing one traversal."""
+
+from __future__ import annotations
+
+import csv
+import html
+import re
+from abc import ABC, abstractmethod
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TextIO
+
+from .model import FileRef, Finding, Status, TestCoverage, VerificationReport
+from .render import _fmt_resolution, _fmt_status, _fmt_test_cov, _pct, _view
+from .view import ReportView
+
+# ---------------------------------------------------------------------------
+# Emitters
+# ---------------------------------------------------------------------------
+
+
+class _Emitter(ABC):
+    """Writes one output format; ``finding`` is called once per V-item."""
+
+    def __init__(self, out: TextIO, view: ReportView) -> None:
+        self.out = out
+        self.view = view
+
+    def begin(self) -> None:
+        pass
+
+    @abstractmethod
+    def finding(self, f: Finding) -> None:
+        """Write one V-item."""
+
+    def end(self) -> None:
+        pass
+
+
+# Characters an XML attribute value must escape beyond html.escape(): raw
+# whitespace would be normalised to spaces by XML parsers
+_XML_ATTR_WHITESPACE = str.maketrans({"\n": "&#10;", "\r": "&#13;", "\t": "&#9;"})
+
+
+# Characters XML 1.0 forbids outright, even escaped; html.escape() keeps them
+_XML_INVALID_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+def _xml_text(value: str) -> str:
+    """Escape ``value`` for XML character data.
+
+    Characters XML cannot represent are replaced with U+FFFD, so one
+    stray control character in agent-written text cannot make the whole
+    file unparseable.
+    """
+    return html.escape(_XML_INVALID_CHARS.sub("\ufffd", value), quote=False)
+
+
+def _quoteattr(value: str) -> str:
+    """Escape and double-quote ``value`` for use as an XML attribute."""
+    value = _XML_INVALID_CHARS.sub("\ufffd", value)
+    return '"' + html.escape(value, quote=True).translate(_XML_ATTR_WHITESPACE) + '"'
+
+
+# JUnit consumers expect an ISO 8601 datetime; reports carry a plain date
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _refs(refs: list[FileRef]) -> str:
+    return "; ".join(f"{r.path}:{r.lines}" if r.lines else r.path for r in refs)
+
+
+class _CsvEmitter(_Emitter):
+    """One row per V-item with raw enum values, for spreadsheets and importers."""
+
+    COLUMNS = (
+        "v_item_id",
+        "fragment_id",
+        "section_ref",
+        "title",
+        "moscow",
+        "status",
+        "test_coverage",
+        "previous_status",
+        "resolution",
+        "implementation_files",
+        "tests",
+        "missing_implementation",
+        "missing_tests",
+    )
+
+    def begin(self) -> None:
+        self.writer = csv.writer(self.out, lineterminator="\n")
+        self.writer.writerow(self.COLUMNS)
+
+    def finding(self, f: Finding) -> None:
+        self.writer.writerow(
+            (
+                f.v_item_id,
+                f.fragment_id,
+                f.section_ref,
+                f.title,
+                f.moscow.value,
+                f.status.value,
+                f.test_coverage.value,
+                f.previous_status.value if f.previous_status is not None else "",
+                f.resolution.value if f.resolution is not None else "",
+                _refs(f.implementation.files),
+                _refs(f.tests),
+                "; ".join(f.missing_implementation),
+                "; ".join(f.missing_tests),
+            )
+        )
+
+
+class _JUnitEmitter(_Emitter):
+    """One testcase per V-item.
+
+    A V-item passes when it is implemented with full test coverage, is
+    skipped when N/A, and fails otherwise.
+    """
+
+    def begin(self) -> None:
+        view = self.view
+        passed = view.implemented - len(view.untested_implemented)
+        skipped = len(view.findings) - view.non_na
+        failures = view.non_na - passed
+        name = _quoteattr(view.report.metadata.project_name)
+        counts = (
+            f'tests="{len(view.findings)}" failures="{failures}" '
+            f'errors="0" skipped="{skipped}"'
+        )
+        self.out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.out.write(f"<testsuites name={name} {counts}>\n")
+        date = view.report.metadata.date
+        timestamp = ""
+        if _ISO_DATE.fullmatch(date):
+            timestamp = f' timestamp="{date}T00:00:00"'
+        self.out.write(f"  <testsuite name={name} {counts}{timestamp}>\n")
+
+    def finding(self, f: Finding) -> None:
+        case = (
+            f"    <testcase classname={_quoteattr(f.section_ref)} "
+            f"name={_quoteattr(f'{f.v_item_id} {f.title}')}"
+        )
+        if f.status == Status.NA:
+            self.out.write(f"{case}>\n      <skipped/>\n    </testcase>\n")
+            return
+        if f.status == Status.IMPLEMENTED and f.test_coverage == TestCoverage.FULL:
+            self.out.write(f"{case}/>\n")
+            return
+
+        message = (
+            f"{_fmt_status(f.status)}; test coverage: {_fmt_test_cov(f.test_coverage)}"
+        )
+        details = [f"Spec says: {f.requirement_text}"]
+        details += [f"Missing implementation: {m}" for m in f.missing_implementation]
+        details += [f"Missing test: {m}" for m in f.missing_tests]
+        if f.resolution is not None:
+            details.append(f"Resolution: {_fmt_resolution(f.resolution)}")
+        self.out.write(
+            f"{case}>\n"
+            f"      <failure message={_quoteattr(message)} "
+            f"type={_quoteattr(f.status.value)}>"
+            f"{_xml_text(chr(10).join(details))}</failure>\n"
+            "    </testcase>\n"
+        )
+
+    def end(self) -> None:
+        self.out.write("  </testsuite>\n</testsuites>\n")
+
+
+_HTML_STYLE = """\
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; }
+th, td { border: 1px solid #ccc; padding: 0.3em 0.6em; text-align: left; }
+th { background: #f0f0f0; }
+tr.implemented td.status { background: #dff0d8; }
+tr.partial td.status { background: #fcf8e3; }
+tr.not_implemented td.status { background: #f2dede; }
+tr.na { color: #888; }
+"""
+
+
+_COVERAGE_KEYS = ("full", "partial", "none")
+
+
+class _HtmlEmitter(_Emitter):
+    """A static, self-contained page: metadata, scorecard and findings table."""
+
+    def begin(self) -> None:
+        view = self.view
+        meta = view.report.metadata
+        stats = view.report.statistics
+        esc = html.escape
+        title = esc(f"Implementation Verification: {meta.project_name}")
+        out = self.out
+        out.write(
+            "<!DOCTYPE html>\n"
+            '<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{title}</title>\n<style>\n{_HTML_STYLE}</style>\n"
+            f"</head>\n<body>\n<h1>{title}</h1>\n<dl>\n"
+        )
+        header = [
+            ("Spec", meta.spec_path),
+            ("Implementation", meta.implementation_path),
+            ("Date", meta.date),
+            ("Run", str(meta.run)),
+        ]
+        if meta.spec_version:
+            header.append(("Spec Version", meta.spec_version))
+        if meta.previous_report:
+            header.append(("Previous Verification", meta.previous_report))
+        for term, value in header:
+            out.write(f"<dt>{term}</dt><dd>{esc(value)}</dd>\n")
+        out.write("</dl>\n")
+
+        full = stats.test_coverage.get("full", 0)
+        testable = sum(stats.test_coverage.get(k, 0) for k in _COVERAGE_KEYS)
+        rows = [
+            (
+                "Requirements Implemented",
+                f"{view.implemented} / {view.non_na} "
+                f"({_pct(view.implemented, view.non_na)})",
+            ),
+            ("Fully Tested", f"{full} / {testable} ({_pct(full, testable)})"),
+            ("Critical Gaps", str(view.critical_gaps)),
+        ]
+        out.write("<h2>Scorecard</h2>\n<table>\n")
+        for metric, score in rows:
+            out.write(f"<tr><th>{metric}</th><td>{esc(score)}</td></tr>\n")
+        out.write("</table>\n<h2>Findings</h2>\n<table>\n<tr>")
+        columns = ["V-Item", "Section", "Requirement", "MoSCoW", "Status", "Tests"]
+        if view.is_reverify:
+            columns.append("Resolution")
+        columns += ["Missing Implementation", "Missing Tests"]
+        out.write("".join(f"<th>{c}</th>" for c in columns))
+        out.write("</tr>\n")
+
+    def finding(self, f: Finding) -> None:
+        esc = html.escape
+        cells = [
+            f"<td>{esc(f.v_item_id)}</td>",
+            f"<td>{esc(f.section_ref)}</td>",
+            f"<td>{esc(f.title)}</td>",
+            f"<td>{f.moscow.value}</td>",
+            f'<td class="status">{_fmt_status(f.status)}</td>',
+            f"<td>{_fmt_test_cov(f.test_coverage)}</td>",
+        ]
+        if self.view.is_reverify:
+            cells.append(f"<td>{_fmt_resolution(f.resolution)}</td>")
+        for missing in (f.missing_implementation, f.missing_tests):
+            cells.append(f"<td>{'<br>'.join(esc(m) for m in missing)}</td>")
+        self.out.write(f'<tr class="{f.status.value}">{"".join(cells)}</tr>\n')
+
+    def end(self) -> None:
+        self.out.write("</table>\n</body>\n</html>\n")
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+# Format name -> (file suffix replacing the report's .json, emitter)
+REPORT_FORMATS: dict[str, tuple[str, type[_Emitter]]] = {
+    "csv": (".csv", _CsvEmitter),
+    "junit": (".junit.xml", _JUnitEmitter),
+    "html": (".html", _HtmlEmitter),
+}
+
+
+def write_report_formats(
+    report: VerificationReport | ReportView,
+    output: Path,
+    formats: list[str] | tuple[str, ...],
+) -> list[Path]:
+    """Write the report in each of ``formats`` next to ``output``.
+
+    Every format is streamed to its own file during a single traversal of
+    the findings in V-item order. Files are named after ``output`` with
+    the format's suffix (``verify.json`` -> ``verify.csv``,
+    ``verify.junit.xml``, ``verify.html``). Returns the written paths.
+
+    Raises:
+        ValueError: If a format is not in ``REPORT_FORMATS``.
+    """
+    unknown = [name for name in formats if name not in REPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"unknown report format(s): {', '.join(unknown)}")
+
+    view = _view(report)
+    paths: list[Path] = []
+    emitters: list[_Emitter] = []
+    with ExitStack() as stack:
+        for name in dict.fromkeys(formats):
+            suffix, emitter_cls = REPORT_FORMATS[name]
+            path = output.with_suffix(suffix)
+            out = stack.enter_context(path.open("w", encoding="utf-8", newline=""))
+            emitters.append(emitter_cls(out, view))
+            paths.append(path)
+
+        for emitter in emitters:
+            emitter.begin()
+        for f in view.findings:
+            for emitter in emitters:
+                emitter.finding(f)
+        for emitter in emitters:
+            emitter.end()
+    return paths
@@ -0,0 +1,290 @@
+"""Lazy, index-backed loading of large reports."""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import re
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from ._json import _json_loads
+from .load import _finding_from_dict
+from .model import (
+    Finding,
+    ItemDelta,
+    PriorityGap,
+    ReportMetadata,
+    ResolutionSummary,
+    Statistics,
+    VerificationReport,
+)
+from .report import _report_header
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Lazy, index-backed report loading
+# ---------------------------------------------------------------------------
+
+REPORT_INDEX_SUFFIX = ".idx"
+
+_REPORT_INDEX_VERSION = 2
+
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+
+
+class FindingIndexEntry(NamedTuple):
+    """Byte span and lookup keys of one finding inside a report file."""
+
+    start: int
+    end: int
+    fragment_id: str
+    section_ref: str
+    v_item_id: str
+    status: str
+    test_coverage: str
+
+
+def _scan_report(text: str) -> tuple[dict, list[tuple[int, int, dict]]]:
+    """Split a report's JSON text into its header and per-finding spans.
+
+    Walks the top-level object key by key. Every value except ``findings``
+    is decoded into the header; each element of ``findings`` is decoded
+    once and returned with its character span.
+    """
+    decoder = json.JSONDecoder()
+
+    def skip(pos: int) -> int:
+        return _JSON_WS.match(text, pos).end()
+
+    def expect(pos: int, char: str) -> int:
+        if text[pos : pos + 1] != char:
+            raise ValueError(f"expected {char!r} at offset {pos}")
+        return pos + 1
+
+    header: dict = {}
+    findings: list[tuple[int, int, dict]] = []
+    pos = expect(skip(0), "{")
+    pos = skip(pos)
+    if text[pos : pos + 1] == "}":
+        return header, findings
+
+    while True:
+        key, pos = decoder.raw_decode(text, skip(pos))
+        pos = skip(expect(skip(pos), ":"))
+        if key == "findings":
+            pos = skip(expect(pos, "["))
+            if text[pos : pos + 1] == "]":
+                pos += 1
+            else:
+                while True:
+                    start = pos
+                    value, pos = decoder.raw_decode(text, pos)
+                    findings.append((start, pos, value))
+                    pos = skip(pos)
+                    if text[pos : pos + 1] == "]":
+                        pos += 1
+                        break
+                    pos = skip(expect(pos, ","))
+        else:
+            header[key], pos = decoder.raw_decode(text, pos)
+        pos = skip(pos)
+        if text[pos : pos + 1] == "}":
+            return header, findings
+        pos = expect(pos, ",")
+
+
+def build_report_index(path: Path) -> dict:
+    """Scan a report file and return its sidecar index.
+
+    The index holds the decoded header (everything except findings), the
+    source file's size and mtime for staleness checks, and one
+    ``FindingIndexEntry`` row per finding with byte offsets into the file.
+    """
+    raw = path.read_bytes()
+    text = raw.decode("utf-8")
+    header, spans = _scan_report(text)
+
+    rows = []
+    char_pos = 0
+    byte_pos = 0
+    for start, end, fd in spans:
+        # Convert character offsets to byte offsets incrementally
+        byte_pos += len(text[char_pos:start].encode("utf-8"))
+        byte_start = byte_pos
+        byte_pos += len(text[start:end].encode("utf-8"))
+        char_pos = end
+        rows.append(
+            [
+                byte_start,
+                byte_pos,
+                fd.get("fragment_id", ""),
+                fd.get("section_ref", ""),
+                fd.get("v_item_id", ""),
+                fd.get("status", ""),
+                fd.get("test_coverage", ""),
+            ]
+        )
+
+    st = path.stat()
+    return {
+        "version": _REPORT_INDEX_VERSION,
+        "source_size": st.st_size,
+        "source_mtime_ns": st.st_mtime_ns,
+        "header": header,
+        "findings": rows,
+    }
+
+
+def _read_report_index(path: Path, write_index: bool) -> dict:
+    """Return a fresh index for ``path``, reusing or refreshing the sidecar."""
+    index_path = path.with_suffix(REPORT_INDEX_SUFFIX)
+    st = path.stat()
+    try:
+        index = _json_loads(index_path.read_bytes())
+        if (
+            index.get("version") == _REPORT_INDEX_VERSION
+            and index.get("source_size") == st.st_size
+            and index.get("source_mtime_ns") == st.st_mtime_ns
+        ):
+            return index
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    index = build_report_index(path)
+    if write_index:
+        _write_report_index(path, index)
+    return index
+
+
+def _write_report_index(path: Path, index: dict) -> None:
+    """Save ``index`` as the sidecar of ``path``; failures are only logged."""
+    index_path = path.with_suffix(REPORT_INDEX_SUFFIX)
+    try:
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError as exc:
+        logger.debug("Could not write report index %s: %s", index_path, exc)
+
+
+class LazyFindings(Sequence):
+    """Read-only sequence of Findings decoded on first access.
+
+    Each finding is decoded from its byte span in a memory-mapped report
+    file and then cached. ``entries`` exposes the index rows, so callers
+    that only need ids, section refs or statuses never decode a finding.
+    Iterating, and ``decode()``, do not add to the cache, so a single pass
+    over a huge report holds one finding at a time.
+    """
+
+    def __init__(self, path: Path, entries: list[FindingIndexEntry]) -> None:
+        self.path = path
+        self.entries = entries
+        self._built: list[Finding | None] = [None] * len(entries)
+        self._file = None
+        self._map = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        finding = self._built[index]
+        if finding is None:
+            finding = self.decode(index)
+            self._built[index] = finding
+        return finding
+
+    def __iter__(self) -> Iterator[Finding]:
+        for index, finding in enumerate(self._built):
+            yield finding if finding is not None else self.decode(index)
+
+    def decode(self, index: int) -> Finding:
+        """Decode the finding at ``index`` without caching it."""
+        if self._map is None:
+            self._file = self.path.open("rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        entry = self.entries[index]
+        return _finding_from_dict(_json_loads(self._map[entry.start : entry.end]))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyFindings)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+
+class LazyVerificationReport:
+    """A saved VerificationReport whose findings are decoded on demand.
+
+    Metadata, statistics, priority gaps, the resolution summary and item
+    deltas are available immediately from the sidecar index; ``findings``
+    is a ``LazyFindings`` sequence. Attribute names and ``to_dict()`` match
+    ``VerificationReport``; use ``materialize()`` for a real one.
+    """
+
+    def __init__(self, path: Path, index: dict) -> None:
+        self.path = path
+        header = _report_header(index["header"])
+        self.schema_version: str = header["schema_version"]
+        self.report_type: str = header["report_type"]
+        self.metadata: ReportMetadata = header["metadata"]
+        self.statistics: Statistics = header["statistics"]
+        self.priority_gaps: list[PriorityGap] = header["priority_gaps"]
+        self.resolution_summary: ResolutionSummary | None = header[
+            "resolution_summary"
+        ]
+        self.deltas: list[ItemDelta] = header["deltas"]
+        self.findings = LazyFindings(
+            path, [FindingIndexEntry(*row) for row in index["findings"]]
+        )
+
+    def materialize(self) -> VerificationReport:
+        """Decode every finding and return an ordinary VerificationReport."""
+        return VerificationReport(
+            schema_version=self.schema_version,
+            report_type=self.report_type,
+            metadata=self.metadata,
+            findings=list(self.findings),
+            statistics=self.statistics,
+            priority_gaps=self.priority_gaps,
+            resolution_summary=self.resolution_summary,
+            deltas=self.deltas,
+        )
+
+    def to_dict(self) -> dict:
+        """Serialise exactly as ``VerificationReport.to_dict()`` would."""
+        return self.materialize().to_dict()
+
+    def close(self) -> None:
+        self.findings.close()
+
+    def __enter__(self) -> LazyVerificationReport:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_report_lazy(path: Path, write_index: bool = True) -> LazyVerificationReport:
+    """Open a report without decoding its findings.
+
+    Uses the ``<report>.idx`` sidecar when it matches the report's size and
+    mtime; otherwise scans the report once and (if ``write_index``) saves a
+    new sidecar so later opens only read the index.
+    """
+    return LazyVerificationReport(path, _read_report_index(path, write_index))
@@ -0,0 +1,341 @@
+"""Loading fragment files into ``Finding`` objects."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._json import _json_loads
+from .model import (
+    _COVERAGE_BY_VALUE,
+    _MOSCOW_BY_VALUE,
+    _RESOLUTION_BY_VALUE,
+    _STATUS_BY_VALUE,
+    FileRef,
+    Finding,
+    Implementation,
+    MoSCoW,
+    Resolution,
+    SchemaError,
+    Status,
+    TestCoverage,
+)
+from .validate import _VALIDATOR
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .cache import FragmentCache
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+def _intern(value):
+    """Intern strings so repeated paths/descriptions share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _build_file_ref(data) -> FileRef:
+    """Build a FileRef from a dict or coerce a string.
+
+    Sub-agents sometimes write file references as plain strings
+    (e.g. "src/foo.py:30-45") instead of the expected object format.
+    This function handles both gracefully. Paths and descriptions are
+    interned: many findings reference the same handful of files.
+    """
+    if isinstance(data, str):
+        # Parse "path:lines" or just "path"
+        if ":" in data:
+            path, _, lines = data.partition(":")
+            return FileRef(
+                path=sys.intern(path.strip()), lines=lines.strip(), description=""
+            )
+        return FileRef(path=sys.intern(data.strip()), lines="", description="")
+    if isinstance(data, dict):
+        return FileRef(
+            path=_intern(data.get("path", "")),
+            lines=str(data.get("lines", "")),
+            description=_intern(data.get("description", "")),
+        )
+    # Fallback: stringify whatever it is
+    return FileRef(path=str(data), lines="", description="")
+
+
+def load_fragment(path: Path) -> Finding:
+    """Read a JSON fragment file, validate, and return a Finding dataclass.
+
+    Raises SchemaError on hard validation errors or invalid JSON.
+    Logs warnings for consistency issues.
+    """
+    finding, warnings = _load_fragment(path)
+    for w in warnings:
+        logger.warning("%s: %s", path.name, w)
+    return finding
+
+
+def _load_fragment(path: Path) -> tuple[Finding, list[str]]:
+    """Load a fragment without logging; return (finding, warnings).
+
+    Raises SchemaError on hard validation errors or invalid JSON.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+        data = _json_loads(text)
+    except (json.JSONDecodeError, ValueError) as exc:
+        raise SchemaError(f"{path.name}: invalid JSON: {exc}") from exc
+
+    return _decode_fragment(data, path.name, path.name)
+
+
+def _decode_fragment(
+    data: dict, filename: str, label: str
+) -> tuple[Finding, list[str]]:
+    """Validate a parsed fragment dict and build its Finding.
+
+    The rules and messages are those of ``FragmentValidator.check``;
+    once it passes, enum values are converted with the validator's
+    value -> member maps. ``filename`` is what ``fragment_id`` is checked
+    against; ``label`` prefixes error messages (the file name, or
+    bundle:line).
+
+    Returns (finding, warnings); raises SchemaError on hard errors.
+    """
+    errors: list[str] = []
+    warnings: list[str] = []
+    for issue in _VALIDATOR.check(data, filename):
+        (errors if issue.severity == "error" else warnings).append(issue.message)
+    if errors:
+        raise SchemaError(
+            f"{label}: validation errors:\n" + "\n".join(f"  - {e}" for e in errors)
+        )
+
+    get = data.get
+    members = {
+        name: lookup[data[name]] for name, (_, _, lookup) in _VALIDATOR.enums.items()
+    }
+    optional = {
+        name: None if get(name) is None else lookup[get(name)]
+        for name, (_, _, lookup) in _VALIDATOR.optional_enums.items()
+    }
+    impl_data = data["implementation"]
+    return (
+        Finding(
+            schema_version=data["schema_version"],
+            fragment_id=data["fragment_id"],
+            section_ref=data["section_ref"],
+            title=data["title"],
+            requirement_text=data["requirement_text"],
+            moscow=members["moscow"],
+            status=members["status"],
+            implementation=Implementation(
+                files=[_build_file_ref(f) for f in impl_data["files"]],
+                notes=impl_data.get("notes", ""),
+            ),
+            test_coverage=members["test_coverage"],
+            tests=[_build_file_ref(t) for t in data["tests"]],
+            missing_tests=data["missing_tests"],
+            missing_implementation=data["missing_implementation"],
+            notes=get("notes", ""),
+            v_item_id=get("v_item_id", ""),
+            previous_status=optional["previous_status"],
+            resolution=optional["resolution"],
+        ),
+        warnings,
+    )
+
+
+def _finding_from_dict(fd: dict) -> Finding:
+    """Build a Finding from an already-validated dict (e.g. a saved report).
+
+    No validation is performed; an unknown enum value raises ValueError
+    from the enum constructor, as before.
+    """
+    impl_data = fd.get("implementation", {})
+    previous_status = fd.get("previous_status")
+    resolution = fd.get("resolution")
+    return Finding(
+        schema_version=fd["schema_version"],
+        fragment_id=fd["fragment_id"],
+        section_ref=fd["section_ref"],
+        title=fd["title"],
+        requirement_text=fd["requirement_text"],
+        moscow=_MOSCOW_BY_VALUE.get(fd["moscow"]) or MoSCoW(fd["moscow"]),
+        status=_STATUS_BY_VALUE.get(fd["status"]) or Status(fd["status"]),
+        implementation=Implementation(
+            files=[_build_file_ref(f) for f in impl_data.get("files", [])],
+            notes=impl_data.get("notes", ""),
+        ),
+        test_coverage=(
+            _COVERAGE_BY_VALUE.get(fd["test_coverage"])
+            or TestCoverage(fd["test_coverage"])
+        ),
+        tests=[_build_file_ref(t) for t in fd.get("tests", [])],
+        missing_tests=fd.get("missing_tests", []),
+        missing_implementation=fd.get("missing_implementation", []),
+        notes=fd.get("notes", ""),
+        v_item_id=fd.get("v_item_id", ""),
+        previous_status=(
+            None
+            if previous_status is None
+            else _STATUS_BY_VALUE.get(previous_status) or Status(previous_status)
+        ),
+        resolution=(
+            None
+            if resolution is None
+            else _RESOLUTION_BY_VALUE.get(resolution) or Resolution(resolution)
+        ),
+    )
+
+
+def _ingest_fragment(path: Path) -> tuple[Finding | None, list[str], str | None]:
+    """Load one fragment for ``load_fragments``; return (finding, warnings, error).
+
+    Runs inside pool workers, so errors are returned as strings and
+    warnings are handed back to the parent for logging.
+    """
+    try:
+        finding, warnings = _load_fragment(path)
+    except SchemaError as exc:
+        return None, [], str(exc)
+    return finding, warnings, None
+
+
+def _resolve_jobs(jobs: int | None) -> int:
+    """Normalise a ``jobs`` argument: ``None`` or 0 means one per CPU."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def load_fragments(
+    paths: list[Path],
+    jobs: int | None = 1,
+    cache: FragmentCache | None = None,
+    bundle: Path | None = None,
+) -> list[Finding]:
+    """Load many fragment files, optionally in parallel.
+
+    Findings are returned in the order of ``paths`` regardless of which
+    worker finished first. With ``jobs`` > 1 the files are parsed and
+    validated in a process pool (JSON decoding is CPU-bound, so threads
+    would serialise on the GIL); ``jobs`` of 0 or ``None`` uses one
+    worker per CPU. Warnings are logged in path order by the caller's
+    process.
+
+    If a ``cache`` is given, unchanged fragments are served from it and
+    only new or modified files are parsed; freshly loaded fragments are
+    added to it. Saving the cache is left to the caller.
+
+    If a ``bundle`` is given, its latest record per fragment_id is merged
+    in; a per-file fragment supersedes a bundle record with the same id.
+    The merged list is ordered by the per-file name ``<fragment_id>.json``.
+
+    Raises:
+        SchemaError: Listing every fragment that failed, in output order.
+    """
+    if cache is not None:
+        cache.begin_run()
+    results = load_fragment_results(paths, jobs, cache)
+    labelled = [(p.name, p.name, *r) for p, r in zip(paths, results)]
+
+    if bundle is not None:
+        from .bundle import _ingest_bundle  # bundle imports this module
+
+        file_names = {p.name for p in paths}
+        for name, label, finding, warnings, error in _ingest_bundle(bundle):
+            if name in file_names:
+                logger.warning("%s: superseded by %s", label, name)
+                continue
+            labelled.append((name, label, finding, warnings, error))
+        labelled.sort(key=lambda r: r[0])
+
+    return _collect_results([r[1:] for r in labelled])
+
+
+def load_fragment_results(
+    paths: list[Path],
+    jobs: int | None = 1,
+    cache: FragmentCache | None = None,
+    pool: Executor | None = None,
+) -> list[tuple[Finding | None, list[str], str | None]]:
+    """Return ``(finding, warnings, error)`` for each path, in path order.
+
+    Like ``load_fragments`` without logging or raising: a fragment that
+    fails has ``finding`` None and its message in ``error``. Unchanged
+    fragments are served from ``cache`` and the rest are parsed (and
+    added to it), in a process pool when ``jobs`` allows. Callers that
+    load many batches pass their own ``pool`` instead of one per call.
+    """
+    results: list[tuple[Finding | None, list[str], str | None] | None]
+    results = [None] * len(paths)
+    keys: list[str | None] = [None] * len(paths)
+
+    if cache is not None:
+        for i, path in enumerate(paths):
+            keys[i] = cache.key_for(path)
+            hit = cache.get(keys[i])
+            if hit is not None:
+                results[i] = (hit[0], hit[1], None)
+
+    pending = [i for i, r in enumerate(results) if r is None]
+    workers = min(_resolve_jobs(jobs), len(pending))
+
+    if workers <= 1:
+        loaded = [_ingest_fragment(paths[i]) for i in pending]
+    else:
+        chunksize = max(1, len(pending) // (workers * 4))
+        todo = [paths[i] for i in pending]
+        if pool is not None:
+            loaded = list(pool.map(_ingest_fragment, todo, chunksize=chunksize))
+        else:
+            # Imported here: concurrent.futures is the costliest import in
+            # the package and most runs never start a pool.
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as own_pool:
+                loaded = list(
+                    own_pool.map(_ingest_fragment, todo, chunksize=chunksize)
+                )
+
+    for i, result in zip(pending, loaded):
+        results[i] = result
+        finding, warnings, error = result
+        if cache is not None and error is None:
+            cache.put(keys[i], finding, warnings)
+
+    return results
+
+
+def _collect_results(
+    results: list[tuple[str, Finding | None, list[str], str | None]],
+) -> list[Finding]:
+    """Log warnings and aggregate errors from ``(label, finding, warnings, error)``.
+
+    Raises:
+        SchemaError: Listing every failed fragment, in the given order.
+    """
+    all_errors: list[str] = []
+    findings: list[Finding] = []
+    for label, finding, warnings, error in results:
+        if error is not None:
+            all_errors.append(error)
+            continue
+        for w in warnings:
+            logger.warning("%s: %s", label, w)
+        findings.append(finding)
+
+    if all_errors:
+        raise SchemaError(
+            "Fragment validation errors:\n" + "\n".join(f"  - {e}" for e in all_errors)
+        )
+
+    return findings
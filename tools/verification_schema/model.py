@@ -0,0 +1,245 @@
+"""Schema enums, dataclasses and ``SchemaError``."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+# ---------------------------------------------------------------------------
+# Enums
+# ---------------------------------------------------------------------------
+
+
+class Status(str, Enum):
+    IMPLEMENTED = "implemented"
+    PARTIAL = "partial"
+    NOT_IMPLEMENTED = "not_implemented"
+    NA = "na"
+
+
+class MoSCoW(str, Enum):
+    MUST = "MUST"
+    SHOULD = "SHOULD"
+    COULD = "COULD"
+    WONT = "WONT"
+
+
+class TestCoverage(str, Enum):
+    FULL = "full"
+    PARTIAL = "partial"
+    NONE = "none"
+
+
+class Resolution(str, Enum):
+    FIXED = "fixed"
+    PARTIALLY_FIXED = "partially_fixed"
+    NOT_FIXED = "not_fixed"
+    REGRESSED = "regressed"
+
+
+# ---------------------------------------------------------------------------
+# Exceptions
+# ---------------------------------------------------------------------------
+
+
+class SchemaError(Exception):
+    """Raised when a fragment fails hard validation."""
+
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Dataclasses
+# ---------------------------------------------------------------------------
+
+
+# Findings, file references and gaps exist in the hundreds of thousands when
+# loading report history, so they drop the per-instance __dict__ where the
+# running Python supports slotted dataclasses.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class FileRef:
+    path: str
+    lines: str = ""
+    description: str = ""
+
+
+@dataclass(**_SLOTS)
+class Implementation:
+    files: list[FileRef] = field(default_factory=list)
+    notes: str = ""
+
+
+@dataclass(**_SLOTS)
+class Finding:
+    schema_version: str
+    fragment_id: str
+    section_ref: str
+    title: str
+    requirement_text: str
+    moscow: MoSCoW
+    status: Status
+    implementation: Implementation
+    test_coverage: TestCoverage
+    tests: list[FileRef] = field(default_factory=list)
+    missing_tests: list[str] = field(default_factory=list)
+    missing_implementation: list[str] = field(default_factory=list)
+    notes: str = ""
+    # Re-verification fields (optional)
+    v_item_id: str = ""
+    previous_status: Status | None = None
+    resolution: Resolution | None = None
+
+
+@dataclass
+class MoSCoWBreakdown:
+    total: int = 0
+    implemented: int = 0
+    partial: int = 0
+    not_implemented: int = 0
+    na: int = 0
+
+
+@dataclass
+class Statistics:
+    total_requirements: int = 0
+    by_status: dict[str, int] = field(default_factory=dict)
+    by_moscow: dict[str, MoSCoWBreakdown] = field(default_factory=dict)
+    test_coverage: dict[str, int] = field(default_factory=dict)
+    implementation_rate: float = 0.0
+    test_rate: float = 0.0
+    must_implementation_rate: float = 0.0
+
+
+@dataclass(**_SLOTS)
+class PriorityGap:
+    priority: str
+    v_item_id: str
+    section_ref: str
+    title: str
+    moscow: str
+    status: str
+    test_coverage: str
+    reason: str
+
+
+@dataclass
+class ReportMetadata:
+    project_name: str
+    spec_path: str
+    implementation_path: str
+    date: str
+    run: int
+    previous_report: str | None = None
+    spec_version: str = ""
+    mode: str = ""
+
+
+@dataclass
+class ResolutionSummary:
+    previous_total: int
+    fixed: int
+    partially_fixed: int
+    not_fixed: int
+    regressed: int
+    new_items: int
+
+
+@dataclass(**_SLOTS)
+class ItemDelta:
+    """How one V-item's status moved between the previous and current run."""
+
+    v_item_id: str
+    section_ref: str
+    previous_status: Status | None
+    status: Status
+    resolution: Resolution | None = None
+
+
+@dataclass
+class VerificationReport:
+    schema_version: str
+    report_type: str
+    metadata: ReportMetadata
+    findings: list[Finding]
+    statistics: Statistics
+    priority_gaps: list[PriorityGap]
+    resolution_summary: ResolutionSummary | None = None
+    deltas: list[ItemDelta] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Serialise the report to a JSON-compatible dict.
+
+        Recursively converts all nested dataclasses and enums. Findings,
+        which dominate large reports, go through ``_finding_dict``.
+        """
+
+        def _serialise(obj):
+            if isinstance(obj, Enum):
+                return obj.value
+            if hasattr(obj, "__dataclass_fields__"):
+                return {
+                    k: _serialise(v)
+                    for k, v in obj.__dataclass_fields__.items()
+                    for k, v in [(k, getattr(obj, k))]
+                }
+            if isinstance(obj, list):
+                return [_serialise(item) for item in obj]
+            if isinstance(obj, dict):
+                return {k: _serialise(v) for k, v in obj.items()}
+            return obj
+
+        return {
+            k: [_finding_dict(f) for f in v] if k == "findings" else _serialise(v)
+            for k in self.__dataclass_fields__
+            for v in [getattr(self, k)]
+        }
+
+
+def _file_ref_dict(ref: FileRef) -> dict:
+    return {"path": ref.path, "lines": ref.lines, "description": ref.description}
+
+
+def _finding_dict(f: Finding) -> dict:
+    """Serialise one Finding exactly as ``VerificationReport.to_dict()`` does."""
+    return {
+        "schema_version": f.schema_version,
+        "fragment_id": f.fragment_id,
+        "section_ref": f.section_ref,
+        "title": f.title,
+        "requirement_text": f.requirement_text,
+        "moscow": f.moscow.value,
+        "status": f.status.value,
+        "implementation": {
+            "files": [_file_ref_dict(r) for r in f.implementation.files],
+            "notes": f.implementation.notes,
+        },
+        "test_coverage": f.test_coverage.value,
+        "tests": [_file_ref_dict(r) for r in f.tests],
+        "missing_tests": list(f.missing_tests),
+        "missing_implementation": list(f.missing_implementation),
+        "notes": f.notes,
+        "v_item_id": f.v_item_id,
+        "previous_status": (
+            f.previous_status.value if f.previous_status is not None else None
+        ),
+        "resolution": f.resolution.value if f.resolution is not None else None,
+    }
+
+
+_STATUS_BY_VALUE: dict[str, Status] = {e.value: e for e in Status}
+_MOSCOW_BY_VALUE: dict[str, MoSCoW] = {e.value: e for e in MoSCoW}
+_COVERAGE_BY_VALUE: dict[str, TestCoverage] = {e.value: e for e in TestCoverage}
+_RESOLUTION_BY_VALUE: dict[str, Resolution] = {e.value: e for e in Resolution}
+
+
+def _lookup_member(lookup: dict, value) -> Enum | None:
+    """Return the enum member for a raw JSON value, or None if invalid."""
+    try:
+        return lookup.get(value)
+    except TypeError:  # unhashable (list/dict) values are simply invalid
+        return None
@@ -0,0 +1,449 @@
+"""Markdown rendering of verification reports."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+from .model import (
+    FileRef,
+    Finding,
+    PriorityGap,
+    Resolution,
+    Status,
+    TestCoverage,
+    VerificationReport,
+)
+from .report import _extract_v_number
+from .view import ReportView
+
+
+# ---------------------------------------------------------------------------
+# Markdown rendering
+# ---------------------------------------------------------------------------
+
+_STATUS_DISPLAY: dict[str, str] = {
+    "implemented": "Implemented",
+    "partial": "Partial",
+    "not_implemented": "Not Implemented",
+    "na": "N/A",
+}
+
+_TEST_COV_DISPLAY: dict[str, str] = {
+    "full": "Full",
+    "partial": "Partial",
+    "none": "None",
+}
+
+_RESOLUTION_DISPLAY: dict[str, str] = {
+    "fixed": "FIXED",
+    "partially_fixed": "PARTIALLY FIXED",
+    "not_fixed": "NOT FIXED",
+    "regressed": "REGRESSED",
+}
+
+
+def _fmt_status(status: Status) -> str:
+    return _STATUS_DISPLAY.get(status.value, status.value)
+
+
+def _fmt_test_cov(tc: TestCoverage) -> str:
+    return _TEST_COV_DISPLAY.get(tc.value, tc.value)
+
+
+def _fmt_resolution(res: Resolution | None) -> str:
+    if res is None:
+        return "\u2014"
+    return _RESOLUTION_DISPLAY.get(res.value, res.value)
+
+
+def _fmt_file_ref(ref: FileRef) -> str:
+    """Format a FileRef as ``path:lines`` \u2014 description."""
+    if ref.lines:
+        code = f"`{ref.path}:{ref.lines}`"
+    else:
+        code = f"`{ref.path}`"
+    if ref.description:
+        return f"{code} \u2014 {ref.description}"
+    return code
+
+
+def _fmt_file_refs(refs: list[FileRef]) -> str:
+    if not refs:
+        return "\u2014"
+    return ", ".join(_fmt_file_ref(r) for r in refs)
+
+
+def _fmt_string_list(items: list[str]) -> str:
+    if not items:
+        return "\u2014"
+    return ", ".join(items)
+
+
+def _pct(num: int, denom: int) -> str:
+    if denom == 0:
+        return "0%"
+    return f"{round(num / denom * 100)}%"
+
+
+def render_markdown(report: VerificationReport | ReportView) -> str:
+    """Render a VerificationReport as a formatted markdown string."""
+    return "".join(f"{line}\n" for line in _markdown_lines(_view(report)))
+
+
+def write_markdown(report: VerificationReport | ReportView, out: TextIO) -> None:
+    """Stream the markdown of ``render_markdown`` to a text file handle."""
+    out.writelines(f"{line}\n" for line in _markdown_lines(_view(report)))
+
+
+def _view(report: VerificationReport | ReportView) -> ReportView:
+    return report if isinstance(report, ReportView) else ReportView(report)
+
+
+def _markdown_lines(view: ReportView) -> Iterator[str]:
+    """Yield the lines of the full report, without line terminators."""
+    yield from _header_lines(view.report)
+    yield from _summary_lines(view)
+    yield from _requirement_lines(view.findings)
+    if view.is_reverify:
+        yield from _resolution_lines(view.reverified)
+    yield from _coverage_table_lines(view.findings)
+    yield from _gap_lines(view.report.priority_gaps)
+    yield from _scorecard_lines(view)
+    if view.is_reverify:
+        yield from _still_open_lines(view.unresolved)
+    yield from _recommendation_lines(view)
+
+
+def _header_lines(report: VerificationReport) -> Iterator[str]:
+    meta = report.metadata
+    yield f"# Implementation Verification: {meta.project_name}"
+    yield ""
+    yield f"**Spec**: {meta.spec_path}"
+    yield f"**Implementation**: {meta.implementation_path}"
+    yield f"**Date**: {meta.date}"
+    if meta.spec_version:
+        yield f"**Spec Version**: {meta.spec_version}"
+    if report.resolution_summary is not None and meta.previous_report:
+        yield f"**Previous Verification**: {meta.previous_report}"
+        yield f"**Run**: {meta.run}"
+        if meta.mode:
+            yield f"**Mode**: {meta.mode}"
+    else:
+        yield "**Previous Verification**: None \u2014 initial verification"
+        yield f"**Run**: {meta.run}"
+
+
+def _summary_lines(view: ReportView) -> Iterator[str]:
+    yield ""
+    yield "## Summary"
+    yield ""
+    yield (
+        f"**Overall Implementation Status**: "
+        f"{view.implemented} of {view.non_na} requirements verified"
+    )
+    yield (
+        f"**Test Coverage**: "
+        f"{view.tested} of {view.non_na} testable requirements have tests"
+    )
+
+
+def _requirement_lines(sorted_findings: list[Finding]) -> Iterator[str]:
+    yield ""
+    yield "## Requirement-by-Requirement Verification"
+    for f in sorted_findings:
+        yield ""
+        yield f"### {f.v_item_id} \u2014 {f.section_ref} \u2014 {f.title}"
+        yield ""
+        yield f"**Spec says**: {f.requirement_text}"
+        yield f"**Status**: {_fmt_status(f.status)}"
+        yield f"**Implementation**: {_fmt_file_refs(f.implementation.files)}"
+        yield f"**Test coverage**: {_fmt_test_cov(f.test_coverage)}"
+        yield f"**Tests**: {_fmt_file_refs(f.tests)}"
+        yield f"**Missing tests**: {_fmt_string_list(f.missing_tests)}"
+
+
+def _resolution_lines(reverified: list[Finding]) -> Iterator[str]:
+    """Previous V-Item Resolution (re-verification only)."""
+    if not reverified:
+        return
+    yield ""
+    yield "## Previous V-Item Resolution"
+    yield ""
+    for f in reverified:
+        prev = _fmt_status(f.previous_status) if f.previous_status else "\u2014"
+        curr = _fmt_status(f.status)
+        res = _fmt_resolution(f.resolution)
+        yield (
+            f"- **{f.v_item_id}** \u2014 {f.section_ref} \u2014 "
+            f"{f.title}: {prev} \u2192 {curr} \u2014 {res}"
+        )
+
+
+def _coverage_table_lines(sorted_findings: list[Finding]) -> Iterator[str]:
+    yield ""
+    yield "## Test Coverage Summary"
+    yield ""
+    yield (
+        "| V-Item | Section | Requirement | Impl Status "
+        "| Test Coverage | Missing Tests |"
+    )
+    yield (
+        "|--------|---------|-------------|-------------|"
+        "---------------|---------------|"
+    )
+    for f in sorted_findings:
+        missing = _fmt_string_list(f.missing_tests)
+        yield (
+            f"| {f.v_item_id} | {f.section_ref} | {f.title} "
+            f"| {_fmt_status(f.status)} | {_fmt_test_cov(f.test_coverage)} "
+            f"| {missing} |"
+        )
+
+
+def _gap_lines(gaps: list[PriorityGap]) -> Iterator[str]:
+    """Items Requiring Tests."""
+    if not gaps:
+        return
+    yield ""
+    yield "## Items Requiring Tests"
+    yield ""
+    for i, g in enumerate(gaps, 1):
+        tag = f"[{g.priority.upper()}]"
+        yield (
+            f"{i}. {tag} {g.v_item_id} \u2014 {g.section_ref} \u2014 "
+            f"{g.title} \u2014 {g.reason}"
+        )
+
+
+def _scorecard_lines(view: ReportView) -> Iterator[str]:
+    report = view.report
+    stats = report.statistics
+    yield ""
+    if report.resolution_summary is not None:
+        rs = report.resolution_summary
+        yield "## Updated Scorecard"
+        yield ""
+        yield "| Metric | Previous | Current | Delta |"
+        yield "|--------|----------|---------|-------|"
+        prev_impl = rs.previous_total
+        curr_impl = stats.total_requirements
+        yield (
+            f"| Total Requirements | {prev_impl} | {curr_impl} "
+            f"| {curr_impl - prev_impl:+d} |"
+        )
+        yield f"| Fixed | | {rs.fixed} | |"
+        yield f"| Partially Fixed | | {rs.partially_fixed} | |"
+        yield f"| Not Fixed | | {rs.not_fixed} | |"
+        yield f"| Regressed | | {rs.regressed} | |"
+        yield f"| New Items | | {rs.new_items} | |"
+
+        # Also render the standard scorecard
+        yield ""
+
+    yield "## Scorecard"
+    yield ""
+    yield "| Metric | Score |"
+    yield "|--------|-------|"
+
+    impl_count = stats.by_status.get("implemented", 0)
+    partial_count = stats.by_status.get("partial", 0)
+    not_impl_count = stats.by_status.get("not_implemented", 0)
+    total_non_na = impl_count + partial_count + not_impl_count
+    yield (
+        f"| Requirements Implemented | {impl_count} / {total_non_na} "
+        f"({_pct(impl_count, total_non_na)}) |"
+    )
+
+    full_tested = stats.test_coverage.get("full", 0)
+    partial_tested = stats.test_coverage.get("partial", 0)
+    no_tests = stats.test_coverage.get("none", 0)
+    testable_total = full_tested + partial_tested + no_tests
+    yield (
+        f"| Fully Tested | {full_tested} / {testable_total} "
+        f"({_pct(full_tested, testable_total)}) |"
+    )
+    yield f"| Partially Tested | {partial_tested} |"
+    yield f"| No Tests | {no_tests} |"
+
+    yield f"| Critical Gaps | {view.critical_gaps} |"
+
+
+def _still_open_lines(unresolved: list[Finding]) -> Iterator[str]:
+    """Still Open (re-verification only)."""
+    if not unresolved:
+        return
+    yield ""
+    yield "## Still Open"
+    yield ""
+    for f in unresolved:
+        yield (
+            f"- **{f.v_item_id}** \u2014 {f.section_ref} \u2014 "
+            f"{f.title} \u2014 {_fmt_resolution(f.resolution)}"
+        )
+
+
+def _recommendation_lines(view: ReportView) -> Iterator[str]:
+    yield ""
+    yield "## Recommendations"
+    yield ""
+
+    rec_num = 1
+    for label, group in (
+        # Items that are implemented but missing tests
+        ("Must add tests for", view.untested_implemented),
+        ("Implementation gaps", view.not_implemented),
+        ("Partial implementations", view.partial),
+    ):
+        if group:
+            items = ", ".join(f"{f.v_item_id} ({f.section_ref})" for f in group)
+            yield f"{rec_num}. **{label}**: {items}"
+            rec_num += 1
+
+    if rec_num == 1:
+        yield (
+            "No recommendations \u2014 all requirements verified with full test coverage."
+        )
+
+
+# ---------------------------------------------------------------------------
+# Paginated markdown
+# ---------------------------------------------------------------------------
+
+MARKDOWN_INDEX_FILENAME = "index.md"
+
+_TOP_SECTION_RE = re.compile(r"^\s*\u00a7?\s*([^.\s]+)")
+
+
+def _top_section(section_ref: str) -> str:
+    """Return the top-level section of a ref: ``\u00a72.1.1`` -> ``2``."""
+    match = _TOP_SECTION_RE.match(section_ref)
+    return match.group(1) if match else "other"
+
+
+def _page_groups(
+    view: ReportView, page_size: int | None
+) -> list[tuple[str, str, list[int]]]:
+    """Split the view's findings into ``(filename, label, positions)`` pages.
+
+    Without ``page_size`` there is one page per top-level section, in order
+    of each section's first V-item; otherwise consecutive chunks of
+    ``page_size`` V-items, numbered from 1. Pages hold positions in
+    ``view.findings`` (see ``ReportView.select``), so a lazy report is not
+    decoded into memory to group it.
+    """
+    count = len(view.findings)
+    if page_size:
+        pages = []
+        for n, start in enumerate(range(0, count, page_size), 1):
+            positions = list(range(start, min(start + page_size, count)))
+            pages.append((f"page-{n}.md", f"Page {n}", positions))
+        return pages
+
+    sections: dict[str, list[int]] = {}
+    for i, f in enumerate(view.findings):
+        sections.setdefault(_top_section(f.section_ref), []).append(i)
+    return [
+        (f"section-{re.sub(r'[^A-Za-z0-9_-]+', '-', key)}.md", f"\u00a7{key}", group)
+        for key, group in sections.items()
+    ]
+
+
+def _v_item_ranges(findings: Iterable[Finding]) -> str:
+    """The V-item ids of ``findings`` as runs, e.g. ``V1\u2013V3, V7``.
+
+    Ids are not contiguous after re-verification, so a first\u2013last range
+    would claim V-items that are on other pages.
+    """
+    runs: list[list[int]] = []
+    for f in findings:
+        number = _extract_v_number(f.v_item_id)
+        if runs and number == runs[-1][1] + 1:
+            runs[-1][1] = number
+        else:
+            runs.append([number, number])
+    return ", ".join(
+        f"V{first}" if first == last else f"V{first}\u2013V{last}"
+        for first, last in runs
+    )
+
+
+def write_markdown_pages(
+    report: VerificationReport | ReportView,
+    directory: Path,
+    page_size: int | None = None,
+) -> list[Path]:
+    """Write the report as an index page plus one page per slice of V-items.
+
+    ``index.md`` holds the header, summary, page list, items requiring
+    tests, scorecard, still-open items and recommendations. Each page holds
+    the full requirement entries, resolution lines and coverage table rows
+    for one top-level spec section (\u00a7N), or for ``page_size`` consecutive
+    V-items if given. Pages are streamed to disk one at a time; markdown
+    files left in ``directory`` by an earlier run are removed.
+
+    Returns the written paths, index first.
+    """
+    view = _view(report)
+    directory.mkdir(parents=True, exist_ok=True)
+    pages = _page_groups(view, page_size)
+
+    index_path = directory / MARKDOWN_INDEX_FILENAME
+    with index_path.open("w", encoding="utf-8") as out:
+        out.writelines(f"{line}\n" for line in _index_lines(view, pages))
+    written = [index_path]
+
+    title = f"# Implementation Verification: {view.report.metadata.project_name}"
+    for filename, label, positions in pages:
+        findings = view.select(positions)
+        path = directory / filename
+        with path.open("w", encoding="utf-8") as out:
+            out.write(f"{title} \u2014 {label}\n\n")
+            out.write(f"[Index]({MARKDOWN_INDEX_FILENAME})\n")
+            out.writelines(f"{line}\n" for line in _requirement_lines(findings))
+            if view.is_reverify:
+                reverified = view.select(
+                    [
+                        p
+                        for p, f in zip(positions, findings)
+                        if f.previous_status is not None
+                    ]
+                )
+                out.writelines(f"{line}\n" for line in _resolution_lines(reverified))
+            out.writelines(f"{line}\n" for line in _coverage_table_lines(findings))
+        written.append(path)
+
+    keep = {p.name for p in written}
+    for stale in directory.glob("*.md"):
+        if stale.name not in keep:
+            stale.unlink()
+    return written
+
+
+def _index_lines(
+    view: ReportView, pages: list[tuple[str, str, list[int]]]
+) -> Iterator[str]:
+    yield from _header_lines(view.report)
+    yield from _summary_lines(view)
+
+    yield ""
+    yield "## Pages"
+    yield ""
+    yield "| Page | V-Items | Requirements | Not Implemented | Partial |"
+    yield "|------|---------|--------------|-----------------|---------|"
+    for filename, label, positions in pages:
+        findings = view.select(positions)
+        v_items = _v_item_ranges(findings)
+        not_impl = sum(1 for f in findings if f.status == Status.NOT_IMPLEMENTED)
+        partial = sum(1 for f in findings if f.status == Status.PARTIAL)
+        yield (
+            f"| [{label}]({filename}) | {v_items} | {len(findings)} "
+            f"| {not_impl} | {partial} |"
+        )
+
+    yield from _gap_lines(view.report.priority_gaps)
+    yield from _scorecard_lines(view)
+    if view.is_reverify:
+        yield from _still_open_lines(view.unresolved)
+    yield from _recommendation_lines(view)
@@ -0,0 +1,509 @@
+"""V-item mapping, resolution inference and report assembly."""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from ._json import _json_loads
+from .bundle import FRAGMENT_BUNDLE_FILENAME
+from .load import _finding_from_dict, load_fragments
+from .model import (
+    _COVERAGE_BY_VALUE,
+    _RESOLUTION_BY_VALUE,
+    _STATUS_BY_VALUE,
+    Finding,
+    ItemDelta,
+    MoSCoWBreakdown,
+    PriorityGap,
+    ReportMetadata,
+    Resolution,
+    ResolutionSummary,
+    Statistics,
+    Status,
+    TestCoverage,
+    VerificationReport,
+    _lookup_member,
+)
+from .stats import classify_priority_gaps, compute_statistics
+
+if TYPE_CHECKING:
+    from .cache import FragmentCache
+    from .lazy import LazyVerificationReport
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# V-item ID assignment and re-verification mapping
+# ---------------------------------------------------------------------------
+
+
+def assign_v_items(findings: list[Finding]) -> None:
+    """Assign sequential V-item IDs (V1, V2, ...) to findings.
+
+    Sorts by fragment_id (lexicographic) for deterministic ordering,
+    then assigns V1, V2, ... in that order. Modifies findings in-place.
+    """
+    sorted_findings = sorted(findings, key=lambda f: f.fragment_id)
+    for i, finding in enumerate(sorted_findings, start=1):
+        finding.v_item_id = f"V{i}"
+
+
+def _extract_v_number(v_item_id: str) -> int:
+    """Extract the numeric part from a v_item_id like 'V5' -> 5.
+
+    Returns 0 if the ID doesn't match the expected format.
+    """
+    if v_item_id.startswith("V") and v_item_id[1:].isdigit():
+        return int(v_item_id[1:])
+    return 0
+
+
+class ReportIndex:
+    """Lookup tables over one report's findings, built in a single pass.
+
+    Items are keyed by ``section_ref``, ``v_item_id`` and ``fragment_id``.
+    They only need those attributes and ``status``, so lazy-report index
+    entries work as well as Findings. When several items share a
+    ``section_ref``, the last one carrying a V-item ID wins, matching how
+    V-item IDs have always been carried forward.
+    """
+
+    def __init__(self, items: Iterable) -> None:
+        self.by_section_ref: dict[str, object] = {}
+        self.by_v_item: dict[str, object] = {}
+        self.by_fragment_id: dict[str, object] = {}
+        self.max_v_number = 0
+        self._count = 0
+        for item in items:
+            self._count += 1
+            if item.v_item_id or item.section_ref not in self.by_section_ref:
+                self.by_section_ref[item.section_ref] = item
+            if item.v_item_id:
+                self.by_v_item[item.v_item_id] = item
+                num = _extract_v_number(item.v_item_id)
+                if num > self.max_v_number:
+                    self.max_v_number = num
+            self.by_fragment_id[item.fragment_id] = item
+
+    def __len__(self) -> int:
+        return self._count
+
+    def carried_v_item(self, section_ref: str) -> str:
+        """Return the V-item ID to carry forward for ``section_ref``, or ""."""
+        item = self.by_section_ref.get(section_ref)
+        return item.v_item_id if item is not None else ""
+
+    def previous_state(
+        self, v_item_id: str
+    ) -> tuple[Status | None, TestCoverage | None]:
+        """Return the recorded status and test coverage of a V-item.
+
+        Both are None when the V-item was not in the report.
+        """
+        item = self.by_v_item.get(v_item_id)
+        if item is None:
+            return None, None
+        return (
+            _lookup_member(_STATUS_BY_VALUE, item.status),
+            _lookup_member(_COVERAGE_BY_VALUE, item.test_coverage),
+        )
+
+
+def map_v_items_from_previous(
+    new_findings: list[Finding],
+    previous_findings: list[Finding] | ReportIndex,
+) -> None:
+    """Map V-item IDs from previous findings to new findings by section_ref.
+
+    For each new finding whose section_ref matches a previous finding,
+    the previous v_item_id is carried forward. New findings with no match
+    get the next available sequential ID (continuing from the max existing
+    numeric ID). Unmatched findings are assigned in fragment_id sort order
+    for determinism. Modifies new_findings in-place.
+
+    ``previous_findings`` may be a prebuilt ``ReportIndex``; otherwise one
+    is built from it (Findings or lazy-report index entries).
+    """
+    if isinstance(previous_findings, ReportIndex):
+        prev_index = previous_findings
+    else:
+        prev_index = ReportIndex(previous_findings)
+    max_id = prev_index.max_v_number
+
+    # First pass: carry forward matched IDs, track which IDs are used
+    unmatched: list[Finding] = []
+    for f in new_findings:
+        carried = prev_index.carried_v_item(f.section_ref)
+        if carried:
+            f.v_item_id = carried
+            num = _extract_v_number(f.v_item_id)
+            if num > max_id:
+                max_id = num
+        else:
+            unmatched.append(f)
+
+    # Second pass: assign new IDs to unmatched in fragment_id sort order
+    unmatched.sort(key=lambda f: f.fragment_id)
+    next_id = max_id + 1
+    for f in unmatched:
+        f.v_item_id = f"V{next_id}"
+        next_id += 1
+
+
+# ---------------------------------------------------------------------------
+# Resolution inference
+# ---------------------------------------------------------------------------
+
+# Progress scores used to compare two open states of the same V-item
+_IMPL_PROGRESS: dict[Status, int] = {
+    Status.NOT_IMPLEMENTED: 0,
+    Status.PARTIAL: 1,
+    Status.IMPLEMENTED: 2,
+}
+_TEST_PROGRESS: dict[TestCoverage, int] = {
+    TestCoverage.NONE: 0,
+    TestCoverage.PARTIAL: 1,
+    TestCoverage.FULL: 2,
+}
+
+
+def infer_resolution(
+    previous_status: Status | None,
+    previous_coverage: TestCoverage | None,
+    status: Status,
+    test_coverage: TestCoverage,
+) -> Resolution | None:
+    """Derive a V-item's resolution from its previous and current state.
+
+    An item is *closed* when it is implemented with full test coverage and
+    *open* otherwise. Transition table:
+
+    ===================  ===================  ==========================
+    previous             current              resolution
+    ===================  ===================  ==========================
+    absent (new item)    any                  None
+    N/A                  any                  None
+    any                  N/A                  None
+    closed               closed               None (nothing to resolve)
+    open                 closed               FIXED
+    closed               open                 REGRESSED
+    open                 open, more progress  PARTIALLY_FIXED
+    open                 open, same progress  NOT_FIXED
+    open                 open, less progress  REGRESSED
+    ===================  ===================  ==========================
+
+    Progress is the implementation score (not implemented 0, partial 1,
+    implemented 2) plus the test score (none 0, partial 1, full 2).
+    """
+    if previous_status is None or previous_coverage is None:
+        return None
+    if Status.NA in (previous_status, status):
+        return None
+
+    was_closed = (
+        previous_status == Status.IMPLEMENTED
+        and previous_coverage == TestCoverage.FULL
+    )
+    is_closed = status == Status.IMPLEMENTED and test_coverage == TestCoverage.FULL
+    if was_closed:
+        return None if is_closed else Resolution.REGRESSED
+    if is_closed:
+        return Resolution.FIXED
+
+    before = _IMPL_PROGRESS[previous_status] + _TEST_PROGRESS[previous_coverage]
+    after = _IMPL_PROGRESS[status] + _TEST_PROGRESS[test_coverage]
+    if after > before:
+        return Resolution.PARTIALLY_FIXED
+    if after == before:
+        return Resolution.NOT_FIXED
+    return Resolution.REGRESSED
+
+
+def reconcile_resolution(finding: Finding, prev_index: ReportIndex) -> list[str]:
+    """Fill in ``previous_status`` and ``resolution`` from the previous run.
+
+    Looks up the finding's (carried-forward) V-item in ``prev_index`` and
+    applies ``infer_resolution``. Values the agent already supplied are
+    kept; if they disagree with the inferred ones a warning is returned.
+    Modifies ``finding`` in-place.
+    """
+    warnings: list[str] = []
+    previous_status, previous_coverage = prev_index.previous_state(finding.v_item_id)
+    if previous_status is None:
+        return warnings
+    resolution = infer_resolution(
+        previous_status, previous_coverage, finding.status, finding.test_coverage
+    )
+
+    label = f"{finding.v_item_id} ({finding.fragment_id})"
+    for attr, inferred in (
+        ("previous_status", previous_status),
+        ("resolution", resolution),
+    ):
+        supplied = getattr(finding, attr)
+        if supplied is None:
+            setattr(finding, attr, inferred)
+        elif supplied != inferred:
+            shown = inferred.value if inferred is not None else "none"
+            warnings.append(
+                f"{label}: keeping agent-supplied {attr} '{supplied.value}'; "
+                f"the previous report implies '{shown}'"
+            )
+    return warnings
+
+
+# ---------------------------------------------------------------------------
+# Report assembly
+# ---------------------------------------------------------------------------
+
+_REPORT_SCHEMA_VERSION = "1.0.0"
+
+
+def assemble_report(
+    fragments_dir: Path,
+    project_name: str,
+    spec_path: str,
+    impl_path: str,
+    previous_report_path: Path | None = None,
+    spec_version: str = "",
+    date: str | None = None,
+    jobs: int | None = 1,
+    cache: FragmentCache | None = None,
+    previous_report: LazyVerificationReport | None = None,
+) -> VerificationReport:
+    """Assemble a VerificationReport from fragment JSON files.
+
+    Args:
+        fragments_dir: Directory containing ``*.json`` fragment files
+            and/or a ``fragments.ndjson`` bundle.
+        project_name: Human-readable project name.
+        spec_path: Path to the specification directory/file.
+        impl_path: Path to the implementation root.
+        previous_report_path: Optional path to a previous report JSON for
+            re-verification mode.
+        spec_version: Optional spec version string.
+        date: Report date as ``YYYY-MM-DD``; defaults to today.
+        jobs: Number of worker processes used to load fragments; 0 or
+            ``None`` means one per CPU. See ``load_fragments``.
+        cache: Optional FragmentCache; unchanged fragments are served from
+            it instead of being re-parsed. The caller saves it.
+        previous_report: The already-open report at
+            ``previous_report_path``, for callers that keep it between
+            runs; opened from the path when omitted.
+
+    Returns:
+        Fully populated VerificationReport.
+
+    Raises:
+        SchemaError: If any fragment has hard validation errors.
+    """
+    # Collect and validate fragments
+    fragment_paths = sorted(fragments_dir.glob("*.json"))
+    bundle_path = fragments_dir / FRAGMENT_BUNDLE_FILENAME
+    findings = load_fragments(
+        fragment_paths,
+        jobs=jobs,
+        cache=cache,
+        bundle=bundle_path if bundle_path.is_file() else None,
+    )
+    return build_report(
+        findings,
+        project_name,
+        spec_path,
+        impl_path,
+        previous_report_path=previous_report_path,
+        spec_version=spec_version,
+        date=date,
+        previous_report=previous_report,
+    )
+
+
+def build_report(
+    findings: list[Finding],
+    project_name: str,
+    spec_path: str,
+    impl_path: str,
+    previous_report_path: Path | None = None,
+    spec_version: str = "",
+    date: str | None = None,
+    previous_report: LazyVerificationReport | None = None,
+    log_warnings: bool = True,
+) -> VerificationReport:
+    """Build a VerificationReport from already loaded findings.
+
+    This is ``assemble_report`` after loading: V-item assignment,
+    resolutions, deltas, statistics and priority gaps. The findings are
+    modified in-place and kept in the given order. Arguments are as for
+    ``assemble_report``; with ``log_warnings=False`` the resolution
+    reconciliation warnings are not logged (e.g. for a partial report
+    built before the final one).
+    """
+    # Determine report type and handle V-item assignment
+    report_type = "initial"
+    run = 1
+    resolution_summary: ResolutionSummary | None = None
+    deltas: list[ItemDelta] = []
+    previous_report_str: str | None = None
+    mode = ""
+
+    if previous_report_path is not None:
+        # Only ids and section refs of previous findings are needed, which
+        # the lazy report's index provides without decoding any finding.
+        prev_report = previous_report
+        if prev_report is None:
+            from .lazy import load_report_lazy  # lazy imports this module
+
+            prev_report = load_report_lazy(previous_report_path)
+        prev_findings = prev_report.findings.entries
+        previous_report_str = str(previous_report_path)
+        run = prev_report.metadata.run + 1
+        mode = "delta"
+        report_type = "reverify_delta"
+
+        prev_index = ReportIndex(prev_findings)
+        map_v_items_from_previous(findings, prev_index)
+
+        # Infer resolutions, then compute the resolution summary and
+        # per-item deltas in one pass
+        resolutions: Counter = Counter()
+        new_items = 0
+        for f in findings:
+            warnings = reconcile_resolution(f, prev_index)
+            if log_warnings:
+                for warning in warnings:
+                    logger.warning("%s", warning)
+            resolutions[f.resolution] += 1
+            previous_status = prev_index.previous_state(f.v_item_id)[0]
+            if (
+                f.resolution is None
+                and f.previous_status is None
+                and f.section_ref not in prev_index.by_section_ref
+            ):
+                # New finding not in previous report
+                new_items += 1
+            deltas.append(
+                ItemDelta(
+                    v_item_id=f.v_item_id,
+                    section_ref=f.section_ref,
+                    previous_status=previous_status,
+                    status=f.status,
+                    resolution=f.resolution,
+                )
+            )
+        deltas.sort(key=lambda d: _extract_v_number(d.v_item_id))
+
+        resolution_summary = ResolutionSummary(
+            previous_total=len(prev_index),
+            fixed=resolutions[Resolution.FIXED],
+            partially_fixed=resolutions[Resolution.PARTIALLY_FIXED],
+            not_fixed=resolutions[Resolution.NOT_FIXED],
+            regressed=resolutions[Resolution.REGRESSED],
+            new_items=new_items,
+        )
+    else:
+        assign_v_items(findings)
+
+    # Compute statistics and priority gaps
+    statistics = compute_statistics(findings)
+    priority_gaps = classify_priority_gaps(findings)
+
+    if date is None:
+        from datetime import date as date_cls
+
+        date = date_cls.today().isoformat()
+
+    metadata = ReportMetadata(
+        project_name=project_name,
+        spec_path=spec_path,
+        implementation_path=impl_path,
+        date=date,
+        run=run,
+        previous_report=previous_report_str,
+        spec_version=spec_version,
+        mode=mode,
+    )
+
+    return VerificationReport(
+        schema_version=_REPORT_SCHEMA_VERSION,
+        report_type=report_type,
+        metadata=metadata,
+        findings=findings,
+        statistics=statistics,
+        priority_gaps=priority_gaps,
+        resolution_summary=resolution_summary,
+        deltas=deltas,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Report loading (deserialisation)
+# ---------------------------------------------------------------------------
+
+
+def load_report(path: Path) -> VerificationReport:
+    """Load a VerificationReport from a JSON file.
+
+    This is the inverse of ``VerificationReport.to_dict()`` — it
+    reconstructs the full typed dataclass hierarchy from a dict.
+    """
+    text = path.read_text(encoding="utf-8")
+    data = _json_loads(text)
+
+    findings = [_finding_from_dict(fd) for fd in data.get("findings", [])]
+    return VerificationReport(findings=findings, **_report_header(data))
+
+
+def _report_header(data: dict) -> dict:
+    """Rebuild every VerificationReport field except ``findings`` from a dict."""
+    metadata = ReportMetadata(**data["metadata"])
+
+    # Reconstruct statistics
+    stats_data = data.get("statistics", {})
+    by_moscow: dict[str, MoSCoWBreakdown] = {}
+    for key, bd in stats_data.get("by_moscow", {}).items():
+        by_moscow[key] = MoSCoWBreakdown(**bd)
+
+    statistics = Statistics(
+        total_requirements=stats_data.get("total_requirements", 0),
+        by_status=stats_data.get("by_status", {}),
+        by_moscow=by_moscow,
+        test_coverage=stats_data.get("test_coverage", {}),
+        implementation_rate=stats_data.get("implementation_rate", 0.0),
+        test_rate=stats_data.get("test_rate", 0.0),
+        must_implementation_rate=stats_data.get("must_implementation_rate", 0.0),
+    )
+
+    # Reconstruct priority gaps
+    priority_gaps = [PriorityGap(**pg) for pg in data.get("priority_gaps", [])]
+
+    # Reconstruct resolution summary
+    resolution_summary = None
+    rs_data = data.get("resolution_summary")
+    if rs_data is not None:
+        resolution_summary = ResolutionSummary(**rs_data)
+
+    # Reconstruct per-item deltas (absent from reports written before them)
+    deltas = [
+        ItemDelta(
+            v_item_id=d["v_item_id"],
+            section_ref=d["section_ref"],
+            previous_status=_lookup_member(_STATUS_BY_VALUE, d["previous_status"]),
+            status=Status(d["status"]),
+            resolution=_lookup_member(_RESOLUTION_BY_VALUE, d.get("resolution")),
+        )
+        for d in data.get("deltas", [])
+    ]
+
+    return {
+        "schema_version": data["schema_version"],
+        "report_type": data["report_type"],
+        "metadata": metadata,
+        "statistics": statistics,
+        "priority_gaps": priority_gaps,
+        "resolution_summary": resolution_summary,
+        "deltas": deltas,
+    }
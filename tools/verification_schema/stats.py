@@ -0,0 +1,285 @@
+"""Report statistics and priority gap classification."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+from .model import (
+    Finding,
+    MoSCoW,
+    MoSCoWBreakdown,
+    PriorityGap,
+    Statistics,
+    Status,
+    TestCoverage,
+)
+
+
+# ---------------------------------------------------------------------------
+# Statistics computation
+# ---------------------------------------------------------------------------
+
+
+# Small integer codes for the columnar statistics engine. Each finding is
+# packed into one byte, in mixed radix over the enum sizes:
+# (moscow * len(Status) + status) * len(TestCoverage) + test_coverage.
+_STATUSES: list[Status] = list(Status)
+_MOSCOWS: list[MoSCoW] = list(MoSCoW)
+_COVERAGES: list[TestCoverage] = list(TestCoverage)
+
+_STATUS_STRIDE = len(_COVERAGES)
+_MOSCOW_STRIDE = len(_STATUSES) * _STATUS_STRIDE
+
+_STATUS_PART: dict[str, int] = {
+    s.value: i * _STATUS_STRIDE for i, s in enumerate(_STATUSES)
+}
+_MOSCOW_PART: dict[str, int] = {
+    m.value: i * _MOSCOW_STRIDE for i, m in enumerate(_MOSCOWS)
+}
+_COVERAGE_PART: dict[str, int] = {c.value: i for i, c in enumerate(_COVERAGES)}
+
+_CODE_COUNT = len(_MOSCOWS) * _MOSCOW_STRIDE
+
+
+def _split_code(code: int) -> tuple[MoSCoW, Status, TestCoverage]:
+    moscow, rest = divmod(code, _MOSCOW_STRIDE)
+    status, coverage = divmod(rest, _STATUS_STRIDE)
+    return _MOSCOWS[moscow], _STATUSES[status], _COVERAGES[coverage]
+
+
+_DECODED_CODES = [_split_code(code) for code in range(_CODE_COUNT)]
+
+
+class StatisticsAccumulator:
+    """Columnar, incremental statistics over findings.
+
+    Findings are encoded as one-byte codes in a ``bytearray``; counting
+    is then a single C-level histogram pass, and the first occurrence of
+    each code (``bytearray.find``) reproduces the insertion order of the
+    per-finding dicts ``compute_statistics`` has always returned. Results
+    are identical to the original three-loop implementation, including
+    3-decimal rounding (sums of 1.0/0.5 are exact in floating point).
+    """
+
+    def __init__(self) -> None:
+        self._codes = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def add(self, finding: Finding) -> None:
+        """Record one finding."""
+        self._codes.append(
+            _MOSCOW_PART[finding.moscow.value]
+            + _STATUS_PART[finding.status.value]
+            + _COVERAGE_PART[finding.test_coverage.value]
+        )
+
+    def extend(self, findings: Iterable[Finding]) -> None:
+        """Record many findings."""
+        moscow_part, status_part, coverage_part = (
+            _MOSCOW_PART,
+            _STATUS_PART,
+            _COVERAGE_PART,
+        )
+        self._codes.extend(
+            moscow_part[f.moscow.value]
+            + status_part[f.status.value]
+            + coverage_part[f.test_coverage.value]
+            for f in findings
+        )
+
+    def result(self) -> Statistics:
+        """Return the Statistics for every finding recorded so far."""
+        codes = self._codes
+        if not codes:
+            return Statistics()
+
+        histogram = Counter(codes)
+        first_seen = {code: codes.find(code) for code in histogram}
+
+        by_status: dict[Status, int] = {}
+        by_cov: dict[TestCoverage, int] = {}
+        by_moscow: dict[MoSCoW, MoSCoWBreakdown] = {}
+        # First position per key, kept per dimension: Status.PARTIAL and
+        # TestCoverage.PARTIAL compare (and hash) equal as strings.
+        first_status: dict[Status, int] = {}
+        first_cov: dict[TestCoverage, int] = {}
+        first_moscow: dict[MoSCoW, int] = {}
+        non_na = impl_score = test_score = 0.0
+        must_non_na = must_impl_score = 0.0
+
+        for code, n in histogram.items():
+            moscow, status, coverage = _DECODED_CODES[code]
+            pos = first_seen[code]
+            for key, first in (
+                (status, first_status),
+                (coverage, first_cov),
+                (moscow, first_moscow),
+            ):
+                if key not in first or pos < first[key]:
+                    first[key] = pos
+
+            by_status[status] = by_status.get(status, 0) + n
+            by_cov[coverage] = by_cov.get(coverage, 0) + n
+            bd = by_moscow.get(moscow)
+            if bd is None:
+                bd = by_moscow[moscow] = MoSCoWBreakdown()
+            bd.total += n
+            if status == Status.IMPLEMENTED:
+                bd.implemented += n
+            elif status == Status.PARTIAL:
+                bd.partial += n
+            elif status == Status.NOT_IMPLEMENTED:
+                bd.not_implemented += n
+            elif status == Status.NA:
+                bd.na += n
+                continue
+            else:
+                raise ValueError(f"unhandled status: {status!r}")
+
+            impl_value = _IMPL_VALUE[status] * n
+            non_na += n
+            impl_score += impl_value
+            test_score += _TEST_VALUE[coverage] * n
+            if moscow == MoSCoW.MUST:
+                must_non_na += n
+                must_impl_score += impl_value
+
+        def ordered(counts: dict, first: dict) -> dict:
+            return {k.value: counts[k] for k in sorted(counts, key=first.__getitem__)}
+
+        return Statistics(
+            total_requirements=len(codes),
+            by_status=ordered(by_status, first_status),
+            by_moscow=ordered(by_moscow, first_moscow),
+            test_coverage=ordered(by_cov, first_cov),
+            implementation_rate=_rate(impl_score, non_na),
+            test_rate=_rate(test_score, non_na),
+            must_implementation_rate=_rate(must_impl_score, must_non_na),
+        )
+
+
+_IMPL_VALUE: dict[Status, float] = {
+    Status.IMPLEMENTED: 1.0,
+    Status.PARTIAL: 0.5,
+    Status.NOT_IMPLEMENTED: 0.0,
+}
+
+_TEST_VALUE: dict[TestCoverage, float] = {
+    TestCoverage.FULL: 1.0,
+    TestCoverage.PARTIAL: 0.5,
+    TestCoverage.NONE: 0.0,
+}
+
+
+def _rate(score: float, denominator: float) -> float:
+    """Return score / denominator rounded to 3 places, or 0.0 if empty.
+
+    NA findings are already excluded from ``denominator``.
+    """
+    if not denominator:
+        return 0.0
+    return round(score / denominator, 3)
+
+
+def compute_statistics(findings: list[Finding]) -> Statistics:
+    """Compute aggregate statistics from a list of findings."""
+    acc = StatisticsAccumulator()
+    acc.extend(findings)
+    return acc.result()
+
+
+# ---------------------------------------------------------------------------
+# Priority gap classification
+# ---------------------------------------------------------------------------
+
+_PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+
+def classify_priority_gaps(findings: list[Finding]) -> list[PriorityGap]:
+    """Identify and classify priority gaps from findings.
+
+    A gap is any finding that is NOT (implemented with full test coverage).
+    NA-status findings are excluded.
+
+    Returns gaps sorted by priority: high, medium, low.
+    """
+    gaps = [gap for gap in map(_gap_for, findings) if gap is not None]
+    gaps.sort(key=lambda g: _PRIORITY_ORDER.get(g.priority, 99))
+    return gaps
+
+
+def _gap_for(f: Finding) -> PriorityGap | None:
+    """Return the unsorted PriorityGap for one finding, or None if no gap."""
+    # Skip NA
+    if f.status == Status.NA:
+        return None
+
+    # Not a gap if fully implemented and fully tested
+    if f.status == Status.IMPLEMENTED and f.test_coverage == TestCoverage.FULL:
+        return None
+
+    return PriorityGap(
+        priority=_classify_single_gap(f),
+        v_item_id=f.v_item_id,
+        section_ref=f.section_ref,
+        title=f.title,
+        moscow=f.moscow.value,
+        status=f.status.value,
+        test_coverage=f.test_coverage.value,
+        reason=_build_reason(f),
+    )
+
+
+def _classify_single_gap(f: Finding) -> str:
+    """Determine the priority level of a single gap finding."""
+    moscow = f.moscow
+    status = f.status
+    test_cov = f.test_coverage
+
+    # High: MUST + (not_implemented OR (partial AND no tests))
+    if moscow == MoSCoW.MUST:
+        if status == Status.NOT_IMPLEMENTED:
+            return "high"
+        if status == Status.PARTIAL and test_cov == TestCoverage.NONE:
+            return "high"
+
+    # Medium: MUST + partial + any test gap, OR SHOULD + not_implemented
+    if moscow == MoSCoW.MUST and status == Status.PARTIAL:
+        return "medium"
+    if moscow == MoSCoW.MUST and status == Status.IMPLEMENTED:
+        # Implemented but test gap (since we already excluded full coverage above)
+        return "medium"
+    if moscow == MoSCoW.SHOULD and status == Status.NOT_IMPLEMENTED:
+        return "medium"
+
+    # Low: SHOULD + partial, COULD + any gap
+    if moscow == MoSCoW.SHOULD:
+        return "low"
+    if moscow == MoSCoW.COULD:
+        return "low"
+
+    # Fallback for WONT or other edge cases
+    return "low"
+
+
+def _build_reason(f: Finding) -> str:
+    """Generate a human-readable reason string for a gap."""
+    parts: list[str] = []
+
+    if f.status == Status.NOT_IMPLEMENTED:
+        parts.append("not implemented")
+    elif f.status == Status.PARTIAL:
+        parts.append("partially implemented")
+    elif f.status == Status.IMPLEMENTED:
+        parts.append("implemented")
+
+    if f.test_coverage == TestCoverage.NONE:
+        parts.append("no test coverage")
+    elif f.test_coverage == TestCoverage.PARTIAL:
+        parts.append("partial test coverage")
+
+    moscow_label = f.moscow.value
+    return f"{moscow_label} requirement: {'; '.join(parts)}"
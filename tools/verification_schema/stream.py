@@ -0,0 +1,444 @@
+"""Constant-memory report JSON writing and streaming assembly."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from ._json import _json_loads
+from .bundle import (
+    FRAGMENT_BUNDLE_FILENAME,
+    _latest_bundle_offsets,
+    _read_bundle_record,
+)
+from .lazy import (
+    _REPORT_INDEX_VERSION,
+    LazyVerificationReport,
+    _write_report_index,
+)
+from .load import _decode_fragment, load_fragment_results, _resolve_jobs
+from .model import (
+    Finding,
+    ItemDelta,
+    ReportMetadata,
+    Resolution,
+    ResolutionSummary,
+    SchemaError,
+    Statistics,
+    VerificationReport,
+    _finding_dict,
+)
+from .report import (
+    _REPORT_SCHEMA_VERSION,
+    ReportIndex,
+    _extract_v_number,
+    reconcile_resolution,
+)
+from .stats import _PRIORITY_ORDER, StatisticsAccumulator, _gap_for
+
+if TYPE_CHECKING:
+    from .cache import FragmentCache
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Incremental JSON encoding
+# ---------------------------------------------------------------------------
+
+
+# Same settings as json.dumps(indent=2, ensure_ascii=False), built once
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _dumps(value, indent: str = "") -> str:
+    """Encode ``value`` as ``json.dumps(indent=2)`` would when nested.
+
+    ``indent`` is the indentation of the line the value starts on. JSON
+    strings never contain a raw newline, so re-indenting is a replace.
+    """
+    text = _ENCODER.encode(value)
+    return text.replace("\n", "\n" + indent) if indent else text
+
+
+class _ReportJsonWriter:
+    """Writes a report as JSON one finding at a time.
+
+    The bytes are exactly ``json.dumps(report.to_dict(), indent=2,
+    ensure_ascii=False) + "\\n"``. The header fields before ``findings``
+    go out in ``begin``, the rest in ``end``, so values computed from the
+    findings (statistics, gaps, deltas) can be finished after the last
+    one. ``rows`` collects the lazy-report index row of every finding.
+    """
+
+    def __init__(self, out: BinaryIO) -> None:
+        self.out = out
+        self.offset = 0
+        self.rows: list[list] = []
+
+    def _write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.out.write(data)
+        self.offset += len(data)
+
+    def begin(self, head: dict) -> None:
+        self._write("{")
+        for key, value in head.items():
+            self._write(f"\n  {_dumps(key)}: {_dumps(value, '  ')},")
+        self._write('\n  "findings": [')
+
+    def finding(self, f: Finding) -> None:
+        self._write(",\n    " if self.rows else "\n    ")
+        start = self.offset
+        self._write(_dumps(_finding_dict(f), "    "))
+        self.rows.append(
+            [
+                start,
+                self.offset,
+                f.fragment_id,
+                f.section_ref,
+                f.v_item_id,
+                f.status.value,
+                f.test_coverage.value,
+            ]
+        )
+
+    def end(self, tail: dict) -> None:
+        self._write("\n  ]" if self.rows else "]")
+        for key, value in tail.items():
+            self._write(f",\n  {_dumps(key)}: ")
+            if isinstance(value, list) and value:
+                # Gaps and deltas grow with the report: one element at a time
+                for i, item in enumerate(value):
+                    self._write(",\n    " if i else "[\n    ")
+                    self._write(_dumps(item, "    "))
+                self._write("\n  ]")
+            else:
+                self._write(_dumps(value, "  "))
+        self._write("\n}\n")
+
+
+def _split_header(report) -> tuple[dict, dict]:
+    """Return the serialised fields before and after ``findings``."""
+    stub = VerificationReport(
+        schema_version=report.schema_version,
+        report_type=report.report_type,
+        metadata=report.metadata,
+        findings=[],
+        statistics=report.statistics,
+        priority_gaps=report.priority_gaps,
+        resolution_summary=report.resolution_summary,
+        deltas=report.deltas,
+    ).to_dict()
+    keys = list(stub)
+    split = keys.index("findings")
+    return (
+        {k: stub[k] for k in keys[:split]},
+        {k: stub[k] for k in keys[split + 1 :]},
+    )
+
+
+def write_report_json(report, out: BinaryIO) -> None:
+    """Write ``report`` as JSON to a binary handle, one finding at a time.
+
+    Produces the same bytes as ``json.dumps(report.to_dict(), indent=2,
+    ensure_ascii=False) + "\\n"`` without building the report's dict, so
+    only one finding's dict exists at once. ``report`` may be a
+    VerificationReport or a LazyVerificationReport.
+    """
+    head, tail = _split_header(report)
+    writer = _ReportJsonWriter(out)
+    writer.begin(head)
+    for f in report.findings:
+        writer.finding(f)
+    writer.end(tail)
+
+
+# ---------------------------------------------------------------------------
+# Streaming assembly
+# ---------------------------------------------------------------------------
+
+# Fragments loaded (and, with a pool, parsed in parallel) per batch
+_STREAM_WINDOW = 512
+
+
+def _v_ranks(stems: list[str]) -> dict[str, int] | None:
+    """Map each stem to its 1-based position in sorted order.
+
+    Returns None when ``stems`` is already sorted, which is the usual case:
+    the position in the list is then the rank.
+    """
+    ordered = sorted(stems)
+    if ordered == stems:
+        return None
+    return {stem: i for i, stem in enumerate(ordered, start=1)}
+
+
+def _section_ref_of(source: Path | tuple[int, int], bundle_fh) -> str | None:
+    """Read just the section_ref of an item; None if it cannot be read."""
+    try:
+        if isinstance(source, Path):
+            data = _json_loads(source.read_bytes())
+        else:
+            data = _read_bundle_record(bundle_fh, source[1], "")
+    except (OSError, ValueError, SchemaError):
+        return None
+    value = data.get("section_ref") if isinstance(data, dict) else None
+    return value if isinstance(value, str) else None
+
+
+def assemble_report_streaming(
+    fragments_dir: Path,
+    output: Path,
+    project_name: str,
+    spec_path: str,
+    impl_path: str,
+    previous_report_path: Path | None = None,
+    spec_version: str = "",
+    date: str | None = None,
+    jobs: int | None = 1,
+    cache: FragmentCache | None = None,
+    previous_report: LazyVerificationReport | None = None,
+    write_index: bool = True,
+) -> LazyVerificationReport:
+    """Assemble a report straight into ``output`` with flat memory use.
+
+    Equivalent to ``assemble_report`` followed by writing its
+    ``to_dict()`` as indented JSON, byte for byte, but fragments are
+    loaded in batches and each finding is folded into the statistics,
+    priority gaps and deltas and written out before the next batch is
+    read. Only small per-item rows (V-item ranks, deltas, gaps and index
+    rows) are kept. Cached fragments still come from ``cache``, which
+    holds its own copies.
+
+    The report is written to a temporary file and renamed over
+    ``output``; with ``write_index`` its lazy-report index is saved too,
+    from offsets recorded while writing. Returns the written report,
+    opened lazily.
+
+    Raises:
+        SchemaError: Listing every fragment that failed; ``output`` is
+            then left untouched.
+    """
+    # Items in per-file name order: (name, path or (bundle line, offset))
+    fragment_paths = sorted(fragments_dir.glob("*.json"))
+    items: list[tuple[str, Path | tuple[int, int]]] = [
+        (p.name, p) for p in fragment_paths
+    ]
+    bundle_path = fragments_dir / FRAGMENT_BUNDLE_FILENAME
+    bundle_fh = None
+    if bundle_path.is_file():
+        file_names = {p.name for p in fragment_paths}
+        for fid, (lineno, offset) in _latest_bundle_offsets(bundle_path).items():
+            name = f"{fid}.json"
+            if name in file_names:
+                logger.warning(
+                    "%s:%d: superseded by %s", bundle_path.name, lineno, name
+                )
+                continue
+            items.append((name, (lineno, offset)))
+        items.sort(key=lambda item: item[0])
+        bundle_fh = bundle_path.open("rb")
+
+    stems = [name[: -len(".json")] for name, _ in items]
+    report_type = "initial"
+    run = 1
+    mode = ""
+    previous_report_str: str | None = None
+    prev_index: ReportIndex | None = None
+    if previous_report_path is not None:
+        prev_report = previous_report
+        if prev_report is None:
+            from .lazy import load_report_lazy
+
+            prev_report = load_report_lazy(previous_report_path)
+        prev_index = ReportIndex(prev_report.findings.entries)
+        previous_report_str = str(previous_report_path)
+        run = prev_report.metadata.run + 1
+        mode = "delta"
+        report_type = "reverify_delta"
+
+    # V-item numbers follow fragment_id order, which is not always name
+    # order ("01-01-01.json" sorts before "01-01.json"). New items in a
+    # re-verification are numbered among themselves, so when the order
+    # differs their section refs are read up front to find them.
+    ranks = _v_ranks(stems)
+    next_v = 1
+    if prev_index is not None:
+        next_v = prev_index.max_v_number + 1
+        if ranks is not None:
+            new_stems = [
+                stem
+                for stem, (_, source) in zip(stems, items)
+                if not prev_index.carried_v_item(
+                    _section_ref_of(source, bundle_fh) or ""
+                )
+            ]
+            ranks = {
+                stem: i for i, stem in enumerate(sorted(new_stems), start=next_v)
+            }
+
+    if date is None:
+        from datetime import date as date_cls
+
+        date = date_cls.today().isoformat()
+    metadata = ReportMetadata(
+        project_name=project_name,
+        spec_path=spec_path,
+        implementation_path=impl_path,
+        date=date,
+        run=run,
+        previous_report=previous_report_str,
+        spec_version=spec_version,
+        mode=mode,
+    )
+
+    acc = StatisticsAccumulator()
+    gaps = []
+    deltas: list[ItemDelta] = []
+    resolutions: Counter = Counter()
+    new_items = 0
+    errors: list[str] = []
+
+    def add(position: int, label: str, finding: Finding, warnings: list[str]):
+        nonlocal next_v, new_items
+        for w in warnings:
+            logger.warning("%s: %s", label, w)
+        if prev_index is None:
+            number = position + 1 if ranks is None else ranks[finding.fragment_id]
+            finding.v_item_id = f"V{number}"
+        else:
+            carried = prev_index.carried_v_item(finding.section_ref)
+            if carried:
+                finding.v_item_id = carried
+            elif ranks is None:
+                finding.v_item_id = f"V{next_v}"
+                next_v += 1
+            else:
+                finding.v_item_id = f"V{ranks[finding.fragment_id]}"
+            for warning in reconcile_resolution(finding, prev_index):
+                logger.warning("%s", warning)
+            resolutions[finding.resolution] += 1
+            if (
+                finding.resolution is None
+                and finding.previous_status is None
+                and finding.section_ref not in prev_index.by_section_ref
+            ):
+                new_items += 1
+            deltas.append(
+                ItemDelta(
+                    v_item_id=finding.v_item_id,
+                    section_ref=finding.section_ref,
+                    previous_status=prev_index.previous_state(finding.v_item_id)[0],
+                    status=finding.status,
+                    resolution=finding.resolution,
+                )
+            )
+        acc.add(finding)
+        gap = _gap_for(finding)
+        if gap is not None:
+            gaps.append(gap)
+        writer.finding(finding)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(output.name + ".tmp")
+    pool = None
+    workers = min(_resolve_jobs(jobs), len(fragment_paths))
+    try:
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            pool = ProcessPoolExecutor(max_workers=workers)
+        if cache is not None:
+            cache.begin_run()
+        with tmp_path.open("wb") as out:
+            writer = _ReportJsonWriter(out)
+            head, _ = _split_header(
+                VerificationReport(
+                    schema_version=_REPORT_SCHEMA_VERSION,
+                    report_type=report_type,
+                    metadata=metadata,
+                    findings=[],
+                    statistics=Statistics(),
+                    priority_gaps=[],
+                )
+            )
+            writer.begin(head)
+
+            for first in range(0, len(items), _STREAM_WINDOW):
+                window = items[first : first + _STREAM_WINDOW]
+                paths = [s for _, s in window if isinstance(s, Path)]
+                loaded = iter(load_fragment_results(paths, jobs, cache, pool))
+                for position, (name, source) in enumerate(window, start=first):
+                    if isinstance(source, Path):
+                        label = name
+                        finding, warnings, error = next(loaded)
+                    else:
+                        label = f"{bundle_path.name}:{source[0]}"
+                        try:
+                            data = _read_bundle_record(bundle_fh, source[1], label)
+                            finding, warnings = _decode_fragment(data, name, label)
+                            error = None
+                        except SchemaError as exc:
+                            finding, warnings, error = None, [], str(exc)
+                    if error is not None:
+                        errors.append(error)
+                    elif not errors:
+                        add(position, label, finding, warnings)
+
+            if errors:
+                raise SchemaError(
+                    "Fragment validation errors:\n"
+                    + "\n".join(f"  - {e}" for e in errors)
+                )
+
+            deltas.sort(key=lambda d: _extract_v_number(d.v_item_id))
+            gaps.sort(key=lambda g: _PRIORITY_ORDER.get(g.priority, 99))
+            resolution_summary = None
+            if prev_index is not None:
+                resolution_summary = ResolutionSummary(
+                    previous_total=len(prev_index),
+                    fixed=resolutions[Resolution.FIXED],
+                    partially_fixed=resolutions[Resolution.PARTIALLY_FIXED],
+                    not_fixed=resolutions[Resolution.NOT_FIXED],
+                    regressed=resolutions[Resolution.REGRESSED],
+                    new_items=new_items,
+                )
+            head, tail = _split_header(
+                VerificationReport(
+                    schema_version=_REPORT_SCHEMA_VERSION,
+                    report_type=report_type,
+                    metadata=metadata,
+                    findings=[],
+                    statistics=acc.result(),
+                    priority_gaps=gaps,
+                    resolution_summary=resolution_summary,
+                    deltas=deltas,
+                )
+            )
+            writer.end(tail)
+        os.replace(tmp_path, output)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if bundle_fh is not None:
+            bundle_fh.close()
+
+    st = output.stat()
+    index = {
+        "version": _REPORT_INDEX_VERSION,
+        "source_size": st.st_size,
+        "source_mtime_ns": st.st_mtime_ns,
+        "header": {**head, **tail},
+        "findings": writer.rows,
+    }
+    if write_index:
+        _write_report_index(output, index)
+    return LazyVerificationReport(output, index)
@@ -0,0 +1,320 @@
+"""Fragment validation."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, fields
+from enum import Enum
+from pathlib import Path
+from typing import Iterable
+
+from ._json import _json_loads
+from .model import (
+    FileRef,
+    Finding,
+    MoSCoW,
+    Resolution,
+    Status,
+    TestCoverage,
+)
+
+
+# ---------------------------------------------------------------------------
+# Validation helpers
+# ---------------------------------------------------------------------------
+
+_ENUM_FIELDS: dict[str, type[Enum]] = {
+    "moscow": MoSCoW,
+    "status": Status,
+    "test_coverage": TestCoverage,
+}
+
+_REQUIRED_FIELDS: list[str] = [
+    "schema_version",
+    "fragment_id",
+    "section_ref",
+    "title",
+    "requirement_text",
+    "moscow",
+    "status",
+    "implementation",
+    "test_coverage",
+    "tests",
+    "missing_tests",
+    "missing_implementation",
+]
+
+# Optional re-verification enum fields (validated only when non-null)
+_OPTIONAL_ENUM_FIELDS: dict[str, type[Enum]] = {
+    "previous_status": Status,
+    "resolution": Resolution,
+}
+
+# Container fields and the JSON type they must have when present
+_LIST_FIELDS: tuple[str, ...] = ("tests", "missing_tests", "missing_implementation")
+_JSON_TYPE_NAMES: dict[type, str] = {dict: "an object", list: "a list"}
+
+
+@dataclass
+class ValidationIssue:
+    """One structured validation result for a fragment.
+
+    ``severity`` is ``"error"`` or ``"warning"``; ``code`` is a stable
+    identifier suitable for grouping; ``field`` names the offending field
+    (with an index for list items); ``fragment`` is the filename stem.
+    """
+
+    severity: str
+    code: str
+    field: str
+    fragment: str
+    message: str
+
+
+class FragmentValidator:
+    """Fragment validator compiled once from the schema definitions.
+
+    Field names are checked against the ``Finding`` and ``FileRef``
+    dataclasses at construction, required fields become a frozenset, and
+    each enum field gets a frozenset of valid values (for membership), the
+    ordered list (for messages), and a value -> member map (for decoding).
+    Messages are identical to those ``validate_fragment`` has always
+    produced.
+    """
+
+    def __init__(
+        self,
+        finding_cls: type = Finding,
+        file_ref_cls: type = FileRef,
+        enum_fields: dict[str, type[Enum]] = _ENUM_FIELDS,
+        optional_enum_fields: dict[str, type[Enum]] = _OPTIONAL_ENUM_FIELDS,
+        required_fields: list[str] = _REQUIRED_FIELDS,
+    ) -> None:
+        known = {f.name for f in fields(finding_cls)}
+        named = set(required_fields) | set(enum_fields) | set(optional_enum_fields)
+        unknown = named - known
+        if unknown:
+            raise ValueError(f"Schema tables name unknown fields: {sorted(unknown)}")
+
+        self.required_fields: tuple[str, ...] = tuple(required_fields)
+        self.required_set: frozenset[str] = frozenset(required_fields)
+        self.file_ref_shape = "/".join(f.name for f in fields(file_ref_cls))
+
+        # field -> (valid values, values as listed in messages, value -> member)
+        self.enums: dict[str, tuple[frozenset, list[str], dict[str, Enum]]] = {
+            name: self._compile_enum(cls) for name, cls in enum_fields.items()
+        }
+        self.optional_enums = {
+            name: self._compile_enum(cls) for name, cls in optional_enum_fields.items()
+        }
+
+    @staticmethod
+    def _compile_enum(enum_cls: type[Enum]) -> tuple[frozenset, list[str], dict]:
+        values = [e.value for e in enum_cls]
+        return frozenset(values), values, {e.value: e for e in enum_cls}
+
+    @staticmethod
+    def _is_valid(valid: frozenset, value) -> bool:
+        try:
+            return value in valid
+        except TypeError:  # unhashable (list/dict) values are simply invalid
+            return False
+
+    def check(self, data: dict, filename: str) -> list[ValidationIssue]:
+        """Validate one fragment dict; return errors first, then warnings."""
+        fragment = Path(filename).stem
+        shape = self.file_ref_shape
+        errors: list[ValidationIssue] = []
+        warnings: list[ValidationIssue] = []
+
+        def error(code: str, field_name: str, message: str) -> None:
+            errors.append(ValidationIssue("error", code, field_name, fragment, message))
+
+        def warn(code: str, field_name: str, message: str) -> None:
+            warnings.append(
+                ValidationIssue("warning", code, field_name, fragment, message)
+            )
+
+        # Required fields
+        if not self.required_set.issubset(data.keys()):
+            for field_name in self.required_fields:
+                if field_name not in data:
+                    error(
+                        "missing_field",
+                        field_name,
+                        f"Missing required field: {field_name}",
+                    )
+
+        def expect(field_name: str, value, json_type: type) -> bool:
+            if isinstance(value, json_type):
+                return True
+            error(
+                "wrong_type",
+                field_name,
+                f"{field_name} must be {_JSON_TYPE_NAMES[json_type]}, "
+                f"got {type(value).__name__}",
+            )
+            return False
+
+        # Containers must have the right JSON type before they are walked
+        for field_name in _LIST_FIELDS:
+            if field_name in data:
+                expect(field_name, data[field_name], list)
+
+        # implementation must have files array
+        impl = data.get("implementation")
+        impl_files = []
+        if "implementation" in data and expect("implementation", impl, dict):
+            if "files" not in impl:
+                error(
+                    "missing_field",
+                    "implementation.files",
+                    "implementation missing required field: files",
+                )
+            elif expect("implementation.files", impl["files"], list):
+                impl_files = impl["files"]
+            for i, item in enumerate(impl_files):
+                if isinstance(item, str):
+                    warn(
+                        "string_file_ref",
+                        f"implementation.files[{i}]",
+                        f"implementation.files[{i}] is a string ('{item}'), "
+                        f"expected object with {shape} — will be coerced",
+                    )
+
+        tests = data.get("tests", [])
+        if not isinstance(tests, list):
+            tests = []
+        for i, item in enumerate(tests):
+            if isinstance(item, str):
+                warn(
+                    "string_file_ref",
+                    f"tests[{i}]",
+                    f"tests[{i}] is a string ('{item}'), "
+                    f"expected object with {shape} — will be coerced",
+                )
+
+        # Enum validation
+        for field_name, (valid, listed, _) in self.enums.items():
+            value = data.get(field_name)
+            if value is not None and not self._is_valid(valid, value):
+                error(
+                    "invalid_enum",
+                    field_name,
+                    f"Invalid {field_name} value: '{value}'. Valid values: {listed}",
+                )
+
+        # Re-verification enum validation
+        for field_name, (valid, _, _) in self.optional_enums.items():
+            value = data.get(field_name)
+            if value is not None and not self._is_valid(valid, value):
+                error(
+                    "invalid_enum",
+                    field_name,
+                    f"Invalid {field_name} value: '{value}'",
+                )
+
+        # fragment_id must match filename stem
+        fid = data.get("fragment_id")
+        if fid is not None and fid != fragment:
+            error(
+                "fragment_id_mismatch",
+                "fragment_id",
+                f"fragment_id mismatch: '{fid}' does not match "
+                f"filename stem '{fragment}'",
+            )
+
+        # --- Consistency warnings ---
+        status = data.get("status")
+        if status == "implemented" and data.get("missing_implementation"):
+            warn(
+                "implemented_with_gaps",
+                "missing_implementation",
+                "status is 'implemented' but missing_implementation is non-empty",
+            )
+        if status == "not_implemented" and impl_files:
+            warn(
+                "not_implemented_with_files",
+                "implementation.files",
+                "status is 'not_implemented' but implementation.files is non-empty",
+            )
+
+        test_cov = data.get("test_coverage")
+        if test_cov == "full" and data.get("missing_tests"):
+            warn(
+                "full_coverage_with_missing_tests",
+                "missing_tests",
+                "test_coverage is 'full' but missing_tests is non-empty",
+            )
+        if test_cov == "none" and tests:
+            warn(
+                "no_coverage_with_tests",
+                "tests",
+                "test_coverage is 'none' but tests is non-empty",
+            )
+
+        return errors + warnings
+
+    def validate(self, data: dict, filename: str) -> tuple[list[str], list[str]]:
+        """Validate one fragment dict; return (errors, warnings) as messages."""
+        errors: list[str] = []
+        warnings: list[str] = []
+        for issue in self.check(data, filename):
+            (errors if issue.severity == "error" else warnings).append(issue.message)
+        return errors, warnings
+
+    def validate_many(
+        self, items: Iterable[tuple[str, dict]]
+    ) -> list[ValidationIssue]:
+        """Validate ``(filename, data)`` pairs; return all issues in input order."""
+        issues: list[ValidationIssue] = []
+        for filename, data in items:
+            issues.extend(self.check(data, filename))
+        return issues
+
+
+_VALIDATOR = FragmentValidator()
+
+
+def validate_fragment(data: dict, filename: str) -> tuple[list[str], list[str]]:
+    """Validate a fragment dict against the schema.
+
+    Returns (errors, warnings). Errors are hard failures; warnings are
+    consistency issues that don't prevent loading.
+    """
+    return _VALIDATOR.validate(data, filename)
+
+
+def check_fragment_file(path: Path) -> list[ValidationIssue]:
+    """Read and validate one fragment file, returning structured issues.
+
+    Unlike ``load_fragment`` this never raises for bad content: unreadable
+    files are reported as ``unreadable`` errors and invalid JSON as
+    ``invalid_json`` errors.
+    """
+    fragment = path.stem
+    try:
+        data = _json_loads(path.read_text(encoding="utf-8"))
+    except OSError as exc:
+        message = f"cannot read file: {exc}"
+        return [ValidationIssue("error", "unreadable", "", fragment, message)]
+    except (json.JSONDecodeError, ValueError) as exc:
+        message = f"invalid JSON: {exc}"
+        return [ValidationIssue("error", "invalid_json", "", fragment, message)]
+    if not isinstance(data, dict):
+        return [
+            ValidationIssue(
+                "error", "invalid_json", "", fragment, "expected a JSON object"
+            )
+        ]
+    return _VALIDATOR.check(data, path.name)
+
+
+def validate_many(items: Iterable[tuple[str, dict]]) -> list[ValidationIssue]:
+    """Validate many ``(filename, data)`` pairs with the compiled validator.
+
+    Returns structured ``ValidationIssue`` records (errors and warnings)
+    in input order, ready to be grouped by ``code``, ``field`` or
+    ``fragment``.
+    """
+    return _VALIDATOR.validate_many(items)
@@ -0,0 +1,118 @@
+"""Precomputed, renderer-neutral view of a verification report."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Iterator
+
+from .model import Finding, Resolution, Status, TestCoverage, VerificationReport
+from .report import _extract_v_number
+
+
+class _LazySubset(Sequence):
+    """Findings of a ``LazyFindings`` picked by position, decoded on access.
+
+    Nothing is cached, so iterating holds one finding at a time.
+    """
+
+    def __init__(self, source, positions: list[int]) -> None:
+        self.source = source
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _LazySubset(self.source, self.positions[index])
+        return self.source.decode(self.positions[index])
+
+    def __iter__(self) -> Iterator[Finding]:
+        return map(self.source.decode, self.positions)
+
+
+class ReportView:
+    """A report's findings sorted and partitioned once, for any output format.
+
+    ``findings`` are in V-item order. The partitions keep that order and
+    share the Finding objects, so building a view costs one sort and one
+    pass over the findings however many sections a renderer emits:
+
+    - ``reverified``: findings with a ``previous_status``
+    - ``unresolved``: findings with a resolution other than FIXED
+    - ``untested_implemented``: implemented but not fully tested
+    - ``not_implemented`` and ``partial``: by status
+
+    ``non_na``, ``implemented`` and ``tested`` count non-N/A findings, the
+    implemented ones among them, and those with any test coverage.
+
+    For a lazily loaded report the view is sorted by the index's V-item
+    ids and keeps only positions: ``findings`` and the partitions are
+    sequences that decode each finding when it is read and then drop it,
+    so rendering a huge report does not hold its findings in memory.
+    """
+
+    def __init__(self, report: VerificationReport) -> None:
+        self.report = report
+        lazy = hasattr(report.findings, "decode")  # LazyFindings
+        if lazy:
+            entries = report.findings.entries
+            order = sorted(
+                range(len(entries)),
+                key=lambda i: _extract_v_number(entries[i].v_item_id),
+            )
+            self.findings: Sequence[Finding] = _LazySubset(report.findings, order)
+        else:
+            self.findings = sorted(
+                report.findings, key=lambda f: _extract_v_number(f.v_item_id)
+            )
+        self.is_reverify = report.resolution_summary is not None
+        reverified: list[int] = []
+        unresolved: list[int] = []
+        untested_implemented: list[int] = []
+        not_implemented: list[int] = []
+        partial: list[int] = []
+        self.non_na = 0
+        self.implemented = 0
+        self.tested = 0
+
+        for i, f in enumerate(self.findings):
+            status = f.status
+            if status != Status.NA:
+                self.non_na += 1
+                if f.test_coverage != TestCoverage.NONE:
+                    self.tested += 1
+            if status == Status.IMPLEMENTED:
+                self.implemented += 1
+                if f.test_coverage != TestCoverage.FULL:
+                    untested_implemented.append(i)
+            elif status == Status.NOT_IMPLEMENTED:
+                not_implemented.append(i)
+            elif status == Status.PARTIAL:
+                partial.append(i)
+            if f.previous_status is not None:
+                reverified.append(i)
+            if f.resolution is not None and f.resolution != Resolution.FIXED:
+                unresolved.append(i)
+
+        self.reverified: Sequence[Finding] = self.select(reverified)
+        self.unresolved: Sequence[Finding] = self.select(unresolved)
+        self.untested_implemented: Sequence[Finding] = self.select(
+            untested_implemented
+        )
+        self.not_implemented: Sequence[Finding] = self.select(not_implemented)
+        self.partial: Sequence[Finding] = self.select(partial)
+
+        self.critical_gaps = sum(
+            1 for g in report.priority_gaps if g.priority == "high"
+        )
+
+    def select(self, positions: list[int]) -> Sequence[Finding]:
+        """The findings at ``positions`` of ``findings``, in that order.
+
+        Like the partitions, this is lazy for a lazily loaded report.
+        """
+        if isinstance(self.findings, _LazySubset):
+            order = self.findings.positions
+            return _LazySubset(self.findings.source, [order[i] for i in positions])
+        return [self.findings[i] for i in positions]
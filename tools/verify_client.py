@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Drop-in replacement for verify_report.py that runs on a resident server.
+
+Takes exactly the same flags as ``verify_report.py`` and forwards them to
+``verify_server.py`` over a Unix socket, starting the server if none is
+running. This process only imports the standard library, so repeated runs
+in the fix loop skip interpreter warm-up, imports and re-opening the
+previous report. If the server cannot be reached or started, or is busy
+with another run, the report is assembled in this process instead, with
+identical results.
+
+  python verify_client.py --fragments-dir ... --output ... [--previous ...]
+
+Environment:
+  VERIFY_SERVER_SOCKET   Socket path (default: a per-user runtime path)
+  VERIFY_SERVER_IDLE     Idle timeout in seconds for a newly started server
+  VERIFY_CLIENT_LOCAL=1  Never use the server
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SERVER_PATH = Path(__file__).resolve().parent / "verify_server.py"
+
+_START_TIMEOUT = 10.0
+
+
+def _socket_path() -> Path:
+    # Mirrors verify_server.default_socket_path() without importing it
+    override = os.environ.get("VERIFY_SERVER_SOCKET")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(base) / f"verify-report-{os.getuid()}" / "server.sock"
+
+
+def _request(socket_path: Path, argv: list[str]) -> dict | None:
+    """Send one run to the server and return its final reply.
+
+    Output lines the server sends during the run are written out as they
+    arrive. Returns None if the request could not be delivered, so nothing
+    ran. Once it has been, the server may be running it: a lost connection
+    is returned as ``{"lost": message}`` rather than None, so the run is
+    not repeated.
+    """
+    payload = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8")
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+            sock.sendall(payload + b"\n")
+        except OSError:
+            return None
+        try:
+            for line in sock.makefile("rb"):
+                reply = json.loads(line)
+                if not isinstance(reply, dict):
+                    raise ValueError(f"unexpected reply {reply!r}")
+                name = next(iter(reply), None)
+                if name not in streams:
+                    return reply
+                stream = streams[name]
+                stream.write(reply[name])
+                stream.flush()
+        except (OSError, ValueError) as exc:
+            return {"lost": f"lost connection to verify_server.py: {exc}"}
+    return {"lost": "verify_server.py closed the connection during the run"}
+
+
+def _start_server(socket_path: Path) -> None:
+    command = [sys.executable, str(SERVER_PATH), "--socket", str(socket_path)]
+    idle = os.environ.get("VERIFY_SERVER_IDLE")
+    if idle:
+        command += ["--idle-timeout", idle]
+    subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _run_on_server(argv: list[str]) -> dict | None:
+    """Return the server's reply to the run, or None to run it locally."""
+    socket_path = _socket_path()
+    reply = _request(socket_path, argv)
+    if reply is not None and reply.get("stale"):
+        _wait_for_shutdown(socket_path)
+    if reply is None or reply.get("stale"):
+        reply = _start_and_request(socket_path, argv)
+    if reply is None or not ("exit_code" in reply or "lost" in reply):
+        return None  # busy with another run, or the request was rejected
+    return reply
+
+
+def _wait_for_shutdown(socket_path: Path) -> None:
+    """Wait until a stale server has removed its socket.
+
+    A new server started earlier would find the old one still listening
+    and leave the path to it.
+    """
+    deadline = time.monotonic() + _START_TIMEOUT
+    while socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def _start_and_request(socket_path: Path, argv: list[str]) -> dict | None:
+    try:
+        _start_server(socket_path)
+    except OSError:
+        return None
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        if socket_path.exists():
+            reply = _request(socket_path, argv)
+            if reply is not None and not reply.get("stale"):
+                return reply
+    return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: same flags and exit codes as verify_report.py."""
+    argv = sys.argv[1:] if argv is None else argv
+    reply = None
+    if os.environ.get("VERIFY_CLIENT_LOCAL") != "1":
+        reply = _run_on_server(argv)
+
+    if reply is None:
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        import verify_report
+
+        try:
+            return verify_report.main(argv)
+        except SystemExit as exc:
+            return exc.code if isinstance(exc.code, int) else 1
+
+    if "lost" in reply:
+        print(f"Error: {reply['lost']}", file=sys.stderr)
+        return 1
+    return reply["exit_code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
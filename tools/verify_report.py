@@ -1,57 +1,90 @@
 #!/usr/bin/env python3
-"""CLI tool to assemble verification fragments into JSON and markdown reports."""
+"""CLI tool to assemble verification fragments into JSON and markdown reports.
+
+Assembles one spec from command-line options, or several in one process
+with ``--batch MANIFEST``. A manifest is a JSON list (or ``{"specs": [...]}``)
+of objects with the single-spec options as keys; relative paths resolve
+against the manifest's directory:
+
+  [{"fragments_dir": "foo/fragments", "spec_path": "specs/foo.md",
+    "impl_path": ".", "project_name": "foo", "output": "foo/verify.json",
+    "previous": "foo/verify-prev.json", "spec_version": ""}]
+
+``--parallel N`` assembles up to N specs at once. A spec that fails is
+reported and the rest still run; the exit code is 1 if any failed.
+
+``--wait COUNT`` replaces a separate ``wait_for_done.py --dir --count``
+run: each fragment is validated as soon as its ``.done`` marker lands, so
+the report is assembled immediately after the last one.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
 import logging
+import os
 import sys
+import time
+from dataclasses import dataclass, fields, replace
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 # Allow importing verification_schema from the same directory
 sys.path.insert(0, str(Path(__file__).parent))
 
-from verification_schema import (  # noqa: E402
-    SchemaError,
-    assemble_report,
-    render_markdown,
-)
+# Only the schema types are imported up front. Assembly, rendering, the
+# cache, lazy reports and history are imported where a run needs them, so
+# start-up, --help and argument errors stay cheap.
+from verification_schema import SchemaError  # noqa: E402
+
+if TYPE_CHECKING:
+    from verification_schema import Finding, FragmentCache, LazyVerificationReport
 
 logger = logging.getLogger(__name__)
 
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
+        prog="verify_report.py",
         description="Assemble verification fragments into a JSON and markdown report.",
     )
     parser.add_argument(
         "--fragments-dir",
-        required=True,
         type=Path,
-        help="Path to directory containing fragment JSON files",
+        help="Directory containing fragment JSON files and/or fragments.ndjson",
     )
     parser.add_argument(
         "--spec-path",
-        required=True,
         help="Path to the spec file",
     )
     parser.add_argument(
         "--impl-path",
-        required=True,
         help="Path to the implementation directory",
     )
     parser.add_argument(
         "--project-name",
-        required=True,
         help="Project name for the report header",
     )
     parser.add_argument(
         "--output",
-        required=True,
         type=Path,
         help="Output path for the JSON report file",
     )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="MANIFEST",
+        help="Assemble every spec listed in a JSON manifest instead",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="With --batch, specs assembled at once (default: 1, 0 = one per CPU)",
+    )
     parser.add_argument(
         "--previous",
         type=Path,
@@ -63,6 +96,86 @@ def _build_parser() -> argparse.ArgumentParser:
         default="",
         help="Spec version string",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes for loading fragments (default: 1, 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Reuse validated fragments from a content-hash cache stored next to "
+            "the fragments directory (fragment-cache.pickle)"
+        ),
+    )
+    parser.add_argument(
+        "--paginate",
+        action="store_true",
+        help=(
+            "Also write the markdown report as pages in <output stem>-pages/: "
+            "an index plus one page per top-level spec section"
+        ),
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=None,
+        metavar="N",
+        help="With --paginate, put N V-items on each page instead",
+    )
+    parser.add_argument(
+        "--format",
+        dest="formats",
+        action="extend",
+        nargs="+",
+        default=[],
+        metavar="FORMAT",
+        help=(
+            "Also write the report as csv, junit (.junit.xml) and/or html next "
+            "to --output, e.g. --format csv junit"
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Assemble with flat memory use: write each finding to --output as "
+            "it is loaded and render the rest from the written report"
+        ),
+    )
+    parser.add_argument(
+        "--wait",
+        type=int,
+        default=None,
+        metavar="COUNT",
+        help=(
+            "First wait for COUNT .done markers in --fragments-dir, validating "
+            "each fragment as its marker lands, then assemble"
+        ),
+    )
+    parser.add_argument(
+        "--wait-timeout",
+        type=float,
+        default=600,
+        metavar="SECONDS",
+        help="With --wait, give up after this many seconds (default: 600)",
+    )
+    parser.add_argument(
+        "--live-markdown",
+        action="store_true",
+        help=(
+            "With --wait, keep <output stem>.partial.md updated with the "
+            "fragments received so far"
+        ),
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record the report in history.sqlite next to --output",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -72,72 +185,756 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Entry point for the CLI tool.
+_SPEC_OPTIONS = ("fragments_dir", "spec_path", "impl_path", "project_name", "output")
+
+# Options naming files this process opens, resolved against main()'s ``cwd``
+_PATH_OPTIONS = ("fragments_dir", "output", "previous", "batch")
+
 
-    Returns exit code: 0 on success, 1 on error.
+@dataclass
+class SpecJob:
+    """Inputs for assembling one spec's report."""
+
+    fragments_dir: Path
+    spec_path: str
+    impl_path: str
+    project_name: str
+    output: Path
+    previous: Path | None = None
+    spec_version: str = ""
+
+
+@dataclass
+class SpecResult:
+    """Outcome of one spec; ``error`` is set if it failed."""
+
+    project_name: str
+    output: Path
+    error: str | None = None
+    findings: int = 0
+    total_requirements: int = 0
+    implementation_rate: float = 0.0
+    test_rate: float = 0.0
+
+
+# Previous reports a ResidentState keeps open (each holds an fd and a mmap)
+RESIDENT_REPORTS = 2
+
+
+class ResidentState:
+    """Objects kept between runs by a long-lived process (verify_server.py).
+
+    The ``RESIDENT_REPORTS`` most recently used previous reports stay open
+    and fragment caches stay in memory. Each is reused only while its file
+    is unchanged on disk, so runs by other processes in between are
+    picked up.
     """
-    parser = _build_parser()
-    args = parser.parse_args(argv)
 
-    # Configure logging: capture warnings from verification_schema
-    if args.verbose:
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(logging.Formatter("WARNING: %(message)s"))
-        handler.setLevel(logging.WARNING)
-        logging.getLogger("verification_schema").addHandler(handler)
-        logging.getLogger("verification_schema").setLevel(logging.WARNING)
+    def __init__(self) -> None:
+        # resolved path -> ((size, mtime_ns), object); reports in LRU order
+        self._reports: dict[Path, tuple[tuple[int, int], LazyVerificationReport]] = {}
+        self._caches: dict[Path, tuple[tuple[int, int] | None, FragmentCache]] = {}
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[int, int] | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def previous_report(self, path: Path) -> LazyVerificationReport:
+        """Return the open report at ``path``, reopening it if it changed."""
+        key = path.resolve()
+        stamp = self._stamp(key)
+        held = self._reports.pop(key, None)
+        if held is not None and held[0] == stamp:
+            self._reports[key] = held
+            return held[1]
+        if held is not None:
+            held[1].close()
+        from verification_schema import load_report_lazy
+
+        report = load_report_lazy(key)
+        self._reports[key] = (stamp, report)
+        while len(self._reports) > RESIDENT_REPORTS:
+            oldest = next(iter(self._reports))
+            self._reports.pop(oldest)[1].close()
+        return report
+
+    def fragment_cache(self, path: Path) -> FragmentCache:
+        """Return the in-memory cache for ``path``, reloading it if changed."""
+        key = path.resolve()
+        held = self._caches.get(key)
+        if held is not None and held[0] == self._stamp(key):
+            return held[1]
+        from verification_schema import FragmentCache
+
+        cache = FragmentCache.load(key)
+        self._caches[key] = (self._stamp(key), cache)
+        return cache
+
+    def cache_saved(self, cache: FragmentCache) -> None:
+        """Note that ``cache`` was just written, so it stays current."""
+        key = cache.path.resolve()
+        self._caches[key] = (self._stamp(key), cache)
+
+    def close(self) -> None:
+        for _, report in self._reports.values():
+            report.close()
+        self._reports.clear()
+        self._caches.clear()
+
+
+def load_manifest(path: Path) -> list[SpecJob]:
+    """Read a batch manifest, resolving relative paths against its directory.
+
+    Raises:
+        SchemaError: If the manifest is unreadable or any entry is invalid;
+            every problem is listed.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise SchemaError(f"{path}: cannot read manifest: {exc}") from exc
+    if isinstance(data, dict):
+        data = data.get("specs")
+    if not isinstance(data, list) or not data:
+        raise SchemaError(f"{path}: expected a non-empty list of specs")
+
+    base = path.parent
+    known = {f.name for f in fields(SpecJob)}
+    jobs: list[SpecJob] = []
+    errors: list[str] = []
+    for i, entry in enumerate(data, start=1):
+        if not isinstance(entry, dict):
+            errors.append(f"entry {i}: expected an object")
+            continue
+        missing = [key for key in _SPEC_OPTIONS if not entry.get(key)]
+        unknown = sorted(set(entry) - known)
+        if missing:
+            errors.append(f"entry {i}: missing {', '.join(missing)}")
+        if unknown:
+            errors.append(f"entry {i}: unknown keys {', '.join(unknown)}")
+        if missing or unknown:
+            continue
+        previous = entry.get("previous")
+        jobs.append(
+            SpecJob(
+                fragments_dir=base / entry["fragments_dir"],
+                spec_path=entry["spec_path"],
+                impl_path=entry["impl_path"],
+                project_name=entry["project_name"],
+                output=base / entry["output"],
+                previous=base / previous if previous else None,
+                spec_version=entry.get("spec_version", ""),
+            )
+        )
+    if errors:
+        raise SchemaError(
+            f"{path}: invalid manifest:\n" + "\n".join(f"  - {e}" for e in errors)
+        )
+    return jobs
+
+
+def pages_dir(output: Path) -> Path:
+    """Directory for the paginated markdown of the report at ``output``."""
+    return output.with_name(f"{output.stem}-pages")
+
+
+# Poll interval for --wait where inotify is unavailable
+_WAIT_POLL_INTERVAL = 1.0
+
+# Minimum seconds between rewrites of the live partial markdown report
+LIVE_MARKDOWN_INTERVAL = 2.0
+
+
+def live_markdown_path(output: Path) -> Path:
+    """Partial markdown kept current by ``--wait --live-markdown``."""
+    return output.with_suffix(".partial.md")
+
+
+class MarkerPipeline:
+    """Validate fragments as their ``.done`` markers land (``--wait``).
+
+    Each ``<id>.json`` is parsed once its ``<id>.done`` exists, and again
+    whenever it changes (e.g. a redispatched agent rewrote it). Parsed
+    fragments go into ``cache``, so the final ``assemble_report`` serves
+    them all from memory instead of parsing every file after the last
+    marker. ``findings`` holds the latest valid Finding per fragment_id
+    and ``errors`` the message of every fragment that currently fails.
+    """
+
+    def __init__(self, fragments_dir: Path, cache: FragmentCache) -> None:
+        self.fragments_dir = fragments_dir
+        self.cache = cache
+        self.markers = 0
+        self.marker_ids: list[str] = []
+        self.findings: dict[str, Finding] = {}
+        self.errors: dict[str, str] = {}
+        # fragment_id -> (mtime_ns, size) of the .json last parsed, or None
+        self._parsed: dict[str, tuple[int, int] | None] = {}
+
+    def scan(self) -> list[tuple[str, str | None]]:
+        """Parse fragments whose marker is new or whose .json changed.
+
+        Returns ``(fragment_id, error)`` for every fragment parsed in this
+        scan; ``error`` is None if it is valid.
+        """
+        from verification_schema import load_fragment_results
+
+        results: list[tuple[str, str | None]] = []
+        markers = sorted(self.fragments_dir.glob("*.done"))
+        self.markers = len(markers)
+        self.marker_ids = [marker.stem for marker in markers]
+        for marker in markers:
+            fid = marker.stem
+            path = marker.with_suffix(".json")
+            try:
+                st = path.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                stamp = None
+            if fid in self._parsed and self._parsed[fid] == stamp:
+                continue
+            self._parsed[fid] = stamp
+
+            if stamp is None:
+                finding = None
+                error = f"{path.name}: .done marker present but the file is missing"
+            else:
+                [(finding, _, error)] = load_fragment_results([path], cache=self.cache)
+            if error is None:
+                self.findings[fid] = finding
+                self.errors.pop(fid, None)
+            else:
+                self.findings.pop(fid, None)
+                self.errors[fid] = error
+            results.append((fid, error))
+        return results
+
+    def progress(self) -> str:
+        """One-line summary of the markers and running statistics."""
+        from verification_schema import compute_statistics
+
+        stats = compute_statistics(list(self.findings.values()))
+        return (
+            f"{self.markers} .done markers, {len(self.findings)} valid, "
+            f"{len(self.errors)} invalid; implementation "
+            f"{stats.implementation_rate:.1%}, test {stats.test_rate:.1%} so far"
+        )
+
+
+def wait_for_fragments(
+    pipeline: MarkerPipeline,
+    count: int,
+    timeout: float,
+    on_change: Callable[[], None] | None = None,
+) -> str | None:
+    """Scan ``pipeline`` until ``count`` markers exist.
+
+    Wakes on filesystem events where inotify is available (see
+    ``wait_for_done.open_watcher``). Invalid fragments are printed as soon
+    as they are parsed. Progress lines and stragglers are reported as by
+    ``wait_for_done.py --dir``. ``on_change`` is called after fragments
+    change, at most every ``LIVE_MARKDOWN_INTERVAL`` seconds. Returns None
+    once the markers are all there, or an error message on timeout.
+    """
+    # Imported here: only --wait needs ctypes and the watchers
+    from wait_for_done import (
+        APPEND_EVENTS,
+        PROGRESS_INTERVAL,
+        ArrivalTracker,
+        next_wake,
+        open_watcher,
+        report_stragglers,
+    )
+
+    watcher = open_watcher(
+        "auto", [pipeline.fragments_dir], APPEND_EVENTS, _WAIT_POLL_INTERVAL
+    )
+    start = time.monotonic()
+    last_report = start
+    tracker = ArrivalTracker(count, start)
+    last_change = start - LIVE_MARKDOWN_INTERVAL
+    pending = False
+    try:
+        while True:
+            results = pipeline.scan()
+            for fid, error in results:
+                if error is not None:
+                    print(f"INVALID {fid}: " + error.replace("\n", "\n    "))
+            pending = pending or bool(results)
+            now = time.monotonic()
+            tracker.update(pipeline.marker_ids, now)
+            if (
+                on_change is not None
+                and pending
+                and now - last_change >= LIVE_MARKDOWN_INTERVAL
+            ):
+                on_change()
+                last_change = now
+                pending = False
+
+            if pipeline.markers >= count:
+                return None
+            elapsed = now - start
+            if elapsed >= timeout:
+                return (
+                    f"timeout after {int(elapsed)}s — found "
+                    f"{pipeline.markers}/{count} .done markers"
+                )
+            report_stragglers(tracker, now, False)
+            if now - last_report >= PROGRESS_INTERVAL:
+                print(f"Waiting... {pipeline.progress()} ({tracker.describe(now)})")
+                last_report = now
+
+            limit = next_wake(start, last_report, timeout)
+            if on_change is not None and pending:
+                live_due = last_change + LIVE_MARKDOWN_INTERVAL - time.monotonic()
+                limit = min(limit, live_due)
+            watcher.wait(limit)
+    finally:
+        watcher.close()
+
+
+def _write_live_markdown(
+    pipeline: MarkerPipeline,
+    spec: SpecJob,
+    count: int,
+    previous_report: LazyVerificationReport | None,
+) -> None:
+    """Render the fragments received so far to ``live_markdown_path``."""
+    from verification_schema import ReportView, build_report, write_markdown
+
+    # Copies, in assembly's file-name order: building a report assigns
+    # V-items and resolutions in-place
+    order = sorted(pipeline.findings, key=lambda fid: f"{fid}.json")
+    findings = [replace(pipeline.findings[fid]) for fid in order]
+    report = build_report(
+        findings,
+        spec.project_name,
+        spec.spec_path,
+        spec.impl_path,
+        previous_report_path=spec.previous,
+        spec_version=spec.spec_version,
+        previous_report=previous_report,
+        # Reconciliation warnings are logged once, by the final assembly
+        log_warnings=False,
+    )
+    path = live_markdown_path(spec.output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as md_file:
+        md_file.write(
+            f"> **Partial report**: {len(findings)} of {count} fragments, "
+            f"updated {time.strftime('%H:%M:%S')}\n\n"
+        )
+        write_markdown(ReportView(report), md_file)
+    os.replace(tmp_path, path)
+
+
+def verify_spec(
+    spec: SpecJob,
+    jobs: int = 1,
+    use_cache: bool = False,
+    history: bool = True,
+    state: ResidentState | None = None,
+    paginate: bool = False,
+    page_size: int | None = None,
+    formats: tuple[str, ...] = (),
+    stream: bool = False,
+    wait: int | None = None,
+    wait_timeout: float = 600,
+    live_markdown: bool = False,
+) -> SpecResult:
+    """Assemble one spec and write its JSON and markdown reports.
+
+    Expected failures (missing fragments, invalid fragments, unreadable
+    files) are returned in ``SpecResult.error`` rather than raised.
+    ``state`` lets a long-lived caller reuse previous reports and caches.
+    With ``paginate``, the markdown is also written as pages (see
+    ``write_markdown_pages``) in ``pages_dir(spec.output)``. Each of
+    ``formats`` (see ``REPORT_FORMATS``) is written next to the JSON.
+    With ``stream``, the JSON is written during assembly (see
+    ``assemble_report_streaming``) and everything else is rendered from
+    the written report, decoding one finding at a time.
+
+    With ``wait``, fragments are validated as their ``.done`` markers
+    appear until there are ``wait`` markers (see ``MarkerPipeline``), and
+    with ``live_markdown`` a partial markdown report is kept current in
+    ``live_markdown_path(spec.output)`` meanwhile. The final assembly
+    reuses the fragments parsed while waiting.
+    """
+    from verification_schema import (
+        FRAGMENT_BUNDLE_FILENAME,
+        FRAGMENT_CACHE_FILENAME,
+        FragmentCache,
+        ReportView,
+        assemble_report,
+        load_report_lazy,
+        write_markdown,
+        write_report_json,
+    )
+
+    result = SpecResult(project_name=spec.project_name, output=spec.output)
 
     # Validate fragments directory
-    fragments_dir: Path = args.fragments_dir
+    fragments_dir = spec.fragments_dir
     if not fragments_dir.is_dir():
-        print(f"Error: fragments directory not found: {fragments_dir}", file=sys.stderr)
-        return 1
+        result.error = f"fragments directory not found: {fragments_dir}"
+        return result
 
-    json_files = list(fragments_dir.glob("*.json"))
-    if not json_files:
-        print(
-            f"Error: no .json files found in {fragments_dir}",
-            file=sys.stderr,
-        )
-        return 1
+    cache = None
+    cache_path = fragments_dir.parent / FRAGMENT_CACHE_FILENAME
+    if use_cache:
+        if state is not None:
+            cache = state.fragment_cache(cache_path)
+        else:
+            cache = FragmentCache.load(cache_path)
+    elif wait is not None:
+        # Hands the fragments parsed while waiting to assembly; never saved
+        cache = FragmentCache(cache_path)
 
     # Assemble the report
+    previous_report = None
+    owns_previous = False
     try:
-        report = assemble_report(
+        if state is not None and spec.previous is not None:
+            previous_report = state.previous_report(spec.previous)
+        elif live_markdown and spec.previous is not None:
+            # Opened once for every partial report and the final one
+            previous_report = load_report_lazy(spec.previous)
+            owns_previous = True
+
+        if wait is not None:
+            pipeline = MarkerPipeline(fragments_dir, cache)
+            on_change = None
+            if live_markdown:
+                on_change = partial(
+                    _write_live_markdown, pipeline, spec, wait, previous_report
+                )
+            error = wait_for_fragments(pipeline, wait, wait_timeout, on_change)
+            if error is not None:
+                result.error = error
+                return result
+
+        json_files = list(fragments_dir.glob("*.json"))
+        bundle_path = fragments_dir / FRAGMENT_BUNDLE_FILENAME
+        if not json_files and not bundle_path.is_file():
+            result.error = (
+                f"no .json files or {FRAGMENT_BUNDLE_FILENAME} found in {fragments_dir}"
+            )
+            return result
+
+        assemble = assemble_report
+        options = {}
+        if stream:
+            from verification_schema import assemble_report_streaming
+
+            assemble = assemble_report_streaming
+            options["output"] = spec.output
+        report = assemble(
             fragments_dir=fragments_dir,
-            project_name=args.project_name,
-            spec_path=args.spec_path,
-            impl_path=args.impl_path,
-            previous_report_path=args.previous,
-            spec_version=args.spec_version,
+            project_name=spec.project_name,
+            spec_path=spec.spec_path,
+            impl_path=spec.impl_path,
+            previous_report_path=spec.previous,
+            spec_version=spec.spec_version,
+            jobs=jobs,
+            cache=cache,
+            previous_report=previous_report,
+            **options,
         )
-    except SchemaError as exc:
-        print(f"Error: {exc}", file=sys.stderr)
-        return 1
+    except (SchemaError, OSError) as exc:
+        result.error = str(exc)
+        return result
+    finally:
+        # Keep the fragments that did validate, even if others failed. Only
+        # warn if that fails: the cache is an optimisation, and an error
+        # raised here would replace the assembly's own
+        if use_cache:
+            try:
+                cache.save()
+            except OSError as exc:
+                print(
+                    f"Warning: could not save {cache.path.name}: {exc}",
+                    file=sys.stderr,
+                )
+            else:
+                if state is not None:
+                    state.cache_saved(cache)
+        if owns_previous:
+            previous_report.close()
+
+    # A streamed report is lazy: it holds the written file open until closed
+    try:
+        # Ensure output directory exists
+        output_path = spec.output
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write JSON report, unless assembly already streamed it out
+            if not stream:
+                with output_path.open("wb") as json_file:
+                    write_report_json(report, json_file)
+
+            # Write markdown report alongside the JSON
+            # All markdown and extra formats share one sorted, partitioned view
+            view = ReportView(report)
+            md_path = output_path.with_suffix(".md")
+            with md_path.open("w", encoding="utf-8") as md_file:
+                write_markdown(view, md_file)
+            if paginate:
+                from verification_schema import write_markdown_pages
+
+                write_markdown_pages(view, pages_dir(output_path), page_size)
+            if formats:
+                # Imported here: only --format needs the extra emitters
+                from verification_schema import write_report_formats
+
+                write_report_formats(view, output_path, formats)
+            if live_markdown:
+                live_markdown_path(output_path).unlink(missing_ok=True)
+        except OSError as exc:
+            result.error = f"cannot write report: {exc}"
+            return result
+
+        # Index the run; the report itself is already written, so only warn
+        if history:
+            import sqlite3
+
+            from verification_history import HISTORY_FILENAME, HistoryStore
+
+            try:
+                with HistoryStore.for_directory(output_path.parent) as store:
+                    store.record(report, output_path)
+            except (SchemaError, sqlite3.Error) as exc:
+                print(
+                    f"Warning: could not update {HISTORY_FILENAME}: {exc}",
+                    file=sys.stderr,
+                )
+
+        stats = report.statistics
+        result.findings = len(report.findings)
+        result.total_requirements = stats.total_requirements
+        result.implementation_rate = stats.implementation_rate
+        result.test_rate = stats.test_rate
+        return result
+    finally:
+        if stream:
+            report.close()
+
 
-    # Ensure output directory exists
-    output_path: Path = args.output
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+def _verify_spec_isolated(
+    spec: SpecJob,
+    jobs: int,
+    use_cache: bool,
+    history: bool,
+    paginate: bool = False,
+    page_size: int | None = None,
+    formats: tuple[str, ...] = (),
+    stream: bool = False,
+) -> SpecResult:
+    """Run ``verify_spec`` so that no failure escapes into the batch."""
+    try:
+        return verify_spec(
+            spec,
+            jobs,
+            use_cache,
+            history,
+            paginate=paginate,
+            page_size=page_size,
+            formats=formats,
+            stream=stream,
+        )
+    except Exception as exc:  # one bad spec must not stop the batch
+        return SpecResult(
+            project_name=spec.project_name,
+            output=spec.output,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+
+def run_batch(
+    specs: list[SpecJob],
+    parallel: int = 1,
+    jobs: int = 1,
+    use_cache: bool = False,
+    history: bool = True,
+    paginate: bool = False,
+    page_size: int | None = None,
+    formats: tuple[str, ...] = (),
+    stream: bool = False,
+) -> list[SpecResult]:
+    """Assemble every spec, up to ``parallel`` at once; results keep order."""
+    options = (jobs, use_cache, history, paginate, page_size, formats, stream)
+    workers = min(parallel or os.cpu_count() or 1, len(specs))
+    if workers <= 1:
+        return [_verify_spec_isolated(s, *options) for s in specs]
 
-    # Write JSON report
-    report_dict = report.to_dict()
-    output_path.write_text(
-        json.dumps(report_dict, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
+    from concurrent.futures import ProcessPoolExecutor  # only batch runs need it
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_verify_spec_isolated, s, *options) for s in specs]
+        results = []
+        for spec, future in zip(specs, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:  # e.g. a worker process died
+                results.append(
+                    SpecResult(
+                        project_name=spec.project_name,
+                        output=spec.output,
+                        error=f"{type(exc).__name__}: {exc}",
+                    )
+                )
+        return results
+
+
+def _print_batch(results: list[SpecResult]) -> None:
+    for r in results:
+        if r.error is None:
+            print(
+                f"[{r.project_name}] OK      {r.output}  {r.findings} findings, "
+                f"impl {r.implementation_rate:.1%}, test {r.test_rate:.1%}"
+            )
+        else:
+            # Multi-line errors (e.g. every invalid fragment) stay indented
+            print(f"[{r.project_name}] FAILED  " + r.error.replace("\n", "\n    "))
+
+    ok = [r for r in results if r.error is None]
+    print(
+        f"Batch: {len(results)} specs, {len(ok)} succeeded, "
+        f"{len(results) - len(ok)} failed; "
+        f"{sum(r.findings for r in ok)} findings in total"
     )
 
-    # Write markdown report alongside the JSON
-    md_path = output_path.with_suffix(".md")
-    md_content = render_markdown(report)
-    md_path.write_text(md_content, encoding="utf-8")
+
+def main(
+    argv: list[str] | None = None,
+    state: ResidentState | None = None,
+    cwd: Path | None = None,
+) -> int:
+    """Entry point for the CLI tool.
+
+    ``state`` is passed by verify_server.py to reuse objects between runs,
+    and ``cwd``, the client's directory, to resolve relative paths in
+    ``argv`` against. Returns exit code: 0 on success, 1 on error (in batch mode: if any
+    spec failed).
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive integer")
+    if args.parallel < 0:
+        parser.error("--parallel must be 0 or a positive integer")
+    if args.page_size is not None:
+        if args.page_size < 1:
+            parser.error("--page-size must be a positive integer")
+        if not args.paginate:
+            parser.error("--page-size requires --paginate")
+    if args.formats:
+        from verification_schema import REPORT_FORMATS
+
+        unknown = [name for name in args.formats if name not in REPORT_FORMATS]
+        if unknown:
+            parser.error(
+                f"argument --format: invalid choice: {unknown[0]!r} "
+                f"(choose from {', '.join(sorted(REPORT_FORMATS))})"
+            )
+    if args.wait is not None and args.wait < 1:
+        parser.error("--wait must be a positive integer")
+    if args.wait_timeout <= 0:
+        parser.error("--wait-timeout must be positive")
+    if args.live_markdown and args.wait is None:
+        parser.error("--live-markdown requires --wait")
+
+    missing = [
+        "--" + key.replace("_", "-") for key in _SPEC_OPTIONS if not getattr(args, key)
+    ]
+    if args.batch is not None:
+        single = args.previous is not None or args.wait is not None
+        if len(missing) < len(_SPEC_OPTIONS) or single:
+            parser.error("--batch cannot be combined with single-spec options")
+    elif missing:
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+    if cwd is not None:
+        for name in _PATH_OPTIONS:
+            value = getattr(args, name)
+            if value is not None:
+                setattr(args, name, cwd / value)
+
+    # Configure logging: capture warnings from verification_schema. The
+    # handler is removed afterwards so repeated in-process runs don't stack.
+    schema_logger = logging.getLogger("verification_schema")
+    handler = None
+    if args.verbose:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("WARNING: %(message)s"))
+        handler.setLevel(logging.WARNING)
+        schema_logger.addHandler(handler)
+        schema_logger.setLevel(logging.WARNING)
+    try:
+        return _run(args, state)
+    finally:
+        if handler is not None:
+            schema_logger.removeHandler(handler)
+
+
+def _run(args: argparse.Namespace, state: ResidentState | None) -> int:
+    if args.batch is not None:
+        try:
+            specs = load_manifest(args.batch)
+        except SchemaError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        results = run_batch(
+            specs,
+            parallel=args.parallel,
+            jobs=args.jobs,
+            use_cache=args.cache,
+            history=not args.no_history,
+            paginate=args.paginate,
+            page_size=args.page_size,
+            formats=tuple(args.formats),
+            stream=args.stream,
+        )
+        _print_batch(results)
+        return 0 if all(r.error is None for r in results) else 1
+
+    spec = SpecJob(
+        fragments_dir=args.fragments_dir,
+        spec_path=args.spec_path,
+        impl_path=args.impl_path,
+        project_name=args.project_name,
+        output=args.output,
+        previous=args.previous,
+        spec_version=args.spec_version,
+    )
+    result = verify_spec(
+        spec,
+        args.jobs,
+        args.cache,
+        not args.no_history,
+        state,
+        paginate=args.paginate,
+        page_size=args.page_size,
+        formats=tuple(args.formats),
+        stream=args.stream,
+        wait=args.wait,
+        wait_timeout=args.wait_timeout,
+        live_markdown=args.live_markdown,
+    )
+    if result.error is not None:
+        print(f"Error: {result.error}", file=sys.stderr)
+        return 1
 
     # Print summary to stdout
-    stats = report.statistics
-    print(f"Fragments: {len(report.findings)}")
-    print(f"Findings:  {stats.total_requirements}")
-    print(f"Implementation rate: {stats.implementation_rate:.1%}")
-    print(f"Test rate: {stats.test_rate:.1%}")
+    print(f"Fragments: {result.findings}")
+    print(f"Findings:  {result.total_requirements}")
+    print(f"Implementation rate: {result.implementation_rate:.1%}")
+    print(f"Test rate: {result.test_rate:.1%}")
 
     return 0
 
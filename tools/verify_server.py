@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Resident verify_report.py server reachable over a Unix socket.
+
+In the fix -> re-verify -> reassemble loop, interpreter start-up, imports
+and re-opening the previous report dominate each ``verify_report.py`` run.
+This server keeps ``verification_schema`` imported and keeps previous
+reports and fragment caches open between runs (see
+``verify_report.ResidentState``). ``verify_client.py`` starts it on demand;
+it exits by itself after ``--idle-timeout`` seconds without a request, or
+as soon as any tool source file changes, so a stale server never answers.
+
+  python verify_server.py                     # serve on the default socket
+  python verify_server.py --idle-timeout 60
+  python verify_server.py --stop              # ask a running server to exit
+
+Protocol: one JSON object per line. The client sends
+``{"argv": [...], "cwd": "..."}``; relative paths in ``argv`` are taken
+relative to ``cwd``. While the run goes on, the server sends each line of
+output as soon as it is written, as ``{"stdout": "..."}`` or
+``{"stderr": "..."}`` (so ``--wait`` progress shows up live), then ends
+with ``{"exit_code": N}``. Instead it may reply ``{"stale": true}`` if
+it is shutting down because its sources changed, ``{"busy": true}``
+while it is running another request (the client then runs locally rather
+than queue behind, e.g., a long ``--wait``), or ``{"error": "..."}`` for
+a malformed request. ``{"command": "stop"}`` stops the server.
+
+The socket's directory must belong to the current user and have mode
+0700; the server refuses to listen anywhere others could reach it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+# Allow importing verify_report from the same directory
+sys.path.insert(0, str(Path(__file__).parent))
+
+import verify_report  # noqa: E402
+
+DEFAULT_IDLE_TIMEOUT = 600
+
+# Seconds between checks for a stop request or the idle timeout
+_POLL_INTERVAL = 0.2
+
+
+def default_socket_path() -> Path:
+    """Return the per-user socket path shared by the client and server."""
+    override = os.environ.get("VERIFY_SERVER_SOCKET")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(base) / f"verify-report-{os.getuid()}" / "server.sock"
+
+
+def check_socket_dir(directory: Path) -> str | None:
+    """Return why ``directory`` is unsafe for the socket, or None if it is not.
+
+    Another user who owns or can write to the directory could replace the
+    socket and receive every request, so it must be a real directory owned
+    by the current user with mode 0700.
+    """
+    try:
+        st = directory.lstat()
+    except OSError as exc:
+        return f"cannot stat {directory}: {exc}"
+    if not stat.S_ISDIR(st.st_mode):
+        return f"{directory} is not a directory"
+    if st.st_uid != os.getuid():
+        return f"{directory} is owned by uid {st.st_uid}, not {os.getuid()}"
+    mode = stat.S_IMODE(st.st_mode)
+    if mode != 0o700:
+        return f"{directory} has mode {mode:04o}, expected 0700"
+    return None
+
+
+def _source_stamp() -> dict[str, int]:
+    """mtimes of the tool sources; a change means the server is outdated."""
+    tools = Path(__file__).resolve().parent
+    stamp = {}
+    for path in [*tools.glob("*.py"), *tools.glob("verification_schema/*.py")]:
+        try:
+            stamp[path.relative_to(tools).as_posix()] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            pass
+    return stamp
+
+
+class _LineWriter(io.TextIOBase):
+    """Text stream passing each complete line to ``send`` as ``{name: text}``."""
+
+    def __init__(self, name: str, send: Callable[[dict], None]) -> None:
+        self._name = name
+        self._send = send
+        self._pending = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._pending += text
+        end = self._pending.rfind("\n") + 1
+        if end:
+            self._send({self._name: self._pending[:end]})
+            self._pending = self._pending[end:]
+        return len(text)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._send({self._name: self._pending})
+            self._pending = ""
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: VerifyServer
+
+    def handle(self) -> None:
+        self._connected = True
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return
+        if isinstance(request, dict):
+            reply = self.server.dispatch(request, self._send)
+        else:
+            reply = {"error": "request must be a JSON object"}
+        self._send(reply)
+
+    def _send(self, message: dict) -> None:
+        if not self._connected:
+            return
+        try:
+            self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+        except OSError:
+            # The client went away; finish the run, dropping its output
+            self._connected = False
+
+
+class VerifyServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve verify_report.main() calls one at a time.
+
+    Each connection gets its own thread, so a request that arrives during
+    a run is answered ``busy`` at once instead of waiting for it.
+    """
+
+    def __init__(self, socket_path: Path, idle_timeout: float) -> None:
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.state = verify_report.ResidentState()
+        self.stamp = _source_stamp()
+        self.last_request = time.monotonic()
+        self.stopping = False
+        # Held for the duration of a run: output capture and ``state`` are
+        # process-wide
+        self._run_lock = threading.Lock()
+        super().__init__(str(socket_path), _Handler)
+        os.chmod(socket_path, 0o600)
+
+    def dispatch(self, request: dict, send: Callable[[dict], None]) -> dict:
+        """Handle one request; return the final reply.
+
+        Output of a run is passed to ``send`` line by line meanwhile.
+        """
+        self.last_request = time.monotonic()
+        if request.get("command") == "stop":
+            self.stopping = True
+            return {"stopped": True}
+        if _source_stamp() != self.stamp:
+            self.stopping = True
+            return {"stale": True}
+        argv = request.get("argv", [])
+        cwd = request.get("cwd")
+        if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+            return {"error": "argv must be a list of strings"}
+        if cwd is not None and not isinstance(cwd, str):
+            return {"error": "cwd must be a string"}
+        if not self._run_lock.acquire(blocking=False):
+            return {"busy": True}
+        try:
+            return self.run_verify(argv, cwd, send)
+        finally:
+            self.last_request = time.monotonic()
+            self._run_lock.release()
+
+    def run_verify(
+        self, argv: list[str], cwd: str | None, send: Callable[[dict], None]
+    ) -> dict:
+        """Run verify_report.main() for a client in ``cwd``.
+
+        Output lines are passed to ``send`` as they are written. The
+        server's own working directory is left alone: relative paths in
+        ``argv`` are resolved against ``cwd`` instead.
+        """
+        out, err = _LineWriter("stdout", send), _LineWriter("stderr", send)
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                code = verify_report.main(
+                    argv, state=self.state, cwd=Path(cwd) if cwd else None
+                )
+            except SystemExit as exc:  # argparse errors and --help
+                code = exc.code if isinstance(exc.code, int) else 1
+            except Exception as exc:
+                print(f"Error: {type(exc).__name__}: {exc}", file=sys.stderr)
+                code = 1
+        out.flush()
+        err.flush()
+        return {"exit_code": code}
+
+    def serve_until_idle(self) -> None:
+        """Handle requests until idle for ``idle_timeout`` or told to stop."""
+        # Requests are handled in threads, so a stop is only seen on the
+        # next wake-up; keep those frequent
+        self.timeout = min(self.idle_timeout, _POLL_INTERVAL)
+        try:
+            while not self.stopping:
+                self.handle_request()
+                idle = time.monotonic() - self.last_request
+                if idle >= self.idle_timeout and not self._run_lock.locked():
+                    break
+        finally:
+            # Waits for the handler threads, so no run is using the state
+            self.server_close()
+            self.state.close()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+
+
+def _is_alive(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def stop_server(socket_path: Path) -> bool:
+    """Ask the server on ``socket_path`` to exit; return False if none."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(b'{"command": "stop"}\n')
+            sock.makefile("rb").readline()
+    except OSError:
+        return False
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the server.
+
+    Returns exit code: 0 on clean shutdown (or if a server is already
+    running), 1 on error.
+    """
+    parser = argparse.ArgumentParser(
+        description="Resident verify_report.py server on a Unix socket",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help=(
+            "Socket path, in a directory owned by you with mode 0700 "
+            "(default: $VERIFY_SERVER_SOCKET or a per-user path)"
+        ),
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=f"Exit after this many idle seconds (default: {DEFAULT_IDLE_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--stop", action="store_true", help="Stop the running server and exit"
+    )
+    args = parser.parse_args(argv)
+    socket_path: Path = args.socket or default_socket_path()
+
+    if args.stop:
+        if not stop_server(socket_path):
+            print(f"No server listening on {socket_path}", file=sys.stderr)
+            return 1
+        return 0
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    problem = check_socket_dir(socket_path.parent)
+    if problem is not None:
+        print(f"Error: refusing to listen on {socket_path}: {problem}", file=sys.stderr)
+        return 1
+    if _is_alive(socket_path):
+        return 0  # another server won the race to start
+    with contextlib.suppress(FileNotFoundError):
+        socket_path.unlink()  # left behind by a server that died
+
+    try:
+        server = VerifyServer(socket_path, args.idle_timeout)
+    except OSError as exc:
+        print(f"Error: cannot listen on {socket_path}: {exc}", file=sys.stderr)
+        return 1
+    server.serve_until_idle()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
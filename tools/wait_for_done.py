@@ -6,7 +6,7 @@ Replaces the manual sleep/ls polling loop that wastes Claude's context
 window on repeated tool calls. Run this once — it blocks until all
 markers are present (or times out), then exits.
 
-Two modes:
+Three modes:
 
   # Wait for N .done files in a directory
   python wait_for_done.py --dir specs/foo/sections/ --count 3
@@ -15,38 +15,388 @@ Two modes:
   python wait_for_done.py --files specs/foo/story/story-narrative.done \
                                   specs/foo/story/story-slides.done
 
+  # Wait for N distinct fragment records in an NDJSON bundle
+  python wait_for_done.py --bundle .impl-verification/foo/fragments/fragments.ndjson \
+                          --count 120
+
 Options:
   --timeout SECONDS   Maximum wait time (default: 600 = 10 minutes)
   --interval SECONDS  Poll interval (default: 2)
+  --backend NAME      auto (default), inotify or poll
+  --json-events       Print JSON event lines instead of text
+  --manifest FILE     With --dir or --bundle: wait for these fragment_ids
+  --since TIMESTAMP   With --manifest --dir: ignore markers older than this
+
+--manifest takes a JSON list of expected fragment_ids, each optionally
+with a deadline in seconds, instead of --count:
+
+  ["01-01", "01-02", {"fragment_id": "02-01-01", "deadline": 300}]
+
+Markers are matched by id, so an extra marker cannot stand in for a
+missing one. With --since (Unix time, e.g. taken just before dispatch),
+older markers are stale leftovers and do not count. On exit a JSON line
+lists the missing, overdue, stale and unexpected ids, e.g. to re-dispatch
+just those agents.
+
+Progress lines every 30 seconds show the arrival rate and an ETA. Once
+half the markers are in, markers still missing at twice the median agent
+duration are reported once as stragglers, so their agents can be
+re-dispatched without sitting out the full timeout.
+
+Several waves can be waited on in one process with --targets FILE, a
+JSON list of targets, each with its own timeout:
+
+  [{"name": "verify-billing", "dir": ".impl-verification/billing/fragments",
+    "count": 40, "timeout": 900},
+   {"name": "impl-billing", "files": [".impl-work/billing/summary.done"]},
+   {"name": "verify-auth", "bundle": "auth/fragments/fragments.ndjson",
+    "count": 120}]
+
+A JSON event is printed on stdout, one per line, as each target completes
+or times out, so the next step for a finished wave can start at once. A
+"polling" event names targets whose directories could not be watched.
+
+On Linux the watched directories are monitored with inotify, so a marker
+is noticed within milliseconds and the tool sleeps in the kernel between
+events; elsewhere, or if inotify is unavailable, the directories are
+polled every --interval seconds.
 
 Exit codes:
-  0  All markers found
-  1  Timeout reached before all markers appeared
+  0  All markers found (with --targets: every target completed)
+  1  Timeout reached before all markers appeared, or invalid --targets
 """
 
 import argparse
+import ctypes
+import ctypes.util
+import errno
 import glob
+import json
+import os
+import select
+import statistics
 import sys
 import time
+from functools import partial
 from pathlib import Path
+from typing import Callable, Iterable
+
+# asyncio is imported by the --targets code only: it costs more than the
+# rest of the tool's start-up together
+
+# Seconds between "Waiting..." progress lines
+PROGRESS_INTERVAL = 30
+
+
+# ---------------------------------------------------------------------------
+# Watchers: block until something may have changed
+# ---------------------------------------------------------------------------
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+# A marker appears: created in place or renamed into the directory
+MARKER_EVENTS = _IN_CREATE | _IN_MOVED_TO
+# A file grows: records appended to a bundle
+APPEND_EVENTS = MARKER_EVENTS | _IN_MODIFY | _IN_CLOSE_WRITE
+
+BACKENDS = ("auto", "inotify", "poll")
+
+
+class PollWatcher:
+    """Wakes up every ``interval`` seconds; works on any filesystem."""
+
+    name = "poll"
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+    def wait(self, limit: float) -> None:
+        """Sleep for ``interval`` seconds, or ``limit`` if that is sooner."""
+        time.sleep(max(0.0, min(self.interval, limit)))
+
+    def close(self) -> None:
+        pass
+
+
+def _libc():
+    """Return libc with the inotify functions, or raise OSError."""
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError(errno.ENOSYS, "libc has no inotify support")
+    return libc
+
+
+class InotifyWatcher:
+    """Wakes up when an inotify event arrives for any watched directory.
+
+    Events are only used as wake-ups: callers re-check the filesystem
+    after every ``wait``, so coalesced or overflowed events lose nothing.
+    Raises OSError if inotify is unavailable or a directory cannot be
+    watched (e.g. it does not exist).
+    """
+
+    name = "inotify"
+
+    def __init__(self, directories: list[Path], mask: int) -> None:
+        libc = _libc()
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        try:
+            for directory in directories:
+                if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+                    err = ctypes.get_errno()
+                    raise OSError(err, os.strerror(err), str(directory))
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def wait(self, limit: float) -> None:
+        """Block until an event arrives or ``limit`` seconds pass."""
+        ready, _, _ = select.select([self.fd], [], [], max(0.0, limit))
+        if ready:
+            self.drain()
+
+    def drain(self) -> None:
+        """Discard every queued event; one re-check covers them all."""
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def open_watcher(
+    backend: str,
+    directories: list[Path],
+    mask: int,
+    interval: float,
+    on_fallback: Callable[[OSError], None] | None = None,
+) -> "PollWatcher | InotifyWatcher":
+    """Return a watcher for ``directories`` using ``backend``.
+
+    ``auto`` uses inotify where it works and falls back to polling every
+    ``interval`` seconds, passing the error to ``on_fallback`` if given;
+    ``inotify`` raises OSError instead of falling back.
+    """
+    if backend == "poll":
+        return PollWatcher(interval)
+    try:
+        return InotifyWatcher(directories, mask)
+    except OSError as exc:
+        if backend == "inotify":
+            raise
+        if on_fallback is not None:
+            on_fallback(exc)
+        return PollWatcher(interval)
+
+
+def next_wake(start: float, last_report: float, timeout: float) -> float:
+    """Seconds until the timeout or the next progress line, whichever is first."""
+    now = time.monotonic()
+    return min(start + timeout - now, last_report + PROGRESS_INTERVAL - now)
+
+
+# ---------------------------------------------------------------------------
+# Progress: throughput, ETA and stragglers
+# ---------------------------------------------------------------------------
+
+# Markers still missing this many times the median agent duration after
+# the wait started are stragglers
+STRAGGLER_FACTOR = 2.0
+# Arrivals needed before the median agent duration is trusted
+STRAGGLER_MIN_ARRIVALS = 3
+
+
+def _fmt_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds // 60 % 60:02d}m"
+
+
+class ArrivalTracker:
+    """Records when each marker is first seen, for rate, ETA and stragglers.
+
+    Agents are dispatched just before the wait starts, so the time from
+    the start of the wait to a marker's arrival stands in for that
+    agent's duration. Markers already present at the first scan count as
+    found, but not as arrivals.
+    """
+
+    def __init__(self, expected: int, start: float) -> None:
+        self.expected = expected
+        self.start = start
+        self.found = 0
+        self.arrivals: dict[str, float] = {}
+        self.stragglers_reported = False
+        self._initial: set[str] | None = None
+
+    def update(self, present: Iterable[str], now: float) -> None:
+        """Record the markers (or record ids) present at time ``now``."""
+        present = set(present)
+        self.found = len(present)
+        if self._initial is None:
+            self._initial = present
+            return
+        for key in present - self._initial:
+            self.arrivals.setdefault(key, now - self.start)
 
+    def median(self) -> float | None:
+        """Median agent duration, once enough markers have arrived.
 
-def wait_for_count(directory: Path, count: int, timeout: float, interval: float) -> bool:
-    """Wait for `count` .done files to appear in `directory`."""
+        Needs half of the expected markers: then the median of those
+        that arrived bounds the median of all agents from below.
+        """
+        if len(self.arrivals) < STRAGGLER_MIN_ARRIVALS:
+            return None
+        if 2 * self.found < self.expected:
+            return None
+        return statistics.median(self.arrivals.values())
+
+    def stragglers(self, now: float) -> int:
+        """Number of missing markers overdue past the median duration."""
+        median = self.median()
+        if median is None or now - self.start <= STRAGGLER_FACTOR * median:
+            return 0
+        return max(0, self.expected - self.found)
+
+    def stats(self, now: float) -> dict:
+        """Progress fields shared by the JSON events."""
+        elapsed = now - self.start
+        rate = len(self.arrivals) / elapsed if self.arrivals and elapsed > 0 else 0.0
+        remaining = max(0, self.expected - self.found)
+        median = self.median()
+        return {
+            "found": self.found,
+            "expected": self.expected,
+            "elapsed": round(elapsed, 3),
+            "rate_per_min": round(rate * 60, 2) if rate else None,
+            "eta_seconds": round(remaining / rate) if rate else None,
+            "median_seconds": round(median, 3) if median is not None else None,
+            "stragglers": self.stragglers(now),
+        }
+
+    def describe(self, now: float) -> str:
+        """Elapsed time, rate and ETA for the human-readable progress line."""
+        stats = self.stats(now)
+        parts = [f"{int(stats['elapsed'])}s elapsed"]
+        if stats["rate_per_min"] is not None:
+            parts.append(f"{stats['rate_per_min']:.1f}/min")
+            parts.append(f"ETA {_fmt_duration(stats['eta_seconds'])}")
+        return ", ".join(parts)
+
+
+def emit_event(event: str, **fields) -> None:
+    """Print one JSON event line, flushed so a reading process sees it now."""
+    print(json.dumps({"event": event, **fields}), flush=True)
+
+
+def _report_progress(
+    tracker: ArrivalTracker, now: float, unit: str, events: bool, **fields
+) -> None:
+    if events:
+        emit_event("progress", **fields, **tracker.stats(now))
+    else:
+        print(
+            f"Waiting... {tracker.found}/{tracker.expected} {unit} "
+            f"({tracker.describe(now)})"
+        )
+
+
+def report_stragglers(
+    tracker: ArrivalTracker,
+    now: float,
+    events: bool,
+    missing: list[str] | None = None,
+    **fields,
+) -> None:
+    """Report stragglers once, as soon as the first of them is overdue."""
+    overdue = tracker.stragglers(now)
+    if not overdue or tracker.stragglers_reported:
+        return
+    tracker.stragglers_reported = True
+    if events:
+        if missing is not None:
+            fields["missing"] = missing
+        emit_event("stragglers", **fields, **tracker.stats(now))
+        return
+    print(
+        f"Stragglers: {overdue} still missing after "
+        f"{_fmt_duration(now - tracker.start)}, over {STRAGGLER_FACTOR:g}x the "
+        f"median agent duration ({_fmt_duration(tracker.median())}); "
+        f"consider re-dispatching them"
+    )
+    for name in missing or ():
+        print(f"  {name}")
+
+
+# ---------------------------------------------------------------------------
+# Waiting
+# ---------------------------------------------------------------------------
+
+
+def wait_for_count(
+    directory: Path,
+    count: int,
+    timeout: float,
+    interval: float,
+    backend: str = "auto",
+    events: bool = False,
+) -> bool:
+    """Wait for `count` .done files to appear in `directory`.
+
+    With ``events``, progress is printed as JSON event lines (see
+    ``emit_event``) instead of text.
+    """
+    # Watch before the first scan, so no marker slips in between
+    watcher = open_watcher(backend, [directory], MARKER_EVENTS, interval)
+    try:
+        return _wait_for_count(directory, count, timeout, watcher, events)
+    finally:
+        watcher.close()
+
+
+def _wait_for_count(
+    directory: Path, count: int, timeout: float, watcher, events: bool = False
+) -> bool:
     pattern = str(directory / "*.done")
     start = time.monotonic()
     last_report = start
+    tracker = ArrivalTracker(count, start)
 
     while True:
         found = sorted(glob.glob(pattern))
+        now = time.monotonic()
+        tracker.update(found, now)
         if len(found) >= count:
+            if events:
+                emit_event("complete", **tracker.stats(now))
+                return True
             print(f"All {count} .done markers found in {directory}/")
             for f in found:
                 print(f"  {f}")
             return True
 
-        elapsed = time.monotonic() - start
+        elapsed = now - start
         if elapsed >= timeout:
+            if events:
+                emit_event("timeout", **tracker.stats(now))
+                return False
             print(
                 f"Timeout after {int(elapsed)}s — found {len(found)}/{count} .done markers",
                 file=sys.stderr,
@@ -55,30 +405,59 @@ def wait_for_count(directory: Path, count: int, timeout: float, interval: float)
                 print(f"  {f}", file=sys.stderr)
             return False
 
+        report_stragglers(tracker, now, events)
         # Progress update every 30 seconds
-        if time.monotonic() - last_report >= 30:
-            print(f"Waiting... {len(found)}/{count} .done markers ({int(elapsed)}s elapsed)")
-            last_report = time.monotonic()
+        if now - last_report >= PROGRESS_INTERVAL:
+            _report_progress(tracker, now, ".done markers", events)
+            last_report = now
 
-        time.sleep(interval)
+        watcher.wait(next_wake(start, last_report, timeout))
 
 
-def wait_for_files(files: list[str], timeout: float, interval: float) -> bool:
+def wait_for_files(
+    files: list[str],
+    timeout: float,
+    interval: float,
+    backend: str = "auto",
+    events: bool = False,
+) -> bool:
     """Wait for all specified files to exist."""
     paths = [Path(f) for f in files]
+    directories = list(dict.fromkeys(p.parent for p in paths))
+    watcher = open_watcher(backend, directories, MARKER_EVENTS, interval)
+    try:
+        return _wait_for_files(paths, timeout, watcher, events)
+    finally:
+        watcher.close()
+
+
+def _wait_for_files(
+    paths: list[Path], timeout: float, watcher, events: bool = False
+) -> bool:
     start = time.monotonic()
     last_report = start
+    tracker = ArrivalTracker(len(paths), start)
 
     while True:
         missing = [p for p in paths if not p.exists()]
+        now = time.monotonic()
+        tracker.update((str(p) for p in paths if p not in missing), now)
         if not missing:
+            if events:
+                emit_event("complete", **tracker.stats(now))
+                return True
             print(f"All {len(paths)} .done markers found:")
             for p in paths:
                 print(f"  {p}")
             return True
 
-        elapsed = time.monotonic() - start
+        elapsed = now - start
         if elapsed >= timeout:
+            if events:
+                emit_event(
+                    "timeout", **tracker.stats(now), missing=[str(p) for p in missing]
+                )
+                return False
             print(
                 f"Timeout after {int(elapsed)}s — still missing {len(missing)}/{len(paths)}:",
                 file=sys.stderr,
@@ -87,15 +466,533 @@ def wait_for_files(files: list[str], timeout: float, interval: float) -> bool:
                 print(f"  {p}", file=sys.stderr)
             return False
 
-        if time.monotonic() - last_report >= 30:
-            found = len(paths) - len(missing)
-            print(f"Waiting... {found}/{len(paths)} .done markers ({int(elapsed)}s elapsed)")
-            last_report = time.monotonic()
+        report_stragglers(tracker, now, events, [str(p) for p in missing])
+        if now - last_report >= PROGRESS_INTERVAL:
+            _report_progress(tracker, now, ".done markers", events)
+            last_report = now
+
+        watcher.wait(next_wake(start, last_report, timeout))
+
+
+def _read_bundle_ids(bundle: Path, offset: int, ids: set[str]) -> int:
+    """Add fragment_ids from complete lines past ``offset``; return new offset.
+
+    Only newline-terminated lines are consumed, so a record still being
+    appended is picked up on the next poll.
+    """
+    try:
+        with bundle.open("rb") as fh:
+            fh.seek(offset)
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                try:
+                    fid = json.loads(raw).get("fragment_id")
+                except (ValueError, AttributeError):
+                    continue  # malformed records are reported at assembly
+                if isinstance(fid, str):
+                    ids.add(fid)
+    except FileNotFoundError:
+        pass
+    return offset
+
+
+def wait_for_bundle(
+    bundle: Path,
+    count: int,
+    timeout: float,
+    interval: float,
+    backend: str = "auto",
+    events: bool = False,
+) -> bool:
+    """Wait for `count` distinct fragment records to appear in an NDJSON bundle."""
+    # The bundle may not exist yet, so watch its directory
+    watcher = open_watcher(backend, [bundle.parent], APPEND_EVENTS, interval)
+    try:
+        return _wait_for_bundle(bundle, count, timeout, watcher, events)
+    finally:
+        watcher.close()
+
+
+def _wait_for_bundle(
+    bundle: Path, count: int, timeout: float, watcher, events: bool = False
+) -> bool:
+    ids: set[str] = set()
+    offset = 0
+    start = time.monotonic()
+    last_report = start
+    tracker = ArrivalTracker(count, start)
+
+    while True:
+        offset = _read_bundle_ids(bundle, offset, ids)
+        now = time.monotonic()
+        tracker.update(ids, now)
+        if len(ids) >= count:
+            if events:
+                emit_event("complete", **tracker.stats(now))
+                return True
+            print(f"All {count} fragment records found in {bundle}")
+            return True
+
+        elapsed = now - start
+        if elapsed >= timeout:
+            if events:
+                emit_event("timeout", **tracker.stats(now))
+                return False
+            print(
+                f"Timeout after {int(elapsed)}s — found {len(ids)}/{count} "
+                f"fragment records",
+                file=sys.stderr,
+            )
+            return False
+
+        report_stragglers(tracker, now, events)
+        if now - last_report >= PROGRESS_INTERVAL:
+            _report_progress(tracker, now, "fragment records", events)
+            last_report = now
+
+        watcher.wait(next_wake(start, last_report, timeout))
+
+
+# ---------------------------------------------------------------------------
+# Expected fragment ids (--manifest)
+# ---------------------------------------------------------------------------
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
 
-        time.sleep(interval)
+def load_expected(path: Path) -> dict[str, float | None]:
+    """Read a --manifest of expected fragment_ids; ``-`` reads stdin.
 
+    Entries are ids (``"02-01-01"``) or objects with a ``fragment_id`` and
+    an optional ``deadline`` in seconds from the start of the wait.
+    Returns fragment_id -> deadline (None: only --timeout applies).
 
-def main() -> None:
+    Raises:
+        ValueError: Listing every problem, if the manifest is invalid.
+    """
+    try:
+        text = sys.stdin.read() if str(path) == "-" else path.read_text("utf-8")
+        entries = json.loads(text)
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"{path}: cannot read manifest: {exc}") from exc
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{path}: expected a non-empty JSON list of fragment_ids")
+
+    expected: dict[str, float | None] = {}
+    errors: list[str] = []
+    for n, entry in enumerate(entries, 1):
+        deadline = None
+        if isinstance(entry, dict):
+            unknown = sorted(set(entry) - {"fragment_id", "deadline"})
+            if unknown:
+                errors.append(f"entry {n}: unknown keys {', '.join(unknown)}")
+            deadline = entry.get("deadline")
+            if deadline is not None and (not _is_number(deadline) or deadline <= 0):
+                errors.append(f"entry {n}: deadline must be a positive number")
+            entry = entry.get("fragment_id")
+        if not isinstance(entry, str) or not entry:
+            errors.append(f"entry {n}: expected a fragment_id")
+        elif entry in expected:
+            errors.append(f"entry {n}: duplicate fragment_id {entry}")
+        else:
+            expected[entry] = float(deadline) if _is_number(deadline) else None
+    if errors:
+        raise ValueError(
+            f"{path}: invalid manifest:\n" + "\n".join(f"  - {e}" for e in errors)
+        )
+    return expected
+
+
+def _present_ids(
+    directory: Path | None, since: float | None, stale: set[str]
+) -> set[str]:
+    """Fragment ids with a .done marker in ``directory``.
+
+    Markers last modified before ``since`` are left over from an earlier
+    run: they are added to ``stale`` instead.
+    """
+    present = set()
+    for marker in directory.glob("*.done"):
+        try:
+            mtime = marker.stat().st_mtime
+        except FileNotFoundError:
+            continue
+        if since is not None and mtime < since:
+            stale.add(marker.stem)
+        else:
+            stale.discard(marker.stem)
+            present.add(marker.stem)
+    return present
+
+
+def wait_for_manifest(
+    expected: dict[str, float | None],
+    timeout: float,
+    interval: float,
+    backend: str = "auto",
+    events: bool = False,
+    directory: Path | None = None,
+    bundle: Path | None = None,
+    since: float | None = None,
+) -> bool:
+    """Wait until every expected fragment_id has a marker or bundle record.
+
+    Markers (``<fragment_id>.done`` in ``directory``) or records in
+    ``bundle`` are matched by id, so extra fragments cannot stand in for
+    missing ones. An id still missing past its deadline is reported as
+    overdue, and the wait ends early once every missing id is overdue.
+    With ``since`` (a timestamp), older markers are stale and ignored.
+    On exit, a JSON line lists the ``missing``, ``overdue``, ``stale``
+    and ``unexpected`` ids. Returns True if every id arrived.
+    """
+    if bundle is not None:
+        watcher = open_watcher(backend, [bundle.parent], APPEND_EVENTS, interval)
+    else:
+        watcher = open_watcher(backend, [directory], MARKER_EVENTS, interval)
+    try:
+        return _wait_for_manifest(
+            expected, timeout, watcher, events, directory, bundle, since
+        )
+    finally:
+        watcher.close()
+
+
+def _wait_for_manifest(
+    expected: dict[str, float | None],
+    timeout: float,
+    watcher,
+    events: bool,
+    directory: Path | None,
+    bundle: Path | None,
+    since: float | None,
+) -> bool:
+    ids: set[str] = set()
+    stale: set[str] = set()
+    offset = 0
+    overdue: set[str] = set()
+    start = time.monotonic()
+    last_report = start
+    tracker = ArrivalTracker(len(expected), start)
+
+    while True:
+        if bundle is not None:
+            offset = _read_bundle_ids(bundle, offset, ids)
+            present = ids
+        else:
+            present = _present_ids(directory, since, stale)
+        now = time.monotonic()
+        elapsed = now - start
+        tracker.update(present & expected.keys(), now)
+        missing = sorted(expected.keys() - present)
+
+        late = [
+            fid
+            for fid in missing
+            if fid not in overdue
+            and expected[fid] is not None
+            and elapsed >= expected[fid]
+        ]
+        if late:
+            overdue.update(late)
+            if events:
+                emit_event("overdue", ids=late, **tracker.stats(now))
+            else:
+                print(f"Overdue: {', '.join(late)}")
+
+        done = not missing
+        if done or elapsed >= timeout or overdue.issuperset(missing):
+            result = {
+                "missing": missing,
+                "overdue": sorted(overdue.intersection(missing)),
+                "stale": sorted(stale.intersection(missing)),
+                "unexpected": sorted(present - expected.keys()),
+            }
+            if events:
+                event = "complete" if done else "timeout"
+                emit_event(event, **tracker.stats(now), **result)
+                return done
+            if done:
+                print(f"All {len(expected)} expected fragment_ids found")
+            else:
+                print(
+                    f"Timeout after {int(elapsed)}s — missing "
+                    f"{len(missing)}/{len(expected)} expected fragment_ids",
+                    file=sys.stderr,
+                )
+            print(json.dumps(result))
+            return done
+
+        report_stragglers(tracker, now, events, missing)
+        if now - last_report >= PROGRESS_INTERVAL:
+            _report_progress(tracker, now, "expected fragment_ids", events)
+            last_report = now
+
+        # Also wake at the next per-item deadline
+        limit = next_wake(start, last_report, timeout)
+        deadlines = [
+            expected[fid]
+            for fid in missing
+            if expected[fid] is not None and fid not in overdue
+        ]
+        if deadlines:
+            limit = min(limit, start + min(deadlines) - time.monotonic())
+        watcher.wait(limit)
+
+
+# ---------------------------------------------------------------------------
+# Multiple targets (--targets)
+# ---------------------------------------------------------------------------
+
+TARGET_KEYS = ("name", "dir", "files", "bundle", "count", "timeout")
+
+
+class Target:
+    """One wave to wait for: a directory or bundle with a count, or files.
+
+    ``check`` re-reads the filesystem and returns the markers (or bundle
+    record ids) present; ``missing`` then lists absent files.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float,
+        directory: Path | None = None,
+        files: list[Path] | None = None,
+        bundle: Path | None = None,
+        count: int = 0,
+    ) -> None:
+        self.name = name
+        self.timeout = timeout
+        self.directory = directory
+        self.files = files
+        self.bundle = bundle
+        self.expected = len(files) if files is not None else count
+        self.missing: list[Path] = []
+        self._ids: set[str] = set()
+        self._offset = 0
+
+    @property
+    def directories(self) -> list[Path]:
+        if self.directory is not None:
+            return [self.directory]
+        if self.bundle is not None:
+            return [self.bundle.parent]
+        return list(dict.fromkeys(p.parent for p in self.files))
+
+    def check(self) -> set[str]:
+        if self.directory is not None:
+            return set(glob.glob(str(self.directory / "*.done")))
+        if self.bundle is not None:
+            self._offset = _read_bundle_ids(self.bundle, self._offset, self._ids)
+            return set(self._ids)
+        self.missing = [p for p in self.files if not p.exists()]
+        return {str(p) for p in self.files if p not in self.missing}
+
+
+def load_targets(path: Path, default_timeout: float) -> list[Target]:
+    """Read a --targets file; ``-`` reads standard input.
+
+    Raises:
+        ValueError: Listing every problem, if the file is not a valid
+            list of targets.
+    """
+    try:
+        text = sys.stdin.read() if str(path) == "-" else path.read_text("utf-8")
+        entries = json.loads(text)
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"{path}: cannot read targets: {exc}") from exc
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{path}: expected a non-empty JSON list of targets")
+
+    targets: list[Target] = []
+    errors: list[str] = []
+    names: set[str] = set()
+    for n, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict):
+            errors.append(f"target {n}: expected an object")
+            continue
+        problems = []
+        unknown = sorted(set(entry) - set(TARGET_KEYS))
+        if unknown:
+            problems.append(f"unknown keys {', '.join(unknown)}")
+        kinds = [k for k in ("dir", "files", "bundle") if k in entry]
+        count = entry.get("count")
+        timeout = entry.get("timeout", default_timeout)
+        if len(kinds) != 1:
+            problems.append("needs exactly one of dir, files, bundle")
+        elif kinds == ["files"]:
+            files = entry["files"]
+            if not isinstance(files, list) or not all(
+                isinstance(f, str) for f in files
+            ):
+                problems.append("files must be a list of paths")
+            if count is not None:
+                problems.append("count cannot be used with files")
+        elif not _is_number(count) or isinstance(count, float) or count < 0:
+            problems.append(f"{kinds[0]} needs a non-negative integer count")
+        elif kinds == ["dir"] and not Path(entry["dir"]).is_dir():
+            problems.append(f"not a directory: {entry['dir']}")
+        if not _is_number(timeout) or timeout <= 0:
+            problems.append("timeout must be a positive number")
+        name = str(entry.get("name", f"target-{n}"))
+        if name in names:
+            problems.append(f"duplicate name {name}")
+        names.add(name)
+
+        if problems:
+            errors += [f"target {n}: {p}" for p in problems]
+            continue
+        kind = kinds[0]
+        targets.append(
+            Target(
+                name,
+                float(timeout),
+                directory=Path(entry["dir"]) if kind == "dir" else None,
+                files=[Path(f) for f in entry["files"]] if kind == "files" else None,
+                bundle=Path(entry["bundle"]) if kind == "bundle" else None,
+                count=count or 0,
+            )
+        )
+    if errors:
+        raise ValueError(
+            f"{path}: invalid targets:\n" + "\n".join(f"  - {e}" for e in errors)
+        )
+    return targets
+
+
+class AsyncWatcher:
+    """Shares one watcher among the coroutines of the running event loop.
+
+    An inotify descriptor is registered with the loop, and each event
+    wakes every waiting coroutine; with polling, coroutines just sleep.
+    """
+
+    def __init__(self, watcher: "PollWatcher | InotifyWatcher") -> None:
+        import asyncio
+
+        self.watcher = watcher
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        if isinstance(watcher, InotifyWatcher):
+            self._loop.add_reader(watcher.fd, self._on_event)
+
+    def _on_event(self) -> None:
+        import asyncio
+
+        self.watcher.drain()
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait(self, limit: float) -> None:
+        """Return after the next change, or after ``limit`` seconds."""
+        import asyncio
+
+        if isinstance(self.watcher, PollWatcher):
+            await asyncio.sleep(max(0.0, min(self.watcher.interval, limit)))
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), max(0.0, limit))
+        except asyncio.TimeoutError:
+            pass
+
+    def close(self) -> None:
+        if isinstance(self.watcher, InotifyWatcher):
+            self._loop.remove_reader(self.watcher.fd)
+        self.watcher.close()
+
+
+async def _wait_target(target: Target, watcher: AsyncWatcher) -> bool:
+    start = time.monotonic()
+    last_report = start
+    tracker = ArrivalTracker(target.expected, start)
+
+    while True:
+        tracker.update(target.check(), time.monotonic())
+        now = time.monotonic()
+        missing = None
+        if target.files is not None:
+            missing = [str(p) for p in target.missing]
+        if tracker.found >= target.expected:
+            emit_event("complete", target=target.name, **tracker.stats(now))
+            return True
+        if now - start >= target.timeout:
+            extra = {"missing": missing} if missing is not None else {}
+            emit_event("timeout", target=target.name, **tracker.stats(now), **extra)
+            return False
+
+        report_stragglers(tracker, now, True, missing, target=target.name)
+        if now - last_report >= PROGRESS_INTERVAL:
+            _report_progress(tracker, now, "", True, target=target.name)
+            last_report = now
+
+        await watcher.wait(next_wake(start, last_report, target.timeout))
+
+
+def _report_polling(group: list[Target], exc: OSError) -> None:
+    emit_event(
+        "polling",
+        targets=[t.name for t in group],
+        directories=[str(d) for d in group[0].directories],
+        error=str(exc),
+    )
+
+
+async def _wait_targets(targets: list[Target], interval: float, backend: str) -> bool:
+    import asyncio
+
+    # One watcher per set of directories: one that cannot be watched (e.g.
+    # not created yet) only sends the targets in it to polling
+    groups: dict[tuple[Path, ...], list[Target]] = {}
+    for target in targets:
+        groups.setdefault(tuple(target.directories), []).append(target)
+    watchers: dict[tuple[Path, ...], AsyncWatcher] = {}
+    try:
+        # Watch before the first scans, so no marker slips in between
+        for directories, group in groups.items():
+            mask = MARKER_EVENTS
+            if any(t.bundle is not None for t in group):
+                mask = APPEND_EVENTS
+            on_fallback = partial(_report_polling, group)
+            watchers[directories] = AsyncWatcher(
+                open_watcher(backend, list(directories), mask, interval, on_fallback)
+            )
+        results = await asyncio.gather(
+            *(_wait_target(t, watchers[tuple(t.directories)]) for t in targets)
+        )
+    finally:
+        for watcher in watchers.values():
+            watcher.close()
+    emit_event(
+        "finished",
+        complete=[t.name for t, ok in zip(targets, results) if ok],
+        timed_out=[t.name for t, ok in zip(targets, results) if not ok],
+    )
+    return all(results)
+
+
+def wait_for_targets(
+    targets: list[Target], interval: float, backend: str = "auto"
+) -> bool:
+    """Wait for every target concurrently, each against its own timeout.
+
+    Emits a ``complete`` or ``timeout`` event for each target as soon as
+    it is decided, ``progress`` events every 30 seconds and a
+    ``stragglers`` event for targets still pending, and a closing
+    ``finished`` event. A ``polling`` event names the targets whose
+    directories could not be watched with ``auto`` and are polled
+    instead. Returns True if every target completed.
+    """
+    import asyncio
+
+    return asyncio.run(_wait_targets(targets, interval, backend))
+
+
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         description="Block until .done marker files appear on disk"
     )
@@ -110,16 +1007,53 @@ def main() -> None:
         nargs="+",
         help="Specific .done file paths to wait for",
     )
+    group.add_argument(
+        "--bundle",
+        type=Path,
+        help="NDJSON fragment bundle to watch (use with --count)",
+    )
+    group.add_argument(
+        "--targets",
+        type=Path,
+        help=(
+            "JSON file ('-' for stdin) listing several targets to wait for at "
+            "once; prints a JSON event line as each one completes or times out"
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help=(
+            "JSON list of expected fragment_ids ('-' for stdin), optionally "
+            "with per-item deadlines; with --dir or --bundle instead of --count"
+        ),
+    )
+    parser.add_argument(
+        "--since",
+        type=float,
+        metavar="TIMESTAMP",
+        help=(
+            "With --manifest and --dir, treat .done markers last modified "
+            "before this Unix time as stale and do not count them (e.g. "
+            "$(date +%%s) taken before dispatching the agents)"
+        ),
+    )
     parser.add_argument(
         "--count",
         type=int,
-        help="Number of .done files expected (required with --dir)",
+        help=(
+            "Number of .done files or bundle records expected "
+            "(required with --dir and --bundle)"
+        ),
     )
     parser.add_argument(
         "--timeout",
         type=float,
         default=600,
-        help="Maximum wait time in seconds (default: 600)",
+        help=(
+            "Maximum wait time in seconds (default: 600; with --targets, for "
+            "targets without their own timeout)"
+        ),
     )
     parser.add_argument(
         "--interval",
@@ -127,17 +1061,95 @@ def main() -> None:
         default=2,
         help="Poll interval in seconds (default: 2)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help=(
+            "How to detect new markers: inotify (Linux), poll every --interval "
+            "seconds, or auto (inotify where available, else poll; default)"
+        ),
+    )
+    parser.add_argument(
+        "--json-events",
+        action="store_true",
+        help=(
+            "Print progress, stragglers and the outcome as JSON event lines "
+            "on stdout (always on with --targets)"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    if args.manifest is not None:
+        if args.dir is None and args.bundle is None:
+            parser.error("--manifest requires --dir or --bundle")
+        if args.count is not None:
+            parser.error("--count cannot be used with --manifest")
+        try:
+            expected = load_expected(args.manifest)
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            sys.exit(1)
+    if args.since is not None and (args.manifest is None or args.dir is None):
+        parser.error("--since requires --manifest and --dir")
 
     if args.dir is not None:
-        if args.count is None:
+        if args.count is None and args.manifest is None:
             parser.error("--count is required when using --dir")
         if not args.dir.is_dir():
             print(f"Error: not a directory: {args.dir}", file=sys.stderr)
             sys.exit(1)
-        success = wait_for_count(args.dir, args.count, args.timeout, args.interval)
-    else:
-        success = wait_for_files(args.files, args.timeout, args.interval)
+    elif args.bundle is not None:
+        if args.count is None and args.manifest is None:
+            parser.error("--count is required when using --bundle")
+    elif args.targets is not None:
+        if args.count is not None:
+            parser.error("--count cannot be used with --targets")
+        try:
+            targets = load_targets(args.targets, args.timeout)
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        if args.targets is not None:
+            success = wait_for_targets(targets, args.interval, args.backend)
+        elif args.manifest is not None:
+            success = wait_for_manifest(
+                expected,
+                args.timeout,
+                args.interval,
+                args.backend,
+                args.json_events,
+                directory=args.dir,
+                bundle=args.bundle,
+                since=args.since,
+            )
+        elif args.dir is not None:
+            success = wait_for_count(
+                args.dir,
+                args.count,
+                args.timeout,
+                args.interval,
+                args.backend,
+                args.json_events,
+            )
+        elif args.bundle is not None:
+            success = wait_for_bundle(
+                args.bundle,
+                args.count,
+                args.timeout,
+                args.interval,
+                args.backend,
+                args.json_events,
+            )
+        else:
+            success = wait_for_files(
+                args.files, args.timeout, args.interval, args.backend, args.json_events
+            )
+    except OSError as exc:  # only with --backend inotify
+        print(f"Error: cannot watch with inotify: {exc}", file=sys.stderr)
+        sys.exit(1)
 
     sys.exit(0 if success else 1)
 